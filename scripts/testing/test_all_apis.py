@@ -3,9 +3,9 @@
 Comprehensive API test suite for VibeX server
 Tests all main endpoints and provides a summary of what works and what doesn't
 """
-import requests
+import asyncio
+import httpx
 import json
-import time
 import os
 
 # --- Configuration ---
@@ -14,118 +14,141 @@ USER_ID = "test-user-full-suite"
 HEADERS = {"X-User-ID": USER_ID, "Content-Type": "application/json"}
 CONFIG_PATH = "examples/simple_team/config/team.yaml"
 
-def run_test(name, func, *args, **kwargs):
-    """Helper to run a test function and print results."""
-    print(f"\n--- Starting Test: {name} ---")
+async def run_test(name, func, *args, **kwargs):
+    """Helper to run a test coroutine and print results."""
     try:
-        result = func(*args, **kwargs)
-        if result is not None:
-            print(f"Result for {name}:")
-            # Limit printing large content
-            if isinstance(result, dict) and "content" in result and len(result["content"] or "") > 200:
-                result["content"] = result["content"][:200] + "..."
-            print(json.dumps(result, indent=2))
-        print(f"--- PASSED: {name} ---")
-        return result
+        result = await func(*args, **kwargs)
     except Exception as e:
-        print(f"--- FAILED: {name} ---")
+        print(f"\n--- FAILED: {name} ---")
         print(f"Error: {e}")
         # Optionally, re-raise to stop all tests on failure
         # raise e
         return None
 
+    # Print once the test is done so concurrent tests don't interleave output
+    print(f"\n--- PASSED: {name} ---")
+    if result is not None:
+        print(f"Result for {name}:")
+        # Limit printing large content
+        if isinstance(result, dict) and "content" in result and len(result["content"] or "") > 200:
+            result["content"] = result["content"][:200] + "..."
+        print(json.dumps(result, indent=2))
+    return result
+
 # --- API Test Functions ---
 
-def test_health_check():
-    response = requests.get(f"{BASE_URL}/health", timeout=5)
+async def test_health_check(client):
+    response = await client.get("/health", timeout=5)
     response.raise_for_status()
     return response.json()
 
-def test_create_project():
+async def test_create_project(client):
     payload = {"goal": "Test project for full API suite", "config_path": CONFIG_PATH}
-    response = requests.post(f"{BASE_URL}/projects", headers=HEADERS, json=payload, timeout=10)
+    response = await client.post("/projects", json=payload, timeout=10)
     response.raise_for_status()
     project_data = response.json()
     if "project_id" not in project_data:
         raise ValueError("project_id not in response")
     return project_data
 
-def test_list_projects():
-    response = requests.get(f"{BASE_URL}/projects", headers=HEADERS, timeout=5)
+async def test_list_projects(client):
+    response = await client.get("/projects", timeout=5)
     response.raise_for_status()
     return response.json()
 
-def test_get_project(project_id):
-    response = requests.get(f"{BASE_URL}/projects/{project_id}", headers=HEADERS, timeout=5)
+async def test_get_project(client, project_id):
+    response = await client.get(f"/projects/{project_id}", timeout=5)
     response.raise_for_status()
     return response.json()
 
-def test_send_chat_message(project_id):
+async def test_send_chat_message(client, project_id):
     payload = {"content": "Hello, X agent! Please proceed with the plan."}
-    response = requests.post(f"{BASE_URL}/projects/{project_id}/chat", headers=HEADERS, json=payload, timeout=15)
+    response = await client.post(f"/projects/{project_id}/chat", json=payload, timeout=15)
     response.raise_for_status()
     return response.json()
 
-def test_get_messages(project_id):
-    response = requests.get(f"{BASE_URL}/projects/{project_id}/messages", headers=HEADERS, timeout=5)
+async def test_get_messages(client, project_id):
+    response = await client.get(f"/projects/{project_id}/messages", timeout=5)
     response.raise_for_status()
     return response.json()
 
-def test_get_artifacts(project_id):
+async def test_get_artifacts(client, project_id):
     # This might be empty initially
-    response = requests.get(f"{BASE_URL}/projects/{project_id}/artifacts", headers=HEADERS, timeout=5)
+    response = await client.get(f"/projects/{project_id}/artifacts", timeout=5)
     response.raise_for_status()
     return response.json()
 
-def test_get_plan(project_id):
-    response = requests.get(f"{BASE_URL}/projects/{project_id}/plan", headers=HEADERS, timeout=5)
+async def test_get_plan(client, project_id):
+    response = await client.get(f"/projects/{project_id}/plan", timeout=5)
     response.raise_for_status()
     return response.json()
-    
-def test_get_logs(project_id):
-    response = requests.get(f"{BASE_URL}/projects/{project_id}/logs?limit=50", headers=HEADERS, timeout=5)
+
+async def test_get_logs(client, project_id):
+    response = await client.get(f"/projects/{project_id}/logs", params={"limit": 50}, timeout=5)
     response.raise_for_status()
     return response.json()
 
-def test_delete_project(project_id):
-    response = requests.delete(f"{BASE_URL}/projects/{project_id}", headers=HEADERS, timeout=10)
+async def wait_for_project(client, project_id, timeout=5.0):
+    """Poll project status with exponential back-off until it settles or timeout passes."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    backoff = 0.1
+    while loop.time() < deadline:
+        try:
+            response = await client.get(f"/projects/{project_id}", timeout=5)
+            if response.is_success and response.json().get("status") in ("completed", "failed", "error"):
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(min(backoff, max(deadline - loop.time(), 0)))
+        backoff = min(backoff * 1.7, 2.0)
+
+async def test_delete_project(client, project_id):
+    response = await client.delete(f"/projects/{project_id}", timeout=10)
     response.raise_for_status()
     return response.json()
 
-def main():
+async def main():
     """Main function to orchestrate tests."""
     print("===== Running Full API Test Suite =====")
-    
-    run_test("Health Check", test_health_check)
-    
-    project_info = run_test("Create Project", test_create_project)
-    if not project_info:
-        print("Halting tests: Project creation failed.")
-        return
-        
-    project_id = project_info.get("project_id")
-    
-    # Wait a bit for async background tasks to start
-    time.sleep(2)
-    
-    # Run tests that depend on a created project
-    run_test("List Projects", test_list_projects)
-    run_test("Get Project Details", test_get_project, project_id)
-    run_test("Send Chat Message", test_send_chat_message, project_id)
-    
-    # Wait for the chat message to be processed
-    print("\nWaiting for project to process the message...")
-    time.sleep(5)
-    
-    run_test("Get Messages", test_get_messages, project_id)
-    run_test("Get Artifacts", test_get_artifacts, project_id)
-    run_test("Get Plan", test_get_plan, project_id)
-    run_test("Get Logs", test_get_logs, project_id)
-    
-    # Clean up
-    run_test("Delete Project", test_delete_project, project_id)
-    
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, headers=HEADERS, limits=httpx.Limits(max_connections=16)
+    ) as client:
+        await run_test("Health Check", test_health_check, client)
+
+        project_info = await run_test("Create Project", test_create_project, client)
+        if not project_info:
+            print("Halting tests: Project creation failed.")
+            return
+
+        project_id = project_info.get("project_id")
+
+        # Wait a bit for async background tasks to start
+        await asyncio.sleep(2)
+
+        # Independent read-only checks run concurrently
+        await asyncio.gather(
+            run_test("List Projects", test_list_projects, client),
+            run_test("Get Project Details", test_get_project, client, project_id),
+        )
+        await run_test("Send Chat Message", test_send_chat_message, client, project_id)
+
+        # Wait for the chat message to be processed
+        print("\nWaiting for project to process the message...")
+        await wait_for_project(client, project_id)
+
+        await asyncio.gather(
+            run_test("Get Messages", test_get_messages, client, project_id),
+            run_test("Get Artifacts", test_get_artifacts, client, project_id),
+            run_test("Get Plan", test_get_plan, client, project_id),
+            run_test("Get Logs", test_get_logs, client, project_id),
+        )
+
+        # Clean up
+        await run_test("Delete Project", test_delete_project, client, project_id)
+
     print("\n===== Full API Test Suite Finished =====")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
@@ -5,16 +5,31 @@ This __init__.py file is special. It contains the function that
 registers all the builtin tools with the core ToolRegistry.
 """
 
-from .context import ContextTool
-from .file import FileTool
-from .memory import MemoryTool
-from .search import SearchTool
-from .web import WebTool
-from .document import DocumentTool
-from .research import ResearchTool
+import importlib
 from typing import Optional, Any
 from vibex.tool.registry import ToolRegistry
-from ..storage.factory import ProjectStorageFactory
+
+# Tool classes are imported on first use: some pull in heavy clients (e.g. firecrawl)
+# that processes only listing or configuring tools never need.
+_TOOL_MODULES = {
+    "ContextTool": ".context",
+    "FileTool": ".file",
+    "MemoryTool": ".memory",
+    "SearchTool": ".search",
+    "WebTool": ".web",
+    "DocumentTool": ".document",
+    "ResearchTool": ".research",
+}
+
+
+def __getattr__(name: str):
+    module = _TOOL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool_class = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = tool_class
+    return tool_class
+
 
 def register_builtin_tools(registry: ToolRegistry, project_storage: Optional[Any] = None, memory_system: Optional[Any] = None):
     """Register all built-in tools with the tool registry.
@@ -27,6 +42,13 @@ def register_builtin_tools(registry: ToolRegistry, project_storage: Optional[Any
     
     # Register tools with project storage support
     if project_storage:
+        from .context import ContextTool
+        from .file import FileTool
+        from .search import SearchTool
+        from .web import WebTool
+        from .document import DocumentTool
+        from .research import ResearchTool
+        
         file_tool = FileTool(project_storage)
         registry.register_tool(file_tool)
         
@@ -46,6 +68,7 @@ def register_builtin_tools(registry: ToolRegistry, project_storage: Optional[Any
         registry.register_tool(research_tool)
         
         if memory_system:
+            from .memory import MemoryTool
             memory_tool = MemoryTool(memory_system=memory_system)
             registry.register_tool(memory_tool)
 
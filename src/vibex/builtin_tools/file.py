@@ -159,7 +159,7 @@ class FileTool(Tool):
                 error=str(e)
             )
 
-    @tool(description="Read the contents of a file")
+    @tool(description="Read the contents of a file", parallel_safe=True)
     async def read_file(
         self,
         filename: Annotated[str, "Name of the file to read"],
@@ -196,7 +196,7 @@ class FileTool(Tool):
                 error=str(e)
             )
 
-    @tool(description="List all files in the project")
+    @tool(description="List all files in the project", parallel_safe=True)
     async def list_files(self) -> ToolResult:
         """List all file artifacts in the project."""
         try:
@@ -251,7 +251,7 @@ class FileTool(Tool):
                 error=str(e)
             )
 
-    @tool(description="Check if a file exists in the project")
+    @tool(description="Check if a file exists in the project", parallel_safe=True)
     async def file_exists(
         self,
         filename: Annotated[str, "Name of the file to check"]
@@ -346,7 +346,7 @@ class FileTool(Tool):
                 error=str(e)
             )
 
-    @tool(description="Get version history of a file")
+    @tool(description="Get version history of a file", parallel_safe=True)
     async def get_file_versions(
         self,
         filename: Annotated[str, "Name of the file to get versions for"]
@@ -409,7 +409,7 @@ class FileTool(Tool):
                 error=str(e)
             )
 
-    @tool(description="Get project summary with file statistics")
+    @tool(description="Get project summary with file statistics", parallel_safe=True)
     async def get_project_summary(self) -> ToolResult:
         """Get a summary of the project contents."""
         try:
@@ -482,7 +482,7 @@ class FileTool(Tool):
                 error=str(e)
             )
 
-    @tool(description="List contents of a directory in the project")
+    @tool(description="List contents of a directory in the project", parallel_safe=True)
     async def list_directory(
         self,
         path: Annotated[str, "Directory path to list (defaults to project root)"] = ""
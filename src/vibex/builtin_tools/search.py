@@ -54,7 +54,8 @@ class SearchTool(Tool):
 
     @tool(
         description="Search the web using Google. Supports parallel queries for efficiency.",
-        return_description="ToolResult with search results"
+        return_description="ToolResult with search results",
+        parallel_safe=True
     )
     async def search_web(self, queries: Union[str, List[str]], max_results: int = 10) -> ToolResult:
         """
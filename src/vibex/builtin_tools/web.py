@@ -18,9 +18,11 @@ from ..utils.logger import get_logger
 from ..core.tool import Tool, tool, ToolResult
 from typing import List, Optional, Union, Dict, Any
 from dataclasses import dataclass
+import asyncio
 import time
 import os
 import re
+import uuid
 from urllib.parse import urlparse
 from datetime import datetime
 from pathlib import Path
@@ -60,6 +62,8 @@ class WebTool(Tool):
     def __init__(self, project_storage: Optional[Any] = None) -> None:
         super().__init__("web")
         self.project_storage = project_storage
+        # Concurrent extractions share one artifact store; save one at a time
+        self._save_lock = asyncio.Lock()
         
         # Initialize Firecrawl with API key from environment
         self.api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -77,7 +81,8 @@ class WebTool(Tool):
 
     @tool(  # type: ignore[misc]
         description="Extract content from web URLs using Firecrawl. Supports markdown and HTML extraction with automatic retry on failures.",
-        return_description="ToolResult with file paths and content summaries"
+        return_description="ToolResult with file paths and content summaries",
+        parallel_safe=True
     )
     async def extract_urls(
         self,
@@ -131,13 +136,14 @@ class WebTool(Tool):
                 
                 for attempt in range(max_retries):
                     try:
-                        # Call scrape_url - it returns a dict-like object in latest version
-                        scrape_result = self.firecrawl.scrape_url(url, **scrape_options)
+                        # Call scrape_url - it returns a dict-like object in latest version.
+                        # The client blocks, so run it off the event loop
+                        scrape_result = await asyncio.to_thread(self.firecrawl.scrape_url, url, **scrape_options)
                         break  # Success, exit retry loop
                     except Exception as e:
                         if attempt < max_retries - 1:
                             logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}. Retrying...")
-                            time.sleep(2 ** attempt)  # Exponential backoff
+                            await asyncio.sleep(2 ** attempt)  # Exponential backoff
                         else:
                             raise  # Re-raise on final attempt
                 
@@ -247,7 +253,7 @@ class WebTool(Tool):
                     hostname = parsed_url.netloc.replace('www.', '')
                     safe_hostname = re.sub(r'[^a-zA-Z0-9\-]', '_', hostname)
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"web_extract_{safe_hostname}_{timestamp}_{i}.md"
+                    filename = f"web_extract_{safe_hostname}_{timestamp}_{i}_{uuid.uuid4().hex[:6]}.md"
 
                     # Enhanced metadata
                     file_metadata = {
@@ -272,12 +278,13 @@ class WebTool(Tool):
 """
 
                     # Save to project storage
-                    result = await self.project_storage.store_artifact(
-                        name=filename,
-                        content=content_with_header,
-                        content_type="text/markdown",
-                        commit_message=f"Extracted content from {content_obj.url}"
-                    )
+                    async with self._save_lock:
+                        result = await self.project_storage.store_artifact(
+                            name=filename,
+                            content=content_with_header,
+                            content_type="text/markdown",
+                            commit_message=f"Extracted content from {content_obj.url}"
+                        )
 
                     if result.success:
                         saved_files.append(filename)
@@ -391,9 +391,10 @@ class Brain:
 
             # Handle tool calls (structured data from native function calling)
             if hasattr(delta, 'tool_calls') and delta.tool_calls:
-                logger.debug(f"[BRAIN] Received tool calls delta: {delta.tool_calls}")
+                # Lazy %-args throughout: these run for every streamed argument fragment
+                logger.debug("[BRAIN] Received tool calls delta: %s", delta.tool_calls)
                 for tool_call_delta in delta.tool_calls:
-                    logger.debug(f"[BRAIN] Processing tool call delta: {tool_call_delta}")
+                    logger.debug("[BRAIN] Processing tool call delta: %s", tool_call_delta)
                     tool_call_id = getattr(tool_call_delta, 'id', None)
 
                     if tool_call_id:
@@ -407,19 +408,19 @@ class Brain:
                                     'arguments': ''
                                 }
                             }
-                            logger.debug(f"[BRAIN] Initialized tool call: {tool_call_id}")
+                            logger.debug("[BRAIN] Initialized tool call: %s", tool_call_id)
 
                         # Accumulate function name and arguments for this specific tool call
                         if hasattr(tool_call_delta, 'function'):
                             func = tool_call_delta.function
                             if hasattr(func, 'name') and func.name:
                                 accumulated_tool_calls[tool_call_id]['function']['name'] = func.name
-                                logger.debug(f"[BRAIN] Set function name: {func.name}")
+                                logger.debug("[BRAIN] Set function name: %s", func.name)
                             if hasattr(func, 'arguments') and func.arguments is not None:
                                 accumulated_tool_calls[tool_call_id]['function']['arguments'] += func.arguments
-                                logger.debug(f"[BRAIN] Added arguments: '{func.arguments}' -> Total: '{accumulated_tool_calls[tool_call_id]['function']['arguments']}'")
+                                logger.debug("[BRAIN] Added arguments: %r", func.arguments)
                             else:
-                                logger.debug(f"[BRAIN] No arguments in this delta")
+                                logger.debug("[BRAIN] No arguments in this delta")
 
                     elif hasattr(tool_call_delta, 'function') and accumulated_tool_calls:
                         # Handle chunks without ID - accumulate to the most recent tool call
@@ -429,12 +430,12 @@ class Brain:
 
                         if hasattr(func, 'name') and func.name:
                             accumulated_tool_calls[most_recent_id]['function']['name'] = func.name
-                            logger.debug(f"[BRAIN] Set function name (no ID): {func.name}")
+                            logger.debug("[BRAIN] Set function name (no ID): %s", func.name)
                         if hasattr(func, 'arguments') and func.arguments is not None:
                             accumulated_tool_calls[most_recent_id]['function']['arguments'] += func.arguments
-                            logger.debug(f"[BRAIN] Added arguments (no ID): '{func.arguments}' -> Total: '{accumulated_tool_calls[most_recent_id]['function']['arguments']}'")
+                            logger.debug("[BRAIN] Added arguments (no ID): %r", func.arguments)
                         else:
-                            logger.debug(f"[BRAIN] No arguments in this delta (no ID)")
+                            logger.debug("[BRAIN] No arguments in this delta (no ID)")
 
             # Handle finish reason - emit complete tool calls
             if hasattr(choice, 'finish_reason') and choice.finish_reason:
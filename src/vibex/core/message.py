@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Union, Literal, TYPE_CHECKING
+from typing import List, Dict, Any, Iterable, Optional, Union, Literal, TYPE_CHECKING
 from ..utils.id import generate_short_id
 from vibex.utils.logger import get_logger
 
@@ -242,6 +242,11 @@ class ConversationHistory(BaseModel):
         self.messages.append(message)
         self.updated_at = datetime.now()
 
+    def add_messages(self, messages: Iterable[Message]) -> None:
+        """Add several messages to the history at once, e.g. when replaying it from disk."""
+        self.messages.extend(messages)
+        self.updated_at = datetime.now()
+
     def add_step(self, step: TaskStep) -> None:
         """Add a task step to the history."""
         self.steps.append(step)
@@ -30,7 +30,8 @@ class StreamingMessageBuilder:
         self.message_id = message_id or generate_short_id()
         self.role = role
         self.parts: List[MessagePart] = []
-        self.current_text = ""
+        # Text deltas of the open text part; joined once when the part is finalized
+        self._text_chunks: List[str] = []
         self.current_part_index = -1
         self.timestamp = datetime.now()
         
@@ -46,9 +47,15 @@ class StreamingMessageBuilder:
         Returns:
             Part index where text was added
         """
-        self.current_text += text
+        if text:
+            self._text_chunks.append(text)
         return self.current_part_index + 1  # Next index when finalized
     
+    @property
+    def current_text(self) -> str:
+        """Text accumulated for the part that is still open."""
+        return "".join(self._text_chunks)
+    
     def finalize_text_part(self) -> Optional[int]:
         """
         Convert accumulated text to TextPart.
@@ -56,10 +63,10 @@ class StreamingMessageBuilder:
         Returns:
             Part index if text was finalized, None if no text
         """
-        if self.current_text:
-            part = TextPart(text=self.current_text)
+        if self._text_chunks:
+            part = TextPart(text="".join(self._text_chunks))
             self.parts.append(part)
-            self.current_text = ""
+            self._text_chunks.clear()
             self.current_part_index += 1
             logger.debug(f"Finalized text part at index {self.current_part_index}")
             return self.current_part_index
@@ -191,7 +198,7 @@ class StreamingMessageBuilder:
             "message_id": self.message_id,
             "role": self.role,
             "parts_count": len(self.parts),
-            "current_text_length": len(self.current_text),
+            "current_text_length": sum(map(len, self._text_chunks)),
             "pending_tool_calls": list(self.pending_tool_calls.keys())
         }
     
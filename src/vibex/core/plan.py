@@ -11,6 +11,7 @@ Key changes in v2:
 """
 from __future__ import annotations
 
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -50,7 +51,7 @@ class Plan(BaseModel):
         Find the next task that can be executed.
         A task is actionable if it's pending and all its dependencies are completed.
         """
-        completed_ids = [t.id for t in self.tasks if t.status == "completed"]
+        completed_ids = {t.id for t in self.tasks if t.status == "completed"}
         
         for task in self.tasks:
             if task.status == "pending" and task.can_start(completed_ids):
@@ -68,7 +69,7 @@ class Plan(BaseModel):
         Returns:
             List of tasks that can be executed concurrently
         """
-        completed_ids = [t.id for t in self.tasks if t.status == "completed"]
+        completed_ids = {t.id for t in self.tasks if t.status == "completed"}
         actionable_tasks = []
         
         for task in self.tasks:
@@ -106,28 +107,29 @@ class Plan(BaseModel):
         """Check if any tasks have failed."""
         return any(task.status == "failed" for task in self.tasks)
     
+    def get_status_counts(self) -> Dict[str, int]:
+        """Count tasks per status in a single pass over the plan."""
+        counts = Counter(task.status for task in self.tasks)
+        return {
+            status: counts[status]
+            for status in ("pending", "running", "completed", "failed", "cancelled")
+        }
+    
     def get_progress_summary(self) -> Dict[str, Any]:
         """Get a summary of the plan's progress."""
         total = len(self.tasks)
         if total == 0:
             return {"percentage": 0, "status": "empty"}
         
-        status_counts = {
-            "pending": sum(1 for t in self.tasks if t.status == "pending"),
-            "running": sum(1 for t in self.tasks if t.status == "running"),
-            "completed": sum(1 for t in self.tasks if t.status == "completed"),
-            "failed": sum(1 for t in self.tasks if t.status == "failed"),
-            "cancelled": sum(1 for t in self.tasks if t.status == "cancelled"),
-        }
-        
+        status_counts = self.get_status_counts()
         percentage = (status_counts["completed"] / total) * 100
         
         return {
             "total_tasks": total,
             "status_counts": status_counts,
             "percentage": round(percentage, 1),
-            "is_complete": self.is_complete(),
-            "has_failures": self.has_failed_tasks(),
+            "is_complete": status_counts["completed"] == total,
+            "has_failures": status_counts["failed"] > 0,
         }
     
     def get_task_graph(self) -> Dict[str, List[str]]:
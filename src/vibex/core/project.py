@@ -23,29 +23,81 @@ Example:
 
 from __future__ import annotations
 import asyncio
-import json
+import gzip
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional, List, Union, AsyncGenerator
 
-from vibex.core.agent import Agent
-from vibex.core.config import TeamConfig, AgentConfig, ProjectConfig
-from vibex.core.message import MessageQueue, ConversationHistory, Message, TextPart
+import aiofiles
+import aiofiles.os
+import orjson
+
+from vibex.core.config import TeamConfig, ProjectConfig
+from vibex.core.message import MessageQueue, ConversationHistory, Message
 from vibex.core.plan import Plan
 from vibex.core.task import Task, TaskStatus
 from vibex.storage.project import ProjectStorage
-from vibex.storage import ProjectStorageFactory
-from vibex.config.team_loader import load_team_config
-from vibex.tool.manager import ToolManager
 from vibex.utils.id import generate_short_id
 from vibex.utils.logger import get_logger
 from vibex.utils.paths import get_project_root, get_project_path
 
 if TYPE_CHECKING:
+    from vibex.core.agent import Agent
     from vibex.core.xagent import XAgent
 
 logger = get_logger(__name__)
 
+# Persisted project state, read back by resume_project and the server's status lookups
+PROJECT_STATE_FILE = "project.json"
+
+# Mutations within this window (seconds) are coalesced into a single state write
+PERSIST_DELAY = 0.05
+
+# States larger than this are gzipped; smaller ones stay plain JSON for easy inspection
+_COMPRESS_THRESHOLD = 64 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Plans with more tasks than this are serialized on a worker thread
+_OFFLOAD_TASKS = 200
+
+# History is replayed in chunks this size; one thread hop per chunk rather than per line
+_HISTORY_READ_CHUNK = 1024 * 1024
+
+
+def encode_project_state(data: Dict[str, Any]) -> bytes:
+    """
+    Encode project state for storage as compact JSON (jq and friends still read it).
+    
+    Large plans repeat the same task keys over and over, so past the threshold
+    the JSON is gzipped at the fastest level, which shrinks it several-fold for
+    little CPU.
+    """
+    encoded = orjson.dumps(data)
+    if len(encoded) > _COMPRESS_THRESHOLD:
+        return gzip.compress(encoded, compresslevel=1)
+    return encoded
+
+
+def decode_project_state(blob: Union[str, bytes]) -> Dict[str, Any]:
+    """Decode project state written by encode_project_state, or by older indented writers."""
+    if isinstance(blob, bytes) and blob.startswith(_GZIP_MAGIC):
+        blob = gzip.decompress(blob)
+    return orjson.loads(blob)
+
+
+async def _read_jsonl(path: Path) -> AsyncGenerator[Dict[str, Any], None]:
+    """Yield the records of a JSON Lines file without blocking the event loop."""
+    pending = b""
+    async with aiofiles.open(path, 'rb') as f:
+        while chunk := await f.read(_HISTORY_READ_CHUNK):
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                if line.strip():
+                    yield orjson.loads(line)
+    if pending.strip():
+        yield orjson.loads(pending)
+
 
 class Project:
     def __init__(
@@ -74,6 +126,11 @@ class Project:
         self.updated_at: datetime = datetime.now()
         self.plan: Optional[Plan] = None
         
+        # Debounced persistence: mutations mark the state dirty and one delayed write covers them all
+        self._dirty = False
+        self._persist_task: Optional[asyncio.Task] = None
+        self._persist_lock = asyncio.Lock()
+        
     def get_agent(self, name: str) -> Agent:
         if name not in self.agents:
             raise ValueError(f"Agent '{name}' not found in project team.")
@@ -104,19 +161,20 @@ class Project:
     
     async def create_plan(self, plan: Plan) -> None:
         self.plan = plan
-        await self._persist_state()
+        self.schedule_persist()
         logger.info(f"Created plan for project {self.project_id} with {len(plan.tasks)} tasks")
     
     async def update_plan(self, plan: Plan) -> None:
         self.plan = plan
         self.updated_at = datetime.now()
-        await self._persist_state()
+        self.schedule_persist()
         logger.info(f"Updated plan for project {self.project_id}")
     
     async def set_name(self, name: str) -> None:
         """Set a custom name for this project."""
         self.name = name
         self.updated_at = datetime.now()
+        # Renames come straight from users, so write them through
         await self._persist_state()
         logger.info(f"Updated project {self.project_id} name to: {name}")
     
@@ -139,7 +197,7 @@ class Project:
         success = self.plan.update_task_status(project_id, status)
         if success:
             self.updated_at = datetime.now()
-            await self._persist_state()
+            self.schedule_persist()
             logger.info(f"Updated project {project_id} status to {status}")
             
         return success
@@ -159,7 +217,7 @@ class Project:
             
         task.assigned_to = agent_name
         self.updated_at = datetime.now()
-        await self._persist_state()
+        self.schedule_persist()
         logger.info(f"Assigned task {task_id} to agent {agent_name}")
         return True
     
@@ -174,7 +232,60 @@ class Project:
             return False
         return self.plan.has_failed_tasks()
     
+    def schedule_persist(self) -> None:
+        """
+        Mark the state dirty and make sure a write is pending.
+        
+        Bursts of mutations (e.g. several parallel tasks finishing) collapse into
+        one write PERSIST_DELAY seconds later; call flush() to write immediately.
+        """
+        self._dirty = True
+        if self._persist_task is None or self._persist_task.done():
+            self._persist_task = asyncio.create_task(self._persist_later())
+    
+    async def _persist_later(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(PERSIST_DELAY)
+            try:
+                await self.flush()
+            except Exception as e:
+                # Nobody awaits this task; the state stays dirty for the next write or flush()
+                logger.error(f"Failed to persist state for project {self.project_id}: {e}")
+                return
+    
+    async def flush(self) -> None:
+        """Write any pending state changes now; raises if the write fails."""
+        if self._dirty:
+            await self._persist_state()
+    
+    def cancel_pending_persist(self) -> None:
+        """Drop pending writes, e.g. because the project is being deleted."""
+        self._dirty = False
+        if self._persist_task is not None:
+            self._persist_task.cancel()
+            self._persist_task = None
+    
     async def _persist_state(self) -> None:
+        async with self._persist_lock:
+            # Cleared before encoding, so mutations made during the write schedule another one
+            self._dirty = False
+            try:
+                await self._write_state()
+            except Exception:
+                self._dirty = True
+                raise
+    
+    async def _write_state(self) -> None:
+        if self.plan and len(self.plan.tasks) > _OFFLOAD_TASKS:
+            # Dumping, encoding and gzipping a big plan takes long enough to stall other requests
+            blob = await asyncio.to_thread(self._encode_state)
+        else:
+            blob = self._encode_state()
+        result = await self.storage.save_file(PROJECT_STATE_FILE, blob)
+        if not result.success:
+            raise IOError(f"Failed to save {PROJECT_STATE_FILE}: {result.error}")
+    
+    def _encode_state(self) -> bytes:
         project_data = {
             "project_id": self.project_id,
             "name": self.name,
@@ -184,14 +295,13 @@ class Project:
             "team_agents": list(self.agents.keys()),
             "plan": self.plan.model_dump() if self.plan else None,
         }
-        await self.storage.save_file("project.json", project_data)
+        return encode_project_state(project_data)
     
     async def load_state(self) -> bool:
         try:
-            project_data = await self.storage.read_file("project.json")
+            project_data = await self.storage.read_file_bytes(PROJECT_STATE_FILE)
             if project_data:
-                import json
-                data = json.loads(project_data)
+                data = decode_project_state(project_data)
                 
                 self.created_at = datetime.fromisoformat(data.get("created_at", self.created_at.isoformat()))
                 self.updated_at = datetime.fromisoformat(data.get("updated_at", self.updated_at.isoformat()))
@@ -221,12 +331,13 @@ class Project:
         }
         
         if self.plan:
+            counts = self.plan.get_status_counts()
             task_stats = {
                 "total": len(self.plan.tasks),
-                "completed": sum(1 for t in self.plan.tasks if t.status == "completed"),
-                "running": sum(1 for t in self.plan.tasks if t.status == "running"),
-                "pending": sum(1 for t in self.plan.tasks if t.status == "pending"),
-                "failed": sum(1 for t in self.plan.tasks if t.status == "failed"),
+                "completed": counts["completed"],
+                "running": counts["running"],
+                "pending": counts["pending"],
+                "failed": counts["failed"],
             }
             summary["tasks"] = task_stats
             summary["progress_percentage"] = (
@@ -244,7 +355,10 @@ async def start_project(
     project_root: Optional[Path] = None,
     name: Optional[str] = None,
 ) -> Project:
+    # Only needed to build projects, not to read their persisted state
+    from vibex.config.team_loader import load_team_config
     from vibex.core.xagent import XAgent
+    from vibex.storage import ProjectStorageFactory
     
     if project_id is None:
         project_id = generate_short_id()
@@ -263,21 +377,6 @@ async def start_project(
     message_queue = MessageQueue()
     history = ConversationHistory(project_id=project_id)
     
-    tool_manager = ToolManager(
-        project_id=project_id,
-        project_path=str(storage.get_project_path())
-    )
-    
-    agents = {}
-    for agent_config in team_config.agents:
-        agent = Agent(
-            config=agent_config,
-            tool_manager=tool_manager,
-        )
-        if hasattr(team_config, 'memory') and team_config.memory:
-            agent.team_memory_config = team_config.memory
-        agents[agent_config.name] = agent
-    
     x_agent = XAgent(
         team_config=team_config,
         project_id=project_id,
@@ -290,7 +389,8 @@ async def start_project(
         config=team_config.execution,
         history=history,
         message_queue=message_queue,
-        agents=agents,
+        # The XAgent already built the team (and its tool manager); share it rather than build another
+        agents=x_agent.specialist_agents,
         storage=storage,
         goal=goal,
         name=name,
@@ -311,6 +411,9 @@ async def start_project(
             x_agent.plan = plan
             x_agent._plan_initialized = True
     
+    # Callers read project.json right after start, so don't leave the plan pending
+    await project.flush()
+    
     logger.info(f"Started project {project_id} with goal: {goal}")
     return project
 
@@ -323,15 +426,13 @@ async def run_project(
     project = await start_project(goal, config_path, project_id)
     
     while not project.is_plan_complete():
-        response = await project.x_agent.step()
-        
-        message = Message.assistant_message(response)
+        yield Message.assistant_message(await project.x_agent.step())
         
-        yield message
-        
-        if project.has_failed_tasks():
+        # Without a plan, step() only reports that there is nothing to do; stop instead of spinning
+        if project.plan is None or project.has_failed_tasks():
             break
     
+    await project.flush()
     logger.info(f"Project {project.project_id} completed")
 
 
@@ -339,10 +440,12 @@ async def resume_project(
     project_id: str,
     config_path: Union[str, Path, TeamConfig]
 ) -> Project:
+    from vibex.config.team_loader import load_team_config
     from vibex.core.xagent import XAgent
+    from vibex.storage import ProjectStorageFactory
     
     project_path = get_project_path(project_id)
-    if not project_path.exists():
+    if not await aiofiles.os.path.exists(project_path):
         raise ValueError(f"Project {project_id} not found")
     
     if isinstance(config_path, (str, Path)):
@@ -360,28 +463,10 @@ async def resume_project(
     history = ConversationHistory(project_id=project_id)
     
     messages_file = project_path / "history" / "messages.jsonl"
-    if messages_file.exists():
-        import json
-        with open(messages_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    msg_data = json.loads(line)
-                    history.add_message(Message(**msg_data))
-    
-    tool_manager = ToolManager(
-        project_id=project_id,
-        project_path=str(storage.get_project_path())
-    )
-    
-    agents = {}
-    for agent_config in team_config.agents:
-        agent = Agent(
-            config=agent_config,
-            tool_manager=tool_manager,
-        )
-        if hasattr(team_config, 'memory') and team_config.memory:
-            agent.team_memory_config = team_config.memory
-        agents[agent_config.name] = agent
+    if await aiofiles.os.path.exists(messages_file):
+        history.add_messages([
+            Message.model_validate(msg_data) async for msg_data in _read_jsonl(messages_file)
+        ])
     
     x_agent = XAgent(
         team_config=team_config,
@@ -393,16 +478,16 @@ async def resume_project(
     goal = ""
     name = None
     try:
-        project_data = await storage.read_file("project.json")
+        project_data = await storage.read_file_bytes(PROJECT_STATE_FILE)
         if project_data:
-            data = json.loads(project_data)
+            data = decode_project_state(project_data)
             goal = data.get("goal", "")
             name = data.get("name")
     except Exception:
         metadata_file = project_path / "metadata.json"
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+        if await aiofiles.os.path.exists(metadata_file):
+            async with aiofiles.open(metadata_file, 'rb') as f:
+                metadata = orjson.loads(await f.read())
                 goal = metadata.get("goal", "")
                 name = metadata.get("name")
     
@@ -411,7 +496,7 @@ async def resume_project(
         config=team_config.execution,
         history=history,
         message_queue=message_queue,
-        agents=agents,
+        agents=x_agent.specialist_agents,
         storage=storage,
         goal=goal,
         name=name,
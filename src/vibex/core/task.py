@@ -11,7 +11,7 @@ and executed as part of a project's plan.
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Collection
 from datetime import datetime
 from pydantic import BaseModel, Field
 import uuid
@@ -47,7 +47,7 @@ class Task(BaseModel):
         """Assigns the task to an agent."""
         self.assigned_to = agent_name
 
-    def can_start(self, completed_task_ids: List[str]) -> bool:
+    def can_start(self, completed_task_ids: Collection[str]) -> bool:
         """Check if this task can start based on completed dependencies."""
         return all(dep_id in completed_task_ids for dep_id in self.dependencies)
 
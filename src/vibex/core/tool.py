@@ -32,10 +32,17 @@ class ToolFunction(BaseModel):
     parameters: Dict[str, Any]  # JSON schema
     return_description: str = ""
     function: Optional[Callable] = Field(default=None, exclude=True)
+    # Derived from `function` once at construction so execution doesn't introspect it per call
+    is_coroutine: bool = Field(default=False, exclude=True)
+    # Only parallel-safe calls are overlapped within a batch; everything else runs in order
+    parallel_safe: bool = Field(default=False, exclude=True)
 
     class Config:
         arbitrary_types_allowed = True
 
+    def model_post_init(self, __context: Any) -> None:
+        self.is_coroutine = self.function is not None and asyncio.iscoroutinefunction(self.function)
+
 
 class ToolCall(BaseModel):
     """Tool call specification with retry policy."""
@@ -184,18 +191,21 @@ def safe_json_dumps(obj: Any, **kwargs) -> str:
 # DECORATOR
 # ============================================================================
 
-def tool(description: str = "", return_description: str = ""):
+def tool(description: str = "", return_description: str = "", parallel_safe: bool = False):
     """
     Decorator to mark methods as available tool calls.
 
     Args:
         description: Clear description of what this tool does
         return_description: Description of what the tool returns
+        parallel_safe: Whether calls may run concurrently with neighbouring
+            parallel-safe calls in a batch (e.g. read-only tools)
     """
     def decorator(func):
         func._is_tool_call = True
         func._tool_description = description or func.__doc__ or ""
         func._return_description = return_description
+        func._parallel_safe = parallel_safe
         return func
     return decorator
 
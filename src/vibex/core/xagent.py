@@ -196,6 +196,9 @@ class XAgent(Agent):
         self.initial_prompt = initial_prompt
         self._plan_initialized = False
         
+        # Owning user, assigned by the server layer (None when unknown)
+        self.user_id: Optional[str] = None
+        
         # Parallel execution settings
         self.parallel_execution = True  # Enable parallel execution by default
         self.max_concurrent_tasks = 3  # Default concurrency limit
@@ -705,12 +708,16 @@ class XAgent(Agent):
                         chunk_text = chunk.get("content", "")
                         if chunk_text:  # Only process non-empty chunks
                             builder.add_text_delta(chunk_text)
-                            logger.debug(f"[STREAMING] Received text chunk: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' (length: {len(chunk_text)})")
+                            # Lazy %-args: this runs once per token, and debug is normally off
+                            logger.debug("[STREAMING] Received text chunk: %.50r (length: %d)", chunk_text, len(chunk_text))
                             
                             # Send text delta event
                             try:
                                 part_index = len(builder.parts) - 1 if builder.parts else 0
-                                logger.debug(f"[STREAMING] Sending part_delta for text: message_id={message_id}, part_index={part_index}, delta_length={len(chunk_text)}")
+                                logger.debug(
+                                    "[STREAMING] Sending part_delta for text: message_id=%s, part_index=%d, delta_length=%d",
+                                    message_id, part_index, len(chunk_text),
+                                )
                                 await event_stream_manager.send_event(
                                     self.project_id,
                                     "part_delta",
@@ -841,14 +848,6 @@ class XAgent(Agent):
                                     "part": error_part.model_dump(by_alias=True)
                                 }
                             )
-                            # Legacy error event
-                            await send_stream_chunk(
-                                project_id=self.project_id,
-                                chunk="",
-                                message_id=message_id,
-                                is_final=True,
-                                error=error_content
-                            )
                         except Exception as e:
                             logger.error(f"[STREAMING] Error sending error chunk: {e}")
                         break
@@ -871,31 +870,12 @@ class XAgent(Agent):
                         "message": message.model_dump(by_alias=True)
                     }
                 )
-                # Legacy final chunk
-                await send_stream_chunk(
-                    project_id=self.project_id,
-                    chunk="",
-                    message_id=message_id,
-                    is_final=True
-                )
                 logger.info(f"[STREAMING] Sent message complete for {message_id} with {len(parts)} parts")
             except Exception as e:
                 logger.error(f"[STREAMING] Error sending final events: {e}")
                 
         except Exception as e:
             logger.error(f"Streaming failed: {e}")
-            # Send error chunk via SSE
-            try:
-                from ..server.streaming import send_stream_chunk
-                await send_stream_chunk(
-                    project_id=self.project_id,
-                    chunk="",
-                    message_id=message_id,
-                    is_final=True,
-                    error=str(e)
-                )
-            except Exception as send_error:
-                logger.error(f"[STREAMING] Error sending error chunk: {send_error}")
             
             # Fallback to non-streaming
             response = await self.brain.generate_response(
@@ -1713,10 +1693,10 @@ Original user request: {self.initial_prompt or "No initial prompt provided"}{out
             return
 
         try:
-            # Update the project's plan field and persist project state
+            # Update the project's plan field; the project coalesces bursts into one write
             self.project.plan = self.plan
-            await self.project._persist_state()
-            logger.debug("Plan persisted to project.json via Project class")
+            self.project.schedule_persist()
+            logger.debug("Plan persist scheduled via Project class")
         except Exception as e:
             logger.error(f"Failed to persist plan: {e}")
 
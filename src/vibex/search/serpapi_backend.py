@@ -2,6 +2,7 @@
 SerpAPI backend implementation for web search.
 """
 
+import asyncio
 import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -88,9 +89,9 @@ class SerpAPIBackend(SearchBackend):
             # Add any additional parameters
             params.update(kwargs)
 
-            # Execute search
+            # Execute search; the SerpAPI client blocks, so keep it off the event loop
             search = search_class(params)
-            search_data = search.get_dict()
+            search_data = await asyncio.to_thread(search.get_dict)
 
             # Parse results
             results = self._parse_search_results(search_data, query)
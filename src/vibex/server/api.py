@@ -5,35 +5,221 @@ A thin API layer that only handles HTTP concerns.
 All business logic is delegated to XAgent instances.
 """
 
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional, List, Any
 from datetime import datetime
 import asyncio
+import codecs
+import functools
+import hashlib
 import importlib.metadata
-import json
+import mimetypes
+import os
+import time
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Header, BackgroundTasks, Depends, Request
+import aiofiles
+import aiofiles.os
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Header, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
-from .service import XAgentService, get_xagent_service
-from .models import CreateXAgentRequest, XAgentResponse, TaskStatus, XAgentListResponse, ChatRequest
+from .service import XAgentService, get_xagent_service, active_xagents
+from .models import CreateXAgentRequest, XAgentResponse, XAgentListResponse, ChatRequest
 from .streaming import event_stream_manager
 from ..utils.logger import get_logger
 # Authentication temporarily disabled
 # from .auth import get_user_id
 from ..core.exceptions import AgentNotFoundError
 from ..utils.paths import get_project_path
+from ..tool.executor import shutdown_tool_threads
 
 logger = get_logger(__name__)
 
+HEALTH_API_ENDPOINTS = [
+    "/xagents", 
+    "/xagents/{xagent_id}", 
+    "/xagents/{xagent_id}/messages",
+    "/xagents/{xagent_id}/artifacts",
+    "/xagents/{xagent_id}/artifacts/{artifact_path}",
+    "/xagents/{xagent_id}/logs",
+    "/xagents/{xagent_id}/stream",
+    "/chat",
+    "/health", 
+    "/monitor"
+]
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which encodes straight to bytes in C."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+async def _stat_etag(path: Path) -> Optional[str]:
+    """Build a weak ETag from a path's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        st = await aiofiles.os.stat(path)
+    except OSError:
+        return None
+    return f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _not_modified(request: Request, etag: Optional[str]) -> bool:
+    """Check whether the client's If-None-Match already matches the current ETag."""
+    return etag is not None and request.headers.get("if-none-match") == etag
+
+
+def _tail_lines(path: Path, count: int, block_size: int = 64 * 1024) -> List[str]:
+    """
+    Return the last `count` non-empty lines of a file.
+
+    Reads fixed-size blocks backwards from EOF (the classic `tail -n` approach),
+    so the I/O is proportional to the requested lines rather than the file size.
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+            # Only re-split once enough newlines have been seen to possibly satisfy count
+            if data.count(b"\n") > count:
+                lines = [line for line in data.split(b"\n")[1:] if line.strip()]
+                if len(lines) >= count:
+                    break
+        text = data.decode('utf-8', errors='replace')
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return lines[-count:]
+
+
+async def _iter_artifact_json(
+    artifact_path: str, artifact_file: Path, chunk_size: int = 64 * 1024
+) -> AsyncGenerator[bytes, None]:
+    """
+    Stream `{"artifact_path": ..., "content": ...}` without loading the file into memory.
+
+    Content is decoded incrementally as UTF-8 (invalid bytes are replaced, as
+    for binary files) and JSON-escaped chunk by chunk.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    yield b'{"artifact_path":' + orjson.dumps(artifact_path) + b',"content":"'
+    async with aiofiles.open(artifact_file, 'rb') as f:
+        while chunk := await f.read(chunk_size):
+            text = decoder.decode(chunk)
+            if text:
+                yield orjson.dumps(text)[1:-1]
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield orjson.dumps(tail)[1:-1]
+    yield b'"}'
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolved_dir_prefix(directory: str) -> str:
+    """Resolve a directory once and return it with a trailing separator for prefix checks."""
+    return os.path.join(os.path.realpath(directory), "")
+
+
+def _resolve_artifact_path(xagent_id: str, artifact_path: str) -> Path:
+    """
+    Map a client-supplied artifact path onto the project's artifacts directory.
+
+    Raises HTTPException(403) if the path would escape the artifacts directory.
+    """
+    relative = Path(artifact_path)
+    # Reject traversal before touching the filesystem
+    if relative.is_absolute() or ".." in relative.parts:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    artifacts_dir = get_project_path(xagent_id) / "artifacts"
+    # A symlink in any component (not just the last) can point outside, so always
+    # resolve the full path and serve the resolved target
+    try:
+        target = Path(os.path.realpath(artifacts_dir / relative, strict=True))
+    except (OSError, RuntimeError):
+        raise HTTPException(status_code=404, detail="Artifact not found")
+    if not str(target).startswith(_resolved_dir_prefix(str(artifacts_dir))):
+        raise HTTPException(status_code=403, detail="Access denied")
+    return target
+
+
+async def require_user(request: Request) -> str:
+    """
+    Resolve the calling user from the X-User-ID header.
+    
+    Reads Starlette's already-parsed headers directly rather than declaring a
+    Header() parameter, which skips FastAPI's per-request parameter validation.
+    """
+    user_id = request.headers.get("x-user-id")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="User ID required")
+    return user_id
+
+
+async def require_xagent_owner(
+    xagent_id: str,
+    user_id: str = Depends(require_user),
+    xagent_service: XAgentService = Depends(get_xagent_service),
+) -> str:
+    """
+    Check once per request that the caller owns the XAgent and return the user ID.
+    
+    FastAPI caches dependency results within a request, so handlers and nested
+    dependencies share this single registry lookup. Like the service, it answers
+    projects the caller doesn't own with 404 so they look the same as missing ones.
+    """
+    if not await xagent_service.verify_ownership(user_id, xagent_id):
+        raise HTTPException(status_code=404, detail="XAgent not found")
+    return user_id
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Share one pooled HTTP client for the app lifetime and sweep the project trash on startup.
+    
+    LiteLLM picks up `aclient_session` when building provider clients, so every
+    XAgent's LLM calls reuse keep-alive connections instead of paying a TCP and
+    TLS handshake per request. On shutdown, project state still waiting to be written
+    is flushed, the registry's connections are closed while the event loop is still
+    running, and the sync tool threads are released.
+    """
+    import litellm
+    
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=httpx.Timeout(60.0),
+    )
+    app.state.http_client = http_client
+    litellm.aclient_session = http_client
+    xagent_service = get_xagent_service()
+    # Finish removing projects whose background delete was interrupted
+    xagent_service.purge_trash()
+    try:
+        yield
+    finally:
+        await xagent_service.flush_projects()
+        litellm.aclient_session = None
+        await http_client.aclose()
+        await xagent_service.registry.close()
+        shutdown_tool_threads()
+
 
 def create_app() -> FastAPI:
     """Create the FastAPI application with clean architecture."""
     app = FastAPI(
         title="VibeX API v2",
         description="Clean REST API for VibeX agent execution",
-        version="2.0.0"
+        version="2.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     
     # Add CORS middleware
@@ -48,75 +234,31 @@ def create_app() -> FastAPI:
     # Get service instance
     xagent_service = get_xagent_service()
     
+    # Version is fixed for the process lifetime
+    try:
+        version = importlib.metadata.version("vibex")
+    except Exception:
+        version = "unknown"
+    
+    # Load balancer probes hit /health many times a second; rebuild the body at most once per second
+    health_cache = {"body": b"", "expires_at": 0.0}
+    
     @app.get("/health")
     async def health_check():
         """Health check endpoint"""
-        # Get agent count for health info
-        active_agents = len(await xagent_service.list("_health_check"))
-        
-        # Get version from package metadata
-        try:
-            version = importlib.metadata.version("vibex")
-        except Exception:
-            version = "unknown"
-        
-        return {
-            "status": "healthy",
-            "version": version,
-            "timestamp": datetime.now().isoformat(),
-            "service_type": "vibex-agent-orchestration",
-            "service_name": "VibeX API",
-            "active_agents": active_agents,
-            "api_endpoints": [
-                "/xagents", 
-                "/xagents/{xagent_id}", 
-                "/xagents/{xagent_id}/messages",
-                "/xagents/{xagent_id}/artifacts",
-                "/xagents/{xagent_id}/artifacts/{artifact_path}",
-                "/xagents/{xagent_id}/logs",
-                "/xagents/{xagent_id}/stream",
-                "/chat",
-                "/health", 
-                "/monitor"
-            ]
-        }
-    
-    async def _xagent_to_response(xagent, user_id: str) -> XAgentResponse:
-        """Convert XAgent instance to XAgentResponse DTO for API serialization."""
-        # Ensure plan is loaded before creating response
-        await xagent._ensure_plan_initialized()
-        
-        # Determine status from task states in the plan
-        status = TaskStatus.PENDING
-        if xagent.plan and xagent.plan.tasks:
-            # Check task statuses
-            has_failed = any(t.status == "failed" for t in xagent.plan.tasks)
-            has_running = any(t.status == "running" for t in xagent.plan.tasks)
-            all_completed = all(t.status == "completed" for t in xagent.plan.tasks)
-            
-            if has_failed:
-                status = TaskStatus.FAILED
-            elif all_completed:
-                status = TaskStatus.COMPLETED
-            elif has_running:
-                status = TaskStatus.RUNNING
-            else:
-                status = TaskStatus.PENDING
-        
-        goal_value = xagent.initial_prompt or ""
-        logger.debug(f"[_xagent_to_response] XAgent {xagent.project_id} - initial_prompt: '{xagent.initial_prompt}', goal: '{goal_value}'")
-        
-        return XAgentResponse(
-            xagent_id=xagent.project_id,
-            user_id=user_id,
-            status=status,
-            created_at=datetime.now(),  # TODO: Get actual creation time from XAgent
-            updated_at=datetime.now(),  # TODO: Get actual update time from XAgent
-            goal=goal_value,
-            name=getattr(xagent, 'name', f"Project {xagent.project_id}"),
-            config_path=getattr(xagent, 'config_path', None),
-            plan=xagent.plan.model_dump() if xagent.plan else None,
-        )
+        now = time.monotonic()
+        if now >= health_cache["expires_at"]:
+            health_cache["body"] = orjson.dumps({
+                "status": "healthy",
+                "version": version,
+                "timestamp": datetime.now().isoformat(),
+                "service_type": "vibex-agent-orchestration",
+                "service_name": "VibeX API",
+                "active_agents": len(active_xagents),
+                "api_endpoints": HEALTH_API_ENDPOINTS,
+            })
+            health_cache["expires_at"] = now + 1.0
+        return Response(content=health_cache["body"], media_type="application/json")
     
     @app.get("/test-sse/{xagent_id}")
     async def test_sse(xagent_id: str):
@@ -147,57 +289,50 @@ def create_app() -> FastAPI:
     
     # ===== Agent Management =====
     
-    @app.post("/xagents", response_model=XAgentResponse)
+    @app.post("/xagents", response_model=None, responses={200: {"model": XAgentResponse}})
     async def create_agent_run(
         request: CreateXAgentRequest,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
-        xagent_service: XAgentService = Depends(get_xagent_service),
+        user_id: str = Depends(require_user),
     ):
         """
         Creates a new XAgent instance.
         Returns a DTO representation for API compatibility.
         """
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-            
-        logger.info(f"[/xagents] Received request to create XAgent for user: {x_user_id}")
+        logger.info(f"[/xagents] Received request to create XAgent for user: {user_id}")
         logger.info(f"[/xagents] Goal: '{request.goal}'")
         logger.debug(f"Request details: {request}")
 
         try:
             # Create XAgent instance
             xagent = await xagent_service.create(
-                user_id=x_user_id,
+                user_id=user_id,
                 goal=request.goal,
                 config_path=request.config_path,
                 context=request.context,
             )
 
-            # Convert to DTO for API response
-            return await _xagent_to_response(xagent, x_user_id)
+            # Convert to DTO for API response; it is already validated, so serialize it directly
+            response = await xagent_service.to_response(xagent, user_id)
+            return ORJSONResponse(response.model_dump(mode="json"))
             
         except Exception as e:
             logger.error(f"Failed to create XAgent: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.get("/xagents", response_model=XAgentListResponse)
-    async def list_agent_runs(x_user_id: Optional[str] = Header(None, alias="X-User-ID")):
+    # Read-only lookups skip response_model re-validation and serialize the DTOs directly
+    @app.get("/xagents", response_model=None, responses={200: {"model": XAgentListResponse}})
+    async def list_agent_runs(user_id: str = Depends(require_user)):
         """List all XAgent instances for the authenticated user."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
         try:
             # Get list of ProjectInfo objects
-            project_infos = await xagent_service.list(x_user_id)
+            project_infos = await xagent_service.list(user_id)
             runs = []
             
-            # For each project, load the XAgent and convert to response
+            # For each project, convert its state to a response
             for project_info in project_infos:
                 try:
-                    # Load the actual XAgent instance
-                    xagent = await xagent_service.get(project_info.project_id)
-                    response = await _xagent_to_response(xagent, x_user_id)
-                    runs.append(response)
+                    # Read persisted state rather than resuming every XAgent
+                    runs.append(await xagent_service.get_info(user_id, project_info.project_id))
                 except Exception as e:
                     logger.warning(f"Failed to load XAgent {project_info.project_id}: {e}")
                     # Create minimal response for failed loads
@@ -211,23 +346,20 @@ def create_app() -> FastAPI:
                         artifacts=[]
                     ))
             
-            return XAgentListResponse(xagents=runs)
+            return ORJSONResponse({"xagents": [run.model_dump(mode="json") for run in runs]})
         except Exception as e:
             logger.error(f"Failed to list XAgents: {e}")
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.get("/xagents/{xagent_id}", response_model=XAgentResponse)
+    @app.get("/xagents/{xagent_id}", response_model=None, responses={200: {"model": XAgentResponse}})
     async def get_agent_run(
         xagent_id: str,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        user_id: str = Depends(require_user)
     ):
-        """Get XAgent information."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
+        """Get XAgent information without resuming the XAgent."""
         try:
-            xagent = await xagent_service.get(xagent_id)
-            return await _xagent_to_response(xagent, x_user_id)
+            info = await xagent_service.get_info(user_id, xagent_id)
+            return ORJSONResponse(info.model_dump(mode="json"))
             
         except AgentNotFoundError:
             raise HTTPException(status_code=404, detail="XAgent not found")
@@ -238,18 +370,20 @@ def create_app() -> FastAPI:
     @app.delete("/xagents/{xagent_id}")
     async def delete_agent_run(
         xagent_id: str,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        user_id: str = Depends(require_user)
     ):
         """Delete an XAgent instance."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
         try:
-            deleted = await xagent_service.delete(xagent_id)
+            # The service checks ownership and removes the registry entry
+            deleted = await xagent_service.delete(xagent_id, user_id)
             if deleted:
                 return {"message": "XAgent deleted successfully"}
             else:
                 raise HTTPException(status_code=404, detail="XAgent not found")
+        except HTTPException:
+            raise
+        except AgentNotFoundError:
+            raise HTTPException(status_code=404, detail="XAgent not found")
         except Exception as e:
             logger.error(f"Failed to delete XAgent: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -259,19 +393,18 @@ def create_app() -> FastAPI:
     @app.post("/chat")
     async def chat_with_agent(
         request: ChatRequest,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        user_id: str = Depends(require_user)
     ):
         """Chat with an XAgent."""
-        logger.info(f"[API] POST /chat - User: {x_user_id}, XAgent: {request.xagent_id}")
+        logger.info(f"[API] POST /chat - User: {user_id}, XAgent: {request.xagent_id}")
         logger.info(f"[API] Chat request: {request}")
         
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
         try:
-            # Get XAgent instance and chat directly
-            xagent = await xagent_service.get(request.xagent_id)
-            response = await xagent.chat(request.content, mode=request.mode)
+            # Run the chat turn on the task runner so it outlives a client disconnect
+            xagent = await xagent_service.get_authorized(user_id, request.xagent_id)
+            response = await xagent_service.runner.run(
+                request.xagent_id, xagent.chat(request.content, mode=request.mode)
+            )
             
             logger.info(f"[API] Response from XAgent: {response.text[:100]}...")
             return {"response": response.text}
@@ -285,15 +418,14 @@ def create_app() -> FastAPI:
     @app.get("/xagents/{xagent_id}/messages")
     async def get_messages(
         xagent_id: str,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        since: int = Query(0, ge=0, description="Index of the first message to return"),
+        limit: Optional[int] = Query(None, ge=1, description="Maximum number of messages to return"),
+        user_id: str = Depends(require_user)
     ):
-        """Get messages for an XAgent."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
+        """Get messages for an XAgent, optionally one page at a time."""
         try:
-            # Use service method which returns typed MessageInfo objects
-            messages = await xagent_service.get_messages(x_user_id, xagent_id)
+            # Use service method which returns typed MessageInfo objects (and checks ownership)
+            messages = await xagent_service.get_messages(user_id, xagent_id, since=since, limit=limit)
             # Serialize to dicts for API response
             return {"messages": [msg.model_dump() for msg in messages]}
         except AgentNotFoundError:
@@ -304,19 +436,17 @@ def create_app() -> FastAPI:
     
     # ===== Agent Resources =====
     
-    @app.get("/xagents/{xagent_id}/artifacts")
+    @app.api_route("/xagents/{xagent_id}/artifacts", methods=["GET", "HEAD"])
     async def list_agent_artifacts(
         xagent_id: str,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        request: Request,
+        user_id: str = Depends(require_user)
     ):
         """List all artifacts for an XAgent."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
         try:
-            artifacts = await xagent_service.get_artifacts(x_user_id, xagent_id)
+            artifacts = await xagent_service.get_artifacts(user_id, xagent_id)
             # Convert ArtifactInfo to dict for JSON response
-            return {
+            listing = {
                 "artifacts": [
                     {
                         "path": artifact.path,
@@ -327,8 +457,18 @@ def create_app() -> FastAPI:
                     for artifact in artifacts
                 ]
             }
-        except PermissionError:
-            raise HTTPException(status_code=403, detail="Access denied")
+            
+            # Dashboards poll this endpoint; answer unchanged listings with 304. The ETag
+            # covers every file's path, size and mtime, since in-place edits and nested
+            # additions don't touch the top-level directory's own stat.
+            body = orjson.dumps(listing)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            not_modified = _not_modified(request, etag)
+            if not_modified or request.method == "HEAD":
+                return Response(status_code=304 if not_modified else 200, headers={"ETag": etag})
+            return Response(body, media_type="application/json", headers={"ETag": etag})
+        except AgentNotFoundError:
+            raise HTTPException(status_code=404, detail="XAgent not found")
         except Exception as e:
             logger.error(f"Failed to list artifacts for {xagent_id}: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -337,30 +477,33 @@ def create_app() -> FastAPI:
     async def get_agent_artifact(
         xagent_id: str,
         artifact_path: str,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        request: Request,
+        user_id: str = Depends(require_xagent_owner)
     ):
-        """Get artifact directly from filesystem to avoid logging feedback loops."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
+        """
+        Get artifact directly from filesystem to avoid logging feedback loops.
         
+        Clients that accept text/plain or application/octet-stream get the raw
+        file via sendfile; everyone else gets the JSON wrapper, streamed in chunks.
+        """
         try:
             # Access artifact directly from filesystem
-            artifact_file = get_project_path(xagent_id) / "artifacts" / artifact_path
+            artifact_file = _resolve_artifact_path(xagent_id, artifact_path)
             
-            if not artifact_file.exists():
+            if not await aiofiles.os.path.exists(artifact_file):
                 raise HTTPException(status_code=404, detail="Artifact not found")
             
             # Read artifact content
-            if artifact_file.is_file():
-                try:
-                    with open(artifact_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    # Handle binary files
-                    with open(artifact_file, 'rb') as f:
-                        content = f.read().decode('utf-8', errors='replace')
+            if await aiofiles.os.path.isfile(artifact_file):
+                accept = request.headers.get("accept", "")
+                if "text/plain" in accept or "application/octet-stream" in accept:
+                    media_type = mimetypes.guess_type(artifact_file.name)[0] or "application/octet-stream"
+                    return FileResponse(artifact_file, media_type=media_type)
                 
-                return {"artifact_path": artifact_path, "content": content}
+                return StreamingResponse(
+                    _iter_artifact_json(artifact_path, artifact_file),
+                    media_type="application/json",
+                )
             else:
                 raise HTTPException(status_code=404, detail="Artifact path is not a file")
                 
@@ -370,29 +513,37 @@ def create_app() -> FastAPI:
             # Don't log errors for read-only operations to avoid feedback loops
             raise HTTPException(status_code=500, detail=str(e))
     
-    @app.get("/xagents/{xagent_id}/logs")
+    @app.api_route("/xagents/{xagent_id}/logs", methods=["GET", "HEAD"])
     async def get_agent_logs(
         xagent_id: str,
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        request: Request,
+        response: Response,
+        tail: Optional[int] = Query(None, ge=1, description="Only return the last N lines"),
+        user_id: str = Depends(require_xagent_owner)
     ):
         """Get logs directly from filesystem to avoid logging feedback loops."""
-        if not x_user_id:
-            raise HTTPException(status_code=401, detail="User ID required")
-        
         try:
             # Access logs directly from filesystem
             log_file = get_project_path(xagent_id) / "logs" / "project.log"
             
-            if not log_file.exists():
+            etag = await _stat_etag(log_file)
+            if _not_modified(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            if request.method == "HEAD":
+                return Response(headers={"ETag": etag} if etag else None)
+            
+            if etag is None:
                 return {"logs": []}  # Return empty if no logs yet
+            response.headers["ETag"] = etag
             
             # Read log content as raw lines (frontend expects strings for .match())
-            logs = []
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:  # Skip empty lines
-                        logs.append(line)
+            if tail is not None:
+                return {"logs": await asyncio.to_thread(_tail_lines, log_file, tail)}
+            
+            # Read in one call; aiofiles line iteration costs a thread hop per line
+            async with aiofiles.open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                content = await f.read()
+            logs = [line.strip() for line in content.splitlines() if line.strip()]
             
             return {"logs": logs}
                 
@@ -408,7 +559,7 @@ def create_app() -> FastAPI:
     async def stream_agent_events(
         xagent_id: str,
         user_id: str,  # Required query parameter for SSE
-        x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
     ):
         """Stream real-time events for an XAgent."""
         logger.info(f"[API] GET /xagents/{xagent_id}/stream - User: {user_id} establishing SSE connection")
@@ -417,20 +568,21 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=401, detail="User ID required")
         
         try:
-            # Verify XAgent exists
-            await xagent_service.get(xagent_id)
+            # Verify XAgent exists and belongs to the user
+            await xagent_service.get_authorized(user_id, xagent_id)
             logger.info(f"[API] SSE connection authorized for xagent {xagent_id}")
             
             # Stream events
             async def event_generator():
                 logger.info(f"[API] Starting event stream for xagent {xagent_id}")
                 event_count = 0
-                async for event in event_stream_manager.stream_events(xagent_id):
+                async for event in event_stream_manager.stream_events(xagent_id, last_event_id):
                     event_count += 1
-                    logger.debug(f"[API] Yielding event #{event_count} for xagent {xagent_id}: {event.get('event')}")
+                    logger.debug(f"[API] Yielding event #{event_count} for xagent {xagent_id}")
                     yield event
             
-            return EventSourceResponse(event_generator())
+            # Drop stalled clients instead of letting a slow socket block the stream
+            return EventSourceResponse(event_generator(), send_timeout=5)
             
         except AgentNotFoundError:
             raise HTTPException(status_code=404, detail="XAgent not found")
@@ -6,9 +6,13 @@ This keeps the framework layer pure and user-agnostic.
 """
 
 import asyncio
+import os
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING, Dict, Any
+from typing import List, Optional, TYPE_CHECKING, Dict, Any, Tuple
 from datetime import datetime
+
+import orjson
+
 from ..storage.factory import ProjectStorageFactory
 from ..storage.interfaces import FileStorage
 from ..utils.logger import get_logger
@@ -16,6 +20,7 @@ from .models import ProjectRegistryInfo
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
+    from aiosqlite import Connection
 
 # Optional Redis support
 try:
@@ -25,9 +30,29 @@ except ImportError:
     redis = None
     HAS_REDIS = False
 
+# Optional SQLite support
+try:
+    import aiosqlite
+    HAS_AIOSQLITE = True
+except ImportError:
+    aiosqlite = None
+    HAS_AIOSQLITE = False
+
 logger = get_logger(__name__)
 
 
+def _apply_user_op(user_data: dict, op: dict) -> None:
+    """Apply one FileRegistry log record to parsed user data; replaying a record twice is harmless"""
+    projects = user_data.setdefault("projects", [])
+    project_id = op["project"]["project_id"] if op["op"] == "add" else op["project_id"]
+    projects[:] = [
+        p for p in projects
+        if (p.get("project_id") if isinstance(p, dict) else p) != project_id
+    ]
+    if op["op"] == "add":
+        projects.append(op["project"])
+
+
 class Registry:
     """Abstract base class for user-project indexing"""
     
@@ -35,6 +60,11 @@ class Registry:
         """Add a project to a user's index"""
         raise NotImplementedError
     
+    async def add_projects(self, user_id: str, projects: List[Tuple[str, Optional[str]]]) -> None:
+        """Add several (project_id, config_path) entries to a user's index"""
+        for project_id, config_path in projects:
+            await self.add_project(user_id, project_id, config_path)
+    
     async def remove_project(self, user_id: str, project_id: str) -> None:
         """Remove a project from a user's index"""
         raise NotImplementedError
@@ -54,10 +84,23 @@ class Registry:
     async def get_project_info(self, project_id: str) -> Optional[ProjectRegistryInfo]:
         """Get project information including config_path"""
         raise NotImplementedError
+    
+    async def close(self) -> None:
+        """Release any connections held by the registry"""
 
 
 class FileRegistry(Registry):
-    """File-based implementation of user-project index"""
+    """
+    File-based implementation of user-project index.
+    
+    Each user has a <user_id>.json snapshot plus a <user_id>.log of project
+    additions and removals appended since. The log is folded back into the
+    snapshot once it outgrows it, so a change costs one appended line rather
+    than a rewrite of every project the user has.
+    
+    Parsed user data is cached in memory and revalidated with a stat, so
+    lookups only re-read the files after another process has changed them.
+    """
     
     def __init__(self, users_path: Optional[Path] = None):
         """
@@ -73,33 +116,69 @@ class FileRegistry(Registry):
         # Use FileStorage abstraction instead of direct file manipulation
         self.storage: FileStorage = ProjectStorageFactory.create_file_storage(users_path)
         self._lock = asyncio.Lock()
+        # user_id -> ((snapshot stamp, log stamp), parsed user data)
+        self._user_cache: Dict[str, Tuple[tuple, dict]] = {}
+        # user_id -> (projects in the snapshot, records in the log)
+        self._log_counts: Dict[str, Tuple[int, int]] = {}
+        # project_id -> owner, built on the first owner lookup
+        self._owners: Optional[Dict[str, str]] = None
     
     def _get_user_file(self, user_id: str) -> str:
         """Get the file path for a user"""
         return f"{user_id}.json"
     
-
+    def _get_log_file(self, user_id: str) -> str:
+        """Get the append-only change log path for a user"""
+        return f"{user_id}.log"
+    
+    async def _file_stamp(self, user_file: str) -> Optional[Tuple[datetime, int]]:
+        """Get the (mtime, size) stamp used to spot external writes"""
+        info = await self.storage.get_info(user_file)
+        return (info.modified_at, info.size) if info else None
     
     async def _read_user_data(self, user_id: str) -> dict:
-        """Read user data from file"""
+        """Read the user's snapshot and replay their log, or use the cache if neither changed"""
         user_file = self._get_user_file(user_id)
+        log_file = self._get_log_file(user_id)
         
-        if not await self.storage.exists(user_file):
+        stamp = (await self._file_stamp(user_file), await self._file_stamp(log_file))
+        if stamp == (None, None):
+            self._user_cache.pop(user_id, None)
+            self._log_counts.pop(user_id, None)
             return {
                 "user_id": user_id, 
                 "projects": [],
                 "created_at": datetime.now().isoformat()
             }
         
+        cached = self._user_cache.get(user_id)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        
         try:
-            data = await self.storage.read_json(user_file)
+            data = await self.storage.read_json(user_file) if stamp[0] else None
             if not data:
-                return {
+                data = {
                     "user_id": user_id, 
                     "projects": [],
                     "created_at": datetime.now().isoformat()
                 }
             
+            snapshot_len = len(data.get("projects", []))
+            log_len = 0
+            if stamp[1]:
+                for line in (await self.storage.read_text(log_file)).splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        _apply_user_op(data, orjson.loads(line))
+                        log_len += 1
+                    except (orjson.JSONDecodeError, KeyError) as e:
+                        # e.g. a line torn by a crash mid-append
+                        logger.warning(f"Skipping bad log record for {user_id}: {e}")
+            
+            self._user_cache[user_id] = (stamp, data)
+            self._log_counts[user_id] = (snapshot_len, log_len)
             return data
         except Exception as e:
             logger.error(f"Failed to read user data for {user_id}: {e}")
@@ -110,55 +189,120 @@ class FileRegistry(Registry):
             }
     
     async def _write_user_data(self, user_id: str, data: dict) -> None:
-        """Write user data to file"""
+        """Write a full snapshot of the user's data and drop the log it replaces"""
         user_file = self._get_user_file(user_id)
+        log_file = self._get_log_file(user_id)
         data["updated_at"] = datetime.now().isoformat()
         
         try:
             result = await self.storage.write_json(user_file, data)
             if not result.success:
                 raise Exception(f"Failed to write user data: {result.error}")
+            # Replaying a leftover log after a crash here is harmless
+            if await self.storage.exists(log_file):
+                await self.storage.delete(log_file)
         except Exception as e:
+            # The cached dict may already hold the unsaved change
+            self._user_cache.pop(user_id, None)
             logger.error(f"Failed to write user data for {user_id}: {e}")
             raise
+        
+        self._user_cache[user_id] = ((await self._file_stamp(user_file), await self._file_stamp(log_file)), data)
+        self._log_counts[user_id] = (len(data.get("projects", [])), 0)
     
-
+    async def _append_user_ops(self, user_id: str, user_data: dict, ops: List[dict]) -> None:
+        """Record changes already applied to user_data, compacting once the log outgrows the snapshot"""
+        snapshot_len, log_len = self._log_counts.get(user_id, (0, 0))
+        if log_len + len(ops) > 2 * snapshot_len:
+            await self._write_user_data(user_id, user_data)
+            return
+        
+        user_file = self._get_user_file(user_id)
+        log_file = self._get_log_file(user_id)
+        user_data["updated_at"] = datetime.now().isoformat()
+        
+        try:
+            lines = "".join(orjson.dumps(op).decode() + "\n" for op in ops)
+            result = await self.storage.append_text(log_file, lines)
+            if not result.success:
+                raise Exception(f"Failed to append user log: {result.error}")
+        except Exception as e:
+            self._user_cache.pop(user_id, None)
+            logger.error(f"Failed to append user log for {user_id}: {e}")
+            raise
+        
+        self._user_cache[user_id] = ((await self._file_stamp(user_file), await self._file_stamp(log_file)), user_data)
+        self._log_counts[user_id] = (snapshot_len, log_len + len(ops))
+    
+    async def _build_owner_index(self) -> Dict[str, str]:
+        """Scan every user file and map each project to its owner"""
+        owners: Dict[str, str] = {}
+        try:
+            user_files_info = await self.storage.list_directory(".")
+        except Exception as e:
+            logger.error(f"Failed to list user files: {e}")
+            return owners
+        
+        # A user may so far have only a log, only a snapshot, or both
+        user_ids = {
+            Path(file_info.path).stem
+            for file_info in user_files_info
+            if Path(file_info.path).suffix in (".json", ".log")
+            and file_info.path != "_project_index.json"  # Skip the old index file
+        }
+        
+        for user_id in sorted(user_ids):
+            try:
+                user_data = await self._read_user_data(user_id)
+                for project in user_data.get("projects", []):
+                    project_id = project.get("project_id") if isinstance(project, dict) else project
+                    if project_id:
+                        owners[project_id] = user_data["user_id"]
+            except Exception as e:
+                logger.warning(f"Failed to read user data for {user_id}: {e}")
+                continue
+        
+        self._owners = owners
+        return owners
     
     async def add_project(self, user_id: str, project_id: str, config_path: Optional[str] = None) -> None:
         """Add a project to a user's index"""
+        await self.add_projects(user_id, [(project_id, config_path)])
+    
+    async def add_projects(self, user_id: str, projects: List[Tuple[str, Optional[str]]]) -> None:
+        """Add several projects to a user's index with a single read and a single write"""
         async with self._lock:
             user_data = await self._read_user_data(user_id)
+            user_projects = user_data.setdefault("projects", [])
+            # Handle both the old string format and the object format
+            known = {p.get("project_id") if isinstance(p, dict) else p for p in user_projects}
             
-            # Check if project already exists
-            existing_project = None
-            for project in user_data.get("projects", []):
-                if isinstance(project, dict) and project.get("project_id") == project_id:
-                    existing_project = project
-                    break
-                elif isinstance(project, str) and project == project_id:
-                    # Convert old string format to new object format
-                    existing_project = {"project_id": project_id}
-                    break
-            
-            if not existing_project:
-                if "projects" not in user_data:
-                    user_data["projects"] = []
-                
-                # Preserve existing created_at if project already exists
-                created_at = existing_project.get("created_at") if existing_project else datetime.now().isoformat()
-                
+            # One timestamp per write, so a new project's created_at and updated_at agree
+            now = datetime.now().isoformat()
+            ops = []
+            for project_id, config_path in projects:
+                if project_id in known:
+                    continue
+                known.add(project_id)
                 project_obj = {
                     "project_id": project_id,
                     "user_id": user_id,
                     "config_path": config_path,
-                    "created_at": created_at,
-                    "updated_at": datetime.now().isoformat()
+                    "created_at": now,
+                    "updated_at": now
                 }
-                
-                user_data["projects"].append(project_obj)
-                await self._write_user_data(user_id, user_data)
-                
-                logger.info(f"Added project {project_id} to user {user_id}")
+                user_projects.append(project_obj)
+                ops.append({"op": "add", "project": project_obj})
+            
+            if not ops:
+                return
+            
+            await self._append_user_ops(user_id, user_data, ops)
+            if self._owners is not None:
+                for op in ops:
+                    self._owners[op["project"]["project_id"]] = user_id
+            
+            logger.info(f"Added projects {[op['project']['project_id'] for op in ops]} to user {user_id}")
     
     async def remove_project(self, user_id: str, project_id: str) -> None:
         """Remove a project from a user's index"""
@@ -174,8 +318,12 @@ class FileRegistry(Registry):
                 elif isinstance(project, str) and project == project_id:
                     projects.pop(i)
                     break
+            else:
+                return
             
-            await self._write_user_data(user_id, user_data)
+            await self._append_user_ops(user_id, user_data, [{"op": "remove", "project_id": project_id}])
+            if self._owners is not None and self._owners.get(project_id) == user_id:
+                del self._owners[project_id]
             logger.info(f"Removed project {project_id} from user {user_id}")
     
     async def get_user_projects(self, user_id: str) -> List[str]:
@@ -201,29 +349,15 @@ class FileRegistry(Registry):
     async def get_project_owner(self, project_id: str) -> Optional[str]:
         """Get the owner of a project"""
         try:
-            # List all user files and search for the project
-            user_files_info = await self.storage.list_directory(".")
-            
-            for file_info in user_files_info:
-                user_file = file_info.path
-                if not user_file.endswith(".json") or user_file == "_project_index.json":  # Skip the old index file
-                    continue
-                
-                try:
-                    user_data = await self.storage.read_json(user_file)
-                    if user_data and "projects" in user_data:
-                        # Check if project_id exists in the projects list
-                        projects = user_data["projects"]
-                        for project in projects:
-                            if isinstance(project, dict) and project.get("project_id") == project_id:
-                                return user_data["user_id"]
-                            elif isinstance(project, str) and project == project_id:
-                                return user_data["user_id"]
-                except Exception as e:
-                    logger.warning(f"Failed to read user file {user_file}: {e}")
-                    continue
+            if self._owners is not None:
+                owner = self._owners.get(project_id)
+                # Confirm against the (stat-validated) user file in case it changed on disk
+                if owner is not None and project_id in await self.get_user_projects(owner):
+                    return owner
             
-            return None
+            # Unknown or stale: rescan, which also picks up projects added by other processes
+            owners = await self._build_owner_index()
+            return owners.get(project_id)
             
         except Exception as e:
             logger.error(f"Failed to get project owner for {project_id}: {e}")
@@ -281,43 +415,58 @@ class RedisRegistry(Registry):
         if self._redis is None:
             if not HAS_REDIS:
                 raise ImportError("Redis is not available. Install with: pip install redis")
-            self._redis = redis.from_url(self.redis_url)
+            # Decode to str on the connection instead of per value at every call site
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
         return self._redis
     
     async def add_project(self, user_id: str, project_id: str, config_path: Optional[str] = None) -> None:
         """Add a project to a user's index"""
         r = await self._get_redis()
         
-        # Add to user's project list
-        await r.sadd(f"user:{user_id}:projects", project_id)
-        
-        # Store project info
-        project_info = {
-            "user_id": user_id,
-            "config_path": config_path,
-            "created_at": datetime.now().isoformat()
-        }
-        await r.hset(f"project:{project_id}", mapping=project_info)
+        # Send both writes in one round trip, applied together
+        async with r.pipeline() as pipe:
+            self._queue_add(pipe, user_id, project_id, config_path, datetime.now().isoformat())
+            await pipe.execute()
         
         logger.info(f"Added project {project_id} to user {user_id} in Redis")
     
+    async def add_projects(self, user_id: str, projects: List[Tuple[str, Optional[str]]]) -> None:
+        """Add several projects to a user's index in one round trip"""
+        r = await self._get_redis()
+        now = datetime.now().isoformat()
+        async with r.pipeline() as pipe:
+            for project_id, config_path in projects:
+                self._queue_add(pipe, user_id, project_id, config_path, now)
+            await pipe.execute()
+        
+        logger.info(f"Added {len(projects)} projects to user {user_id} in Redis")
+    
+    @staticmethod
+    def _queue_add(pipe, user_id: str, project_id: str, config_path: Optional[str], created_at: str) -> None:
+        """Queue the writes that register one project on a pipeline"""
+        # Store project info; Redis rejects None values, so a missing config_path is left out
+        project_info = {"user_id": user_id, "created_at": created_at}
+        if config_path is not None:
+            project_info["config_path"] = config_path
+        pipe.sadd(f"user:{user_id}:projects", project_id)
+        pipe.hset(f"project:{project_id}", mapping=project_info)
+    
     async def remove_project(self, user_id: str, project_id: str) -> None:
         """Remove a project from a user's index"""
         r = await self._get_redis()
         
-        # Remove from user's project list
-        await r.srem(f"user:{user_id}:projects", project_id)
-        
-        # Remove project info
-        await r.delete(f"project:{project_id}")
+        # Remove from user's project list and drop project info in one round trip
+        async with r.pipeline() as pipe:
+            pipe.srem(f"user:{user_id}:projects", project_id)
+            pipe.delete(f"project:{project_id}")
+            await pipe.execute()
         
         logger.info(f"Removed project {project_id} from user {user_id} in Redis")
     
     async def get_user_projects(self, user_id: str) -> List[str]:
         """Get all project IDs for a user"""
         r = await self._get_redis()
-        projects = await r.smembers(f"user:{user_id}:projects")
-        return [p.decode() if isinstance(p, bytes) else p for p in projects]
+        return list(await r.smembers(f"user:{user_id}:projects"))
     
     async def user_owns_project(self, user_id: str, project_id: str) -> bool:
         """Check if a user owns a specific project"""
@@ -327,26 +476,22 @@ class RedisRegistry(Registry):
     async def get_project_owner(self, project_id: str) -> Optional[str]:
         """Get the owner of a project"""
         r = await self._get_redis()
-        user_id = await r.hget(f"project:{project_id}", "user_id")
-        return user_id.decode() if user_id and isinstance(user_id, bytes) else user_id
+        return await r.hget(f"project:{project_id}", "user_id")
     
     async def get_project_info(self, project_id: str) -> Optional[ProjectRegistryInfo]:
         """Get project information including config_path"""
         r = await self._get_redis()
-        project_data = await r.hgetall(f"project:{project_id}")
+        user_id, config_path, created_at = await r.hmget(
+            f"project:{project_id}", "user_id", "config_path", "created_at"
+        )
         
-        if not project_data:
+        if not user_id:
             return None
         
-        # Convert bytes to strings
-        data = {k.decode() if isinstance(k, bytes) else k: 
-                v.decode() if isinstance(v, bytes) else v 
-                for k, v in project_data.items()}
-        
         return ProjectRegistryInfo(
-            user_id=data["user_id"],
-            config_path=data.get("config_path"),
-            created_at=datetime.fromisoformat(data["created_at"])
+            user_id=user_id,
+            config_path=config_path,
+            created_at=datetime.fromisoformat(created_at)
         )
     
     async def close(self):
@@ -356,8 +501,184 @@ class RedisRegistry(Registry):
             self._redis = None
 
 
+class SQLiteRegistry(Registry):
+    """
+    SQLite-based implementation of user-project index.
+    
+    Ownership checks and project lookups are indexed B-tree queries over a
+    single long-lived connection, instead of reading and rescanning per-user
+    JSON files on every request. A new database imports the projects of an
+    existing FileRegistry once, so switching backends keeps ownership.
+    """
+    
+    # Bumped in PRAGMA user_version once the file registry has been imported
+    SCHEMA_VERSION = 1
+    
+    def __init__(self, db_path: Optional[Path] = None, users_path: Optional[Path] = None):
+        """
+        Initialize SQLite registry.
+        
+        Args:
+            db_path: Path to the database file. Defaults to {base_path}/registry.db
+            users_path: FileRegistry directory to import from. Defaults to {base_path}/users
+        """
+        if db_path is None or users_path is None:
+            from ..utils.paths import get_base_path
+            db_path = db_path or get_base_path() / "registry.db"
+            users_path = users_path or get_base_path() / "users"
+        self.db_path = db_path
+        self.users_path = users_path
+        self._db: Optional['Connection'] = None
+        self._lock = asyncio.Lock()
+    
+    async def _get_db(self) -> 'Connection':
+        """Get the database connection, creating the schema on first use"""
+        if self._db is None:
+            async with self._lock:
+                if self._db is None:
+                    if not HAS_AIOSQLITE:
+                        raise ImportError("aiosqlite is not available. Install with: pip install aiosqlite")
+                    db = await aiosqlite.connect(self.db_path)
+                    await db.execute("PRAGMA journal_mode=WAL")
+                    await db.execute("PRAGMA synchronous=NORMAL")
+                    await db.execute(
+                        "CREATE TABLE IF NOT EXISTS user_projects ("
+                        "project_id TEXT PRIMARY KEY, "
+                        "user_id TEXT NOT NULL, "
+                        "config_path TEXT, "
+                        "created_at TEXT NOT NULL)"
+                    )
+                    await db.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_user_projects_user_id ON user_projects (user_id)"
+                    )
+                    async with db.execute("PRAGMA user_version") as cursor:
+                        (version,) = await cursor.fetchone()
+                    if version < self.SCHEMA_VERSION:
+                        rows = await asyncio.to_thread(self._read_file_registry)
+                        await db.executemany(
+                            "INSERT OR IGNORE INTO user_projects (project_id, user_id, config_path, created_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            rows,
+                        )
+                        await db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                        if rows:
+                            logger.info(f"Imported {len(rows)} projects from {self.users_path} into SQLite")
+                    await db.commit()
+                    self._db = db
+        return self._db
+    
+    def _read_file_registry(self) -> List[Tuple[str, str, Optional[str], str]]:
+        """Collect (project_id, user_id, config_path, created_at) rows from FileRegistry user files"""
+        rows = []
+        if not self.users_path.is_dir():
+            return rows
+        user_ids = {
+            path.stem for path in self.users_path.iterdir()
+            if path.suffix in (".json", ".log") and path.name != "_project_index.json"  # Skip the old index file
+        }
+        for user_id in sorted(user_ids):
+            snapshot = self.users_path / f"{user_id}.json"
+            log = self.users_path / f"{user_id}.log"
+            try:
+                user_data = orjson.loads(snapshot.read_bytes()) if snapshot.exists() else {}
+                if log.exists():
+                    for line in log.read_bytes().splitlines():
+                        if line.strip():
+                            _apply_user_op(user_data, orjson.loads(line))
+            except (OSError, orjson.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Failed to read user data for {user_id}: {e}")
+                continue
+            user_id = user_data.get("user_id", user_id)
+            for project in user_data.get("projects", []):
+                if isinstance(project, str):
+                    project = {"project_id": project}
+                created_at = project.get("created_at") or project.get("updated_at") or datetime.now().isoformat()
+                rows.append((project["project_id"], user_id, project.get("config_path"), created_at))
+        return rows
+    
+    async def add_project(self, user_id: str, project_id: str, config_path: Optional[str] = None) -> None:
+        """Add a project to a user's index"""
+        db = await self._get_db()
+        await db.execute(
+            "INSERT OR IGNORE INTO user_projects (project_id, user_id, config_path, created_at) VALUES (?, ?, ?, ?)",
+            (project_id, user_id, config_path, datetime.now().isoformat()),
+        )
+        await db.commit()
+        logger.info(f"Added project {project_id} to user {user_id} in SQLite")
+    
+    async def add_projects(self, user_id: str, projects: List[Tuple[str, Optional[str]]]) -> None:
+        """Add several projects to a user's index in one transaction"""
+        db = await self._get_db()
+        now = datetime.now().isoformat()
+        await db.executemany(
+            "INSERT OR IGNORE INTO user_projects (project_id, user_id, config_path, created_at) VALUES (?, ?, ?, ?)",
+            [(project_id, user_id, config_path, now) for project_id, config_path in projects],
+        )
+        await db.commit()
+        logger.info(f"Added {len(projects)} projects to user {user_id} in SQLite")
+    
+    async def remove_project(self, user_id: str, project_id: str) -> None:
+        """Remove a project from a user's index"""
+        db = await self._get_db()
+        await db.execute(
+            "DELETE FROM user_projects WHERE project_id = ? AND user_id = ?", (project_id, user_id)
+        )
+        await db.commit()
+        logger.info(f"Removed project {project_id} from user {user_id} in SQLite")
+    
+    async def get_user_projects(self, user_id: str) -> List[str]:
+        """Get all project IDs for a user"""
+        db = await self._get_db()
+        async with db.execute(
+            "SELECT project_id FROM user_projects WHERE user_id = ? ORDER BY rowid", (user_id,)
+        ) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+    
+    async def user_owns_project(self, user_id: str, project_id: str) -> bool:
+        """Check if a user owns a specific project"""
+        db = await self._get_db()
+        async with db.execute(
+            "SELECT 1 FROM user_projects WHERE project_id = ? AND user_id = ?", (project_id, user_id)
+        ) as cursor:
+            return await cursor.fetchone() is not None
+    
+    async def get_project_owner(self, project_id: str) -> Optional[str]:
+        """Get the owner of a project"""
+        db = await self._get_db()
+        async with db.execute(
+            "SELECT user_id FROM user_projects WHERE project_id = ?", (project_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+    
+    async def get_project_info(self, project_id: str) -> Optional[ProjectRegistryInfo]:
+        """Get project information including config_path"""
+        db = await self._get_db()
+        async with db.execute(
+            "SELECT user_id, config_path, created_at FROM user_projects WHERE project_id = ?", (project_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        return ProjectRegistryInfo(
+            user_id=row[0],
+            config_path=row[1],
+            created_at=datetime.fromisoformat(row[2])
+        )
+    
+    async def close(self):
+        """Close the database connection"""
+        if self._db:
+            await self._db.close()
+            self._db = None
+
+
 def get_project_registry() -> Registry:
-    """Get the project registry instance"""
-    # For now, use file-based registry
-    # In production, you might want to use Redis or a database
+    """
+    Get the project registry instance.
+    
+    The backend is chosen with VIBEX_REGISTRY_BACKEND: "file" (default) or "sqlite".
+    """
+    if os.getenv("VIBEX_REGISTRY_BACKEND", "file").lower() == "sqlite":
+        return SQLiteRegistry()
     return FileRegistry()
\ No newline at end of file
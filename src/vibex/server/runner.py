@@ -0,0 +1,75 @@
+"""
+Task Runner
+
+Runs XAgent work (chat turns and the task execution they trigger) as tracked
+background tasks instead of inside request handlers.
+"""
+
+import asyncio
+import os
+from typing import Any, Coroutine, Dict, Set, TypeVar
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class TaskRunner:
+    """
+    Executes XAgent work on dedicated asyncio tasks with bounded concurrency.
+    
+    Work is decoupled from the HTTP request that started it: a client
+    disconnect doesn't cancel a multi-minute agent loop, while deleting the
+    XAgent does. A semaphore caps how many runs execute at once so long
+    agent loops can't monopolize the worker serving API and SSE traffic.
+    """
+    
+    def __init__(self, max_parallel: int = 4):
+        self._semaphore = asyncio.Semaphore(max_parallel)
+        self._tasks: Dict[str, Set[asyncio.Task]] = {}
+    
+    def submit(self, xagent_id: str, coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+        """Schedule work for an XAgent and return the tracking task."""
+        task = asyncio.create_task(self._run(coro), name=f"xagent-{xagent_id}")
+        self._tasks.setdefault(xagent_id, set()).add(task)
+        task.add_done_callback(lambda t: self._discard(xagent_id, t))
+        return task
+    
+    async def run(self, xagent_id: str, coro: Coroutine[Any, Any, T]) -> T:
+        """Schedule work and wait for its result; cancelling the caller leaves the work running."""
+        return await asyncio.shield(self.submit(xagent_id, coro))
+    
+    async def cancel(self, xagent_id: str) -> int:
+        """Cancel all running work for an XAgent and wait for it to stop."""
+        tasks = self._tasks.pop(xagent_id, set())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"Cancelled {len(tasks)} run(s) for XAgent {xagent_id}")
+        return len(tasks)
+    
+    def running(self, xagent_id: str) -> int:
+        """Get the number of in-flight runs for an XAgent."""
+        return len(self._tasks.get(xagent_id, ()))
+    
+    async def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        try:
+            async with self._semaphore:
+                return await coro
+        finally:
+            # Closes the coroutine if it was cancelled before acquiring a slot
+            coro.close()
+    
+    def _discard(self, xagent_id: str, task: asyncio.Task) -> None:
+        tasks = self._tasks.get(xagent_id)
+        if tasks is not None:
+            tasks.discard(task)
+            if not tasks:
+                del self._tasks[xagent_id]
+
+
+# Global runner shared by all requests in this worker
+task_runner = TaskRunner(max_parallel=int(os.getenv("VIBEX_MAX_PARALLEL_RUNS", "4")))
@@ -5,18 +5,26 @@ Manages XAgent instances and provides the service interface for the REST API.
 XAgent is the primary interface - each instance represents exactly one project.
 """
 
-import json
 import asyncio
-from typing import Dict, Optional, List, Any
+import os
+import shutil
+import time
+import uuid
+import aiofiles
+from typing import Dict, Iterable, Optional, List, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
 from vibex.core.xagent import XAgent
+from vibex.core.project import PROJECT_STATE_FILE, decode_project_state
 from vibex.utils.logger import get_logger
 from vibex.core.exceptions import AgentNotFoundError
 from .registry import get_project_registry
-from vibex.utils.paths import get_project_path
-from .models import ProjectInfo, MessageInfo, ArtifactInfo, MessageResponse
+from .runner import task_runner
+from .streaming import event_stream_manager
+from vibex.utils.paths import get_base_path, get_project_path
+from vibex.storage.chat_history import ChatHistoryStorage, chat_history_manager
+from .models import ProjectInfo, MessageInfo, ArtifactInfo, MessageResponse, XAgentResponse, TaskStatus
 
 logger = get_logger(__name__)
 
@@ -24,6 +32,23 @@ logger = get_logger(__name__)
 # In a production environment, this would be replaced with a persistent store.
 active_xagents: Dict[str, XAgent] = {}
 
+# How long a user's derived project list may be served from memory (seconds)
+LIST_CACHE_TTL = 2.0
+
+
+def derive_status(task_statuses: Iterable[str]) -> TaskStatus:
+    """Derive an XAgent's overall status from the statuses of its plan tasks."""
+    statuses = list(task_statuses)
+    if not statuses:
+        return TaskStatus.PENDING
+    if "failed" in statuses:
+        return TaskStatus.FAILED
+    if all(status == "completed" for status in statuses):
+        return TaskStatus.COMPLETED
+    if "running" in statuses:
+        return TaskStatus.RUNNING
+    return TaskStatus.PENDING
+
 
 class XAgentService:
     """
@@ -35,6 +60,18 @@ class XAgentService:
 
     def __init__(self):
         self.registry = get_project_registry()
+        self.runner = task_runner
+        # user_id -> (expires_at, projects); frontends poll the list every few seconds
+        self._list_cache: Dict[str, Tuple[float, List[ProjectInfo]]] = {}
+        # Background removals of deleted project trees
+        self._cleanup_tasks: set = set()
+
+    def _invalidate_list_cache(self, user_id: Optional[str] = None) -> None:
+        """Drop cached project lists for one user, or for everyone if unknown."""
+        if user_id:
+            self._list_cache.pop(user_id, None)
+        else:
+            self._list_cache.clear()
 
     async def create(
         self,
@@ -64,11 +101,13 @@ class XAgentService:
             xagent = project.x_agent
             
             # Store the active XAgent instance
+            xagent.user_id = user_id
             active_xagents[xagent.project_id] = xagent
             
             # Track user-project relationship in registry
             if user_id:
                 await self.registry.add_project(user_id, xagent.project_id, config_path)
+                self._invalidate_list_cache(user_id)
             
             logger.info(f"XAgent {xagent.project_id} created successfully.")
             return xagent
@@ -107,6 +146,7 @@ class XAgentService:
             
             project = await resume_project(xagent_id, config_path)
             xagent = project.x_agent
+            xagent.user_id = project_info.user_id if project_info else None
             
             # Cache it for future requests
             active_xagents[xagent_id] = xagent
@@ -118,25 +158,96 @@ class XAgentService:
             logger.error(f"Failed to lazy load XAgent {xagent_id}: {e}")
             raise AgentNotFoundError(f"XAgent {xagent_id} not found")
 
+    async def get_authorized(self, user_id: str, xagent_id: str) -> XAgent:
+        """
+        Get an XAgent instance on behalf of a user.
+        
+        Raises AgentNotFoundError unless the registry records the user as the
+        owner, so foreign and unregistered project IDs are indistinguishable
+        from missing ones.
+        """
+        if not await self.verify_ownership(user_id, xagent_id):
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
+        return await self.get(xagent_id)
+
+    async def to_response(self, xagent: XAgent, user_id: str) -> XAgentResponse:
+        """Convert a live XAgent instance to an XAgentResponse DTO."""
+        # Ensure plan is loaded before creating response
+        await xagent._ensure_plan_initialized()
+        
+        tasks = xagent.plan.tasks if xagent.plan else []
+        goal_value = xagent.initial_prompt or ""
+        logger.debug(f"[to_response] XAgent {xagent.project_id} - initial_prompt: '{xagent.initial_prompt}', goal: '{goal_value}'")
+        
+        return XAgentResponse(
+            xagent_id=xagent.project_id,
+            user_id=user_id,
+            status=derive_status(t.status for t in tasks),
+            created_at=datetime.now(),  # TODO: Get actual creation time from XAgent
+            updated_at=datetime.now(),  # TODO: Get actual update time from XAgent
+            goal=goal_value,
+            name=getattr(xagent, 'name', f"Project {xagent.project_id}"),
+            config_path=getattr(xagent, 'config_path', None),
+            plan=xagent.plan.model_dump() if xagent.plan else None,
+        )
+
+    async def get_info(self, user_id: str, xagent_id: str) -> XAgentResponse:
+        """
+        Get an XAgent's read-only state without resuming it.
+        
+        Live instances are answered from memory; otherwise the registry entry and
+        the persisted project.json are enough, so no team config, tools or
+        history are loaded for a status lookup.
+        """
+        if xagent_id in active_xagents:
+            return await self.to_response(await self.get_authorized(user_id, xagent_id), user_id)
+        
+        project_info = await self.registry.get_project_info(xagent_id)
+        if not project_info or project_info.user_id != user_id:
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
+        
+        state_file = get_project_path(xagent_id) / PROJECT_STATE_FILE
+        try:
+            async with aiofiles.open(state_file, 'rb') as f:
+                state = decode_project_state(await f.read())
+        except FileNotFoundError:
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
+        
+        plan = state.get("plan")
+        created_at = state.get("created_at")
+        updated_at = state.get("updated_at")
+        # Every field is built with its final type here, so skip pydantic validation
+        return XAgentResponse.model_construct(
+            xagent_id=xagent_id,
+            user_id=user_id,
+            status=derive_status(t.get("status", "pending") for t in (plan or {}).get("tasks", [])),
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+            goal=state.get("goal", ""),
+            name=state.get("name") or f"Project {xagent_id}",
+            config_path=project_info.config_path if project_info else None,
+            plan=plan,
+        )
+
     async def list(self, user_id: str) -> List[ProjectInfo]:
         """
         Get all XAgent instances for a specific user.
         Returns project information including status.
         """
+        cached = self._list_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+        
         project_ids = await self.registry.get_user_projects(user_id)
         projects = []
         
-        for project_id in project_ids:
+        # Probe every project directory in one worker thread instead of a thread hop per check
+        probes = await asyncio.to_thread(_probe_projects, project_ids)
+        
+        for project_id, probe in zip(project_ids, probes):
             try:
-                # Check if project still exists on filesystem
-                project_path = get_project_path(project_id)
-                if project_path.exists():
-                    # Determine status from filesystem
-                    status = "active"
-                    if (project_path / "error.log").exists():
-                        status = "failed"
-                    elif any(project_path.glob("artifacts/*")):
-                        status = "completed"
+                if probe is not None:
+                    status, created_at = probe
                     
                     # Get project info from registry
                     project_info = await self.registry.get_project_info(project_id)
@@ -145,7 +256,7 @@ class XAgentService:
                     projects.append(ProjectInfo(
                         project_id=project_id,
                         status=status,
-                        created_at=datetime.fromtimestamp(project_path.stat().st_ctime),
+                        created_at=datetime.fromtimestamp(created_at),
                         config_path=config_path
                     ))
                 else:
@@ -155,7 +266,8 @@ class XAgentService:
             except Exception as e:
                 logger.error(f"Error checking project {project_id}: {e}")
         
-        return projects
+        self._list_cache[user_id] = (time.monotonic() + LIST_CACHE_TTL, projects)
+        return list(projects)
 
     async def delete(self, xagent_id: str, user_id: Optional[str] = None) -> bool:
         """
@@ -163,25 +275,65 @@ class XAgentService:
         """
         # Verify ownership if user_id provided
         if user_id and not await self.verify_ownership(user_id, xagent_id):
-            raise PermissionError("Access denied")
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
         
-        # Remove from memory
-        if xagent_id in active_xagents:
-            del active_xagents[xagent_id]
+        # Stop any in-flight work before removing it from memory
+        await self.runner.cancel(xagent_id)
+        xagent = active_xagents.pop(xagent_id, None)
+        project = getattr(xagent, "project", None)
+        if project is not None:
+            # A delayed state write would recreate the directory after it is moved away
+            project.cancel_pending_persist()
+        chat_storage = getattr(xagent, "chat_storage", None)
+        if chat_storage is not None:
+            chat_history_manager.release_storage(str(chat_storage.project_path))
+        event_stream_manager.close_stream(xagent_id)
+        self._invalidate_list_cache(user_id)
         
         # Remove from registry
         if user_id:
             await self.registry.remove_project(user_id, xagent_id)
         
-        # Delete project directory
-        import shutil
-        project_path = get_project_path(xagent_id)
-        if project_path.exists():
-            shutil.rmtree(project_path)
+        # Move the project directory aside with one rename and remove the tree in the background
+        trash_path = _trash_root() / f"{xagent_id}-{uuid.uuid4().hex}"
+        try:
+            trash_path.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(get_project_path(xagent_id), trash_path)
+        except FileNotFoundError:
+            pass
+        else:
+            self._remove_in_background(trash_path)
         
         logger.info(f"XAgent {xagent_id} deleted")
         return True
 
+    async def flush_projects(self) -> None:
+        """Write state changes still waiting in live projects' debounce window, e.g. on shutdown."""
+        projects = [
+            project for project in (getattr(xagent, "project", None) for xagent in active_xagents.values())
+            if project is not None
+        ]
+        results = await asyncio.gather(*(project.flush() for project in projects), return_exceptions=True)
+        for project, result in zip(projects, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to flush state for project {project.project_id}: {result}")
+
+    def purge_trash(self) -> None:
+        """Remove project trees left in the trash by deletes that didn't finish, e.g. before a restart."""
+        try:
+            with os.scandir(_trash_root()) as it:
+                leftovers = [Path(entry.path) for entry in it]
+        except FileNotFoundError:
+            return
+        for path in leftovers:
+            self._remove_in_background(path)
+
+    def _remove_in_background(self, path: Path) -> None:
+        """Delete a directory tree in a worker thread without blocking the caller."""
+        task = asyncio.create_task(asyncio.to_thread(shutil.rmtree, path, ignore_errors=True))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+
     def exists(self, xagent_id: str) -> bool:
         """
         Check if an XAgent instance exists.
@@ -201,11 +353,11 @@ class XAgentService:
         # Check if project directory exists
         project_path = get_project_path(xagent_id)
         if not project_path.exists():
-            raise ValueError(f"XAgent {xagent_id} not found")
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
         
         # Verify ownership
         if not await self.verify_ownership(user_id, xagent_id):
-            raise PermissionError("Access denied")
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
         
         return True
 
@@ -218,17 +370,13 @@ class XAgentService:
         
         # Get XAgent with ownership check
         logger.info(f"[CHAT] Getting XAgent for xagent_id: {xagent_id}")
-        x_agent = await self.get(xagent_id)
-        
-        # Verify ownership
-        if not await self.verify_ownership(user_id, xagent_id):
-            raise PermissionError("Access denied")
+        x_agent = await self.get_authorized(user_id, xagent_id)
         
         logger.info(f"[CHAT] X agent retrieved successfully")
         
         # Send message to X agent and get response with mode
         logger.info(f"[CHAT] Calling x_agent.chat() to process message in {mode} mode")
-        response = await x_agent.chat(content, mode=mode)
+        response = await self.runner.run(xagent_id, x_agent.chat(content, mode=mode))
         logger.info(f"[CHAT] Received response from x_agent.chat()")
         
         # Send the actual Message objects via SSE
@@ -261,35 +409,34 @@ class XAgentService:
         logger.info(f"[CHAT] Returning response with message_id: {result.message_id}")
         return result
 
-    async def get_messages(self, user_id: str, xagent_id: str) -> List[MessageInfo]:
+    async def get_messages(
+        self, user_id: str, xagent_id: str, *, since: int = 0, limit: Optional[int] = None
+    ) -> List[MessageInfo]:
         """
-        Get messages for a project.
+        Get messages for a project, optionally a page of `limit` messages starting at index `since`.
         """
         # Verify ownership
         if not await self.verify_ownership(user_id, xagent_id):
-            raise PermissionError("Access denied")
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
         
-        # Read messages from project storage (JSONL format)
-        messages_file = get_project_path(xagent_id) / "history" / "messages.jsonl"
+        # Read messages from project storage (JSONL format, with an offset index for paging)
+        storage = ChatHistoryStorage(str(get_project_path(xagent_id)))
+        records = await asyncio.to_thread(storage.read_records, since, limit)
         messages = []
         
-        if messages_file.exists():
-            with open(messages_file, 'r') as f:
-                for line in f:
-                    if line.strip():  # Skip empty lines
-                        try:
-                            message = json.loads(line)
-                            # Convert to MessageInfo
-                            messages.append(MessageInfo(
-                                message_id=message.get("id", ""),
-                                role=message.get("role", ""),
-                                content=message.get("content", ""),
-                                timestamp=datetime.fromisoformat(message.get("timestamp", datetime.now().isoformat())),
-                                metadata=message.get("metadata", {}),
-                                parts=message.get("parts", None)
-                            ))
-                        except (json.JSONDecodeError, ValueError) as e:
-                            logger.warning(f"Failed to parse message line: {line}, error: {e}")
+        for message in records:
+            try:
+                # Convert to MessageInfo
+                messages.append(MessageInfo(
+                    message_id=message.get("id", ""),
+                    role=message.get("role", ""),
+                    content=message.get("content", ""),
+                    timestamp=datetime.fromisoformat(message.get("timestamp", datetime.now().isoformat())),
+                    metadata=message.get("metadata", {}),
+                    parts=message.get("parts", None)
+                ))
+            except ValueError as e:
+                logger.warning(f"Failed to parse message {message.get('id')}: {e}")
         
         return messages
 
@@ -299,25 +446,86 @@ class XAgentService:
         """
         # Verify ownership
         if not await self.verify_ownership(user_id, xagent_id):
-            raise PermissionError("Access denied")
+            raise AgentNotFoundError(f"XAgent {xagent_id} not found")
         
-        artifacts = []
         artifacts_path = get_project_path(xagent_id) / "artifacts"
+        entries = await asyncio.to_thread(_scan_artifacts, artifacts_path)
         
-        if artifacts_path.exists():
-            for item in artifacts_path.rglob("*"):
-                if item.is_file():
-                    relative_path = item.relative_to(artifacts_path)
-                    # Skip any files under .git
-                    if any(part == ".git" for part in relative_path.parts):
-                        continue
-                    artifacts.append(ArtifactInfo(
-                        path=str(relative_path),
-                        size=item.stat().st_size,
-                        modified_at=datetime.fromtimestamp(item.stat().st_mtime)
-                    ))
-        
-        return artifacts
+        return [
+            ArtifactInfo(path=path, size=size, modified_at=datetime.fromtimestamp(mtime))
+            for path, size, mtime in entries
+        ]
+
+
+def _trash_root() -> Path:
+    """Directory deleted projects are renamed into; on the same filesystem as the projects."""
+    return get_base_path() / ".trash"
+
+
+def _has_entries(directory: Path) -> bool:
+    """Check whether a directory has any entries without listing all of them."""
+    try:
+        with os.scandir(directory) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _probe_project(project_path: Path) -> Optional[Tuple[str, float]]:
+    """
+    Derive (status, ctime) for a project directory, or None if it no longer exists.
+    
+    One scandir of the project directory answers both the error.log and the
+    artifacts checks; the artifacts directory is only opened if it is present.
+    """
+    try:
+        created_at = os.stat(project_path).st_ctime
+        with os.scandir(project_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    
+    if "error.log" in entries:
+        return "failed", created_at
+    artifacts = entries.get("artifacts")
+    if artifacts is not None and artifacts.is_dir() and _has_entries(Path(artifacts.path)):
+        return "completed", created_at
+    return "active", created_at
+
+
+def _probe_projects(project_ids: List[str]) -> List[Optional[Tuple[str, float]]]:
+    """Probe a batch of projects; runs in a worker thread."""
+    return [_probe_project(get_project_path(project_id)) for project_id in project_ids]
+
+
+def _scan_artifacts(artifacts_path: Path) -> List[Tuple[str, int, float]]:
+    """
+    Walk an artifacts directory and return (relative_path, size, mtime) per file.
+    
+    Uses os.scandir so file type comes from the directory entry and each file
+    costs a single stat, and prunes .git directories instead of descending into them.
+    Symlinks are not followed, so a link back up the tree cannot loop the walk.
+    """
+    results: List[Tuple[str, int, float]] = []
+    pending = [("", str(artifacts_path))]
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    relative = f"{prefix}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git":
+                            pending.append((f"{relative}/", entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        results.append((relative, st.st_size, st.st_mtime))
+        except OSError as e:
+            # Vanished or unreadable directories are skipped, not fatal to the listing
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Skipping unreadable artifacts directory {directory}: {e}")
+            continue
+    return results
 
 
 # Dependency injection
@@ -3,93 +3,196 @@ Streaming support for VibeX API
 """
 
 import asyncio
-import json
-from typing import AsyncGenerator, Dict, Any, Optional
+import itertools
+import time
+from collections import deque
+from typing import AsyncGenerator, Deque, Dict, Any, List, Optional, Tuple
 from datetime import datetime
+
+import orjson
+
 from ..utils.logger import get_logger
 from ..core.message import Message
 from ..storage.chat_history import chat_history_manager
 
 logger = get_logger(__name__)
 
+# SSE comment frame sent when a stream has been idle for a keepalive interval
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+# (epoch milliseconds, formatted timestamp) for the most recent event
+_last_timestamp: Tuple[int, str] = (0, "")
+
+
+def _event_timestamp() -> str:
+    """
+    ISO-8601 timestamp for an event payload, at millisecond resolution.
+    
+    Token streaming emits many events per millisecond, so the formatted string
+    is reused until the clock moves on instead of being rebuilt per event.
+    """
+    global _last_timestamp
+    ms = time.time_ns() // 1_000_000
+    if ms != _last_timestamp[0]:
+        _last_timestamp = (ms, datetime.fromtimestamp(ms / 1000).isoformat(timespec="milliseconds"))
+    return _last_timestamp[1]
+
+
+class ProjectChannel:
+    """
+    Fan-out channel for a single project.
+
+    Keeps the most recent SSE frames in a bounded ring buffer and wakes every
+    subscriber through a shared condition, so slow or absent consumers never
+    grow memory and each event is stored once regardless of subscriber count.
+    Event IDs come from a per-channel counter, so they are strictly increasing
+    and map straight onto buffer positions for Last-Event-ID replay.
+    """
+    
+    def __init__(self, maxlen: int = 1024):
+        self.buffer: Deque[Tuple[int, bytes]] = deque(maxlen=maxlen)
+        self.seq = 0
+        self._ids = itertools.count(1)
+        self.condition = asyncio.Condition()
+        self.subscribers = 0
+        # Events published while nobody was listening are delivered to the next subscriber
+        self.idle_since = 0
+        # Monotonic time of the last publish or unsubscribe, for evicting idle channels
+        self.last_active = time.monotonic()
+        
+    async def publish(self, event_type: str, payload: bytes) -> int:
+        """Frame an encoded payload, append it to the buffer and wake all subscribers"""
+        async with self.condition:
+            seq = next(self._ids)
+            frame = b"id: %d\nevent: %s\ndata: %s\n\n" % (seq, event_type.encode(), payload)
+            self.buffer.append((seq, frame))
+            self.seq = seq
+            self.last_active = time.monotonic()
+            self.condition.notify_all()
+        return seq
+    
+    def events_after(self, seq: int) -> List[Tuple[int, bytes]]:
+        """Get buffered frames newer than the given sequence number"""
+        if not self.buffer:
+            return []
+        start = max(seq - self.buffer[0][0] + 1, 0)
+        return list(itertools.islice(self.buffer, start, None))
+    
+    def seq_for_event_id(self, event_id: str) -> Optional[int]:
+        """Map a client's Last-Event-ID to a sequence number, if it belongs to this channel"""
+        try:
+            seq = int(event_id)
+        except ValueError:
+            return None
+        return seq if 0 <= seq <= self.seq else None
+    
+
 class ProjectEventStream:
-    """Manages event streams for projects"""
+    """
+    Manages event streams for projects.
+    
+    Channels with no subscribers are dropped once they have been idle for
+    `idle_ttl` seconds, which still leaves reconnecting clients time to replay.
+    """
     
-    def __init__(self):
-        self.streams: Dict[str, asyncio.Queue] = {}
+    def __init__(self, buffer_size: int = 1024, keepalive_interval: float = 15.0, idle_ttl: float = 600.0):
+        self.streams: Dict[str, ProjectChannel] = {}
+        self.buffer_size = buffer_size
+        self.keepalive_interval = keepalive_interval
+        self.idle_ttl = idle_ttl
+        self._next_sweep = time.monotonic() + idle_ttl
         
-    def create_stream(self, project_id: str) -> asyncio.Queue:
+    def create_stream(self, project_id: str) -> ProjectChannel:
         """Create a new event stream for a project"""
-        if project_id not in self.streams:
-            self.streams[project_id] = asyncio.Queue()
-        return self.streams[project_id]
+        channel = self.streams.get(project_id)
+        if channel is None:
+            self._evict_idle()
+            channel = self.streams[project_id] = ProjectChannel(self.buffer_size)
+        return channel
+    
+    def _evict_idle(self) -> None:
+        """Drop unsubscribed channels idle past the TTL; sweeps at most once per TTL."""
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.idle_ttl
+        expired = [
+            project_id for project_id, channel in self.streams.items()
+            if not channel.subscribers and now - channel.last_active > self.idle_ttl
+        ]
+        for project_id in expired:
+            del self.streams[project_id]
+        if expired:
+            logger.debug(f"[SSE] Evicted {len(expired)} idle stream(s)")
         
-    def get_stream(self, project_id: str) -> Optional[asyncio.Queue]:
+    def get_stream(self, project_id: str) -> Optional[ProjectChannel]:
         """Get existing stream for a project"""
         return self.streams.get(project_id)
         
     async def send_event(self, project_id: str, event_type: str, data: Any):
         """Send an event to all listeners of a project"""
-        stream = self.get_stream(project_id)
-        if stream:
-            event = {
-                "id": str(datetime.now().timestamp()),
-                "event": event_type,
-                "data": data,
-                "timestamp": datetime.now().isoformat()
-            }
-            await stream.put(event)
-            logger.debug(f"[SSE] Sent {event_type} event for project {project_id} to stream (queue size: {stream.qsize()})")
-            logger.debug(f"[SSE] Event data: {data}")
-        else:
-            logger.warning(f"[SSE] No stream found for project {project_id}, creating one")
-            self.create_stream(project_id)
-            await self.send_event(project_id, event_type, data)
+        channel = self.create_stream(project_id)
+        # Build the wire frame once; every subscriber forwards the same bytes
+        seq = await channel.publish(event_type, orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS))
+        logger.debug(f"[SSE] Sent {event_type} event #{seq} for project {project_id} to {channel.subscribers} subscriber(s)")
+        logger.debug(f"[SSE] Event data: {data}")
             
-    async def stream_events(self, project_id: str) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream events for a project as dictionaries for EventSourceResponse"""
+    async def stream_events(
+        self, project_id: str, last_event_id: Optional[str] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream events for a project as pre-encoded SSE frames for EventSourceResponse.
+        
+        Replays buffered events after `last_event_id` when a client reconnects,
+        and emits a keepalive comment whenever the stream is idle so proxies
+        don't cut the connection.
+        """
         logger.info(f"[SSE] Starting event stream for task {project_id}")
-        stream = self.create_stream(project_id)
+        channel = self.create_stream(project_id)
         
-        # Check if there are already events in the queue
-        logger.info(f"[SSE] Stream created/retrieved for task {project_id}, current queue size: {stream.qsize()}")
+        last_seq = channel.seq if channel.subscribers else channel.idle_since
+        if last_event_id:
+            replay_from = channel.seq_for_event_id(last_event_id)
+            if replay_from is not None:
+                last_seq = replay_from
+        channel.subscribers += 1
+        logger.info(f"[SSE] Subscribed to task {project_id} at event #{last_seq} ({channel.subscribers} subscriber(s))")
         
         try:
             while True:
-                logger.debug(f"[SSE] Waiting for events on task {project_id} (queue size: {stream.qsize()})")
+                async with channel.condition:
+                    try:
+                        await asyncio.wait_for(
+                            channel.condition.wait_for(lambda: channel.seq > last_seq),
+                            timeout=self.keepalive_interval,
+                        )
+                    except asyncio.TimeoutError:
+                        pending = []
+                    else:
+                        pending = channel.events_after(last_seq)
                 
-                # Add a small timeout to check queue periodically
-                try:
-                    event = await asyncio.wait_for(stream.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    # Check queue size on timeout
-                    logger.debug(f"[SSE] Timeout waiting for events, queue size: {stream.qsize()}")
+                if not pending:
+                    yield KEEPALIVE_FRAME
                     continue
                 
-                logger.debug(f"[SSE] Streaming event for task {project_id}: type={event['event']}, id={event['id']}")
-                logger.debug(f"[SSE] Event content: {event['data']}")
-                
-                # Yield the event as a dictionary
-                # EventSourceResponse needs data as JSON string for proper formatting
-                yield {
-                    "id": event['id'],
-                    "event": event['event'],
-                    "data": json.dumps(event['data'])  # JSON encode the data
-                }
+                for seq, frame in pending:
+                    last_seq = seq
+                    logger.debug(f"[SSE] Streaming event #{seq} for task {project_id}")
+                    yield frame
                 
         except asyncio.CancelledError:
             logger.info(f"[SSE] Stream cancelled for task {project_id}")
             raise
         finally:
-            # Clean up stream
-            if project_id in self.streams:
-                del self.streams[project_id]
-                logger.info(f"[SSE] Cleaned up stream for task {project_id}")
+            channel.subscribers -= 1
+            if not channel.subscribers:
+                channel.idle_since = last_seq
+                channel.last_active = time.monotonic()
+            logger.info(f"[SSE] Unsubscribed from task {project_id} ({channel.subscribers} subscriber(s) left)")
                 
     def close_stream(self, project_id: str):
         """Close and remove a stream"""
-        if project_id in self.streams:
-            del self.streams[project_id]
+        self.streams.pop(project_id, None)
 
 # Global event stream manager
 event_stream_manager = ProjectEventStream()
@@ -129,7 +232,7 @@ async def send_task_update(project_id: str, status: str, result: Optional[Any] =
             "project_id": project_id,
             "status": status,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _event_timestamp()
         }
     )
 
@@ -143,7 +246,7 @@ async def send_artifact_update(project_id: str, artifact_name: str, action: str
             "artifact_name": artifact_name,
             "action": action,  # "created", "updated", "deleted"
             "metadata": metadata or {},
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _event_timestamp()
         }
     )
 
@@ -210,7 +313,7 @@ async def send_tool_call_start(project_id: str, tool_call_id: str, tool_name: st
             "tool_call_id": tool_call_id,
             "tool_name": tool_name,
             "args": args,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _event_timestamp()
         }
     )
 
@@ -224,7 +327,7 @@ async def send_tool_call_result(project_id: str, tool_call_id: str, tool_name: s
             "tool_name": tool_name,
             "result": result,
             "is_error": is_error,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _event_timestamp()
         }
     )
 
@@ -241,7 +344,7 @@ async def send_message_part(project_id: str, message_id: str, part: Any):
         {
             "message_id": message_id,
             "part": part_dict,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _event_timestamp()
         }
     )
 
@@ -253,6 +356,6 @@ async def send_tool_call_delta(project_id: str, tool_call_id: str, args_delta: s
         {
             "tool_call_id": tool_call_id,
             "args_delta": args_delta,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _event_timestamp()
         }
     )
\ No newline at end of file
@@ -11,15 +11,34 @@ Key features:
 
 import json
 import asyncio
+import os
+import struct
+import threading
+import weakref
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+import orjson
+
 from ..core.message import Message, ConversationHistory, TaskStep
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# messages.idx holds one little-endian uint64 byte offset per line of messages.jsonl
+_OFFSET = struct.Struct("<Q")
+
+# One lock per history file, shared by every ChatHistoryStorage pointing at it, so
+# appends and index rebuilds (which run on worker threads) never interleave. Entries
+# are weak: a file's lock goes away once no storage instance for it is alive.
+_history_locks: "weakref.WeakValueDictionary[Path, threading.Lock]" = weakref.WeakValueDictionary()
+
+
+def _history_lock(history_file: Path) -> threading.Lock:
+    """Get the lock guarding a history file and its offset index."""
+    return _history_locks.setdefault(history_file, threading.Lock())
+
 
 class ChatHistoryStorage:
     """Manages chat history persistence for tasks."""
@@ -29,14 +48,13 @@ class ChatHistoryStorage:
         # History folder at same level as artifacts/ and logs/
         self.history_dir = self.project_path / "history"
         self.history_file = self.history_dir / "messages.jsonl"
+        self.index_file = self.history_dir / "messages.idx"
+        self._lock = _history_lock(self.history_file)
 
         
     async def save_message(self, project_id: str, message: Message) -> None:
         """Save a complete message to persistent storage."""
         try:
-            # Ensure history directory exists
-            self.history_dir.mkdir(parents=True, exist_ok=True)
-            
             # Create message record using exact Message structure with parts
             message_record = {
                 "id": message.id,
@@ -48,14 +66,29 @@ class ChatHistoryStorage:
             
             # Append to JSONL file (each line is a JSON object)
             # This supports continuing conversations by appending to existing history
-            with open(self.history_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(message_record) + "\n")
+            line = json.dumps(message_record).encode("utf-8") + b"\n"
+            await asyncio.to_thread(self._append_line, line)
                 
             logger.debug(f"Saved message {message.id} for task {project_id}")
             
         except Exception as e:
             logger.error(f"Failed to save message {message.id} for task {project_id}: {e}")
             
+    def _append_line(self, line: bytes) -> None:
+        """Append one record and its index entry; blocking, so it runs on a worker thread."""
+        # Ensure history directory exists
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            with open(self.history_file, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+            
+            # Record where the line starts so readers can seek straight to a page.
+            # A history written before the index existed is indexed on first read instead.
+            if offset == 0 or self.index_file.exists():
+                with open(self.index_file, "ab") as f:
+                    f.write(_OFFSET.pack(offset))
+    
     async def save_step(self, project_id: str, step: TaskStep) -> None:
         """Save a task step as an assistant message to maintain unified chat history."""
         try:
@@ -134,6 +167,86 @@ class ChatHistoryStorage:
         
         return history
     
+    def read_records(self, since: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read raw message records `since` onwards, at most `limit` of them.
+        
+        Uses the offset index to read only the requested byte range, so a page
+        costs the same however long the history grows. Blocking; call it from
+        a worker thread.
+        """
+        with self._lock:
+            try:
+                size = os.path.getsize(self.history_file)
+            except FileNotFoundError:
+                return []
+            
+            offsets = self._load_offsets(size)
+            if since >= len(offsets):
+                return []
+            end = since + limit if limit is not None else len(offsets)
+            start_byte = offsets[since]
+            end_byte = offsets[end] if end < len(offsets) else size
+            
+            with open(self.history_file, "rb") as f:
+                f.seek(start_byte)
+                chunk = f.read(end_byte - start_byte)
+        
+        records = []
+        for line in chunk.split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Failed to parse message line: {line[:200]!r}, error: {e}")
+        return records
+    
+    def _load_offsets(self, size: int) -> List[int]:
+        """
+        Load the line offset index, rebuilding it if it is missing or stale.
+        
+        Callers must hold the history lock.
+        """
+        try:
+            with open(self.index_file, "rb") as f:
+                data = f.read()
+            offsets = [offset for (offset,) in _OFFSET.iter_unpack(data[:len(data) - len(data) % _OFFSET.size])]
+            if self._index_matches(offsets, size):
+                return offsets
+        except FileNotFoundError:
+            pass
+        
+        offsets = []
+        position = 0
+        with open(self.history_file, "rb") as f:
+            for line in f:
+                if line.strip():
+                    offsets.append(position)
+                position += len(line)
+        temp_file = self.index_file.with_suffix(".idx.tmp")
+        with open(temp_file, "wb") as f:
+            f.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+        os.replace(temp_file, self.index_file)
+        return offsets
+    
+    def _index_matches(self, offsets: List[int], size: int) -> bool:
+        """Check that the last indexed offset starts the final line of the history."""
+        if not offsets:
+            return size == 0
+        last = offsets[-1]
+        if last >= size:
+            return False
+        with open(self.history_file, "rb") as f:
+            f.seek(last - 1 if last else 0)
+            tail = f.read()
+        if last:
+            if tail[:1] != b"\n":
+                return False
+            tail = tail[1:]
+        # Exactly one complete line after the last offset; anything more went unindexed
+        return tail.count(b"\n") == 1 and tail.endswith(b"\n")
+    
     async def clear_history(self, project_id: str) -> None:
         """Clear chat history for a task by removing the entire history file."""
         try:
@@ -141,6 +254,7 @@ class ChatHistoryStorage:
                 # For task-specific history files, simply remove the entire file
                 # Since each task has its own history directory structure
                 self.history_file.unlink()
+                self.index_file.unlink(missing_ok=True)
                 logger.info(f"Cleared chat history file for task {project_id}")
             
             # Clear any temporary streaming messages for this task
@@ -179,6 +293,10 @@ class ChatHistoryManager:
             self._storage_instances[project_path] = ChatHistoryStorage(project_path)
         return self._storage_instances[project_path]
     
+    def release_storage(self, project_path: str) -> None:
+        """Forget a project's storage instance, e.g. once the project is deleted."""
+        self._storage_instances.pop(project_path, None)
+    
     async def save_message(self, project_id: str, project_path: str, message: Message) -> None:
         """Save a message using the appropriate storage instance."""
         storage = self.get_storage(project_path)
@@ -4,6 +4,7 @@ Storage factory - Creates storage providers using factory pattern.
 Separates pure filesystem abstraction from business logic.
 """
 
+from collections import OrderedDict
 from typing import Union, Optional, Dict, Type, Callable
 from pathlib import Path
 
@@ -17,6 +18,11 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _local_file_storage(path: Path) -> FileStorage:
+    """Default storage provider; LocalFileStorage creates its own base directory."""
+    return LocalFileStorage(path)
+
+
 class ProjectStorageFactory:
     """
     Factory for creating project storage with two layers of providers:
@@ -27,12 +33,17 @@ class ProjectStorageFactory:
     
     # Registry for storage providers (file storage backends)
     _storage_providers: Dict[str, Callable[[Path], FileStorage]] = {
-        "file": lambda path: LocalFileStorage(path)
+        "file": _local_file_storage
     }
     
     # Registry for cache providers
     _cache_providers: Dict[str, CacheBackend] = {}
     
+    # Cache providers that are only constructed the first time they are requested.
+    # Built instances live in a bounded LRU (see _build_cache_provider), so factories
+    # registered under many dynamic names (e.g. per tenant) can't accumulate without limit.
+    _cache_provider_factories: Dict[str, Callable[[], CacheBackend]] = {}
+    
     # Initialize default providers
     _initialized = False
     
@@ -45,13 +56,8 @@ class ProjectStorageFactory:
             cls._cache_providers["noop"] = NoOpCacheProvider()
             cls._cache_providers["none"] = NoOpCacheProvider()  # Alias for noop
             
-            # Try to register Redis cache provider (server module optional)
-            try:
-                from ..server.redis_cache import RedisCacheBackend
-                cls._cache_providers["redis"] = RedisCacheBackend()
-                logger.info("Registered Redis cache provider from server module")
-            except ImportError:
-                logger.debug("Redis cache provider not available (server module not found)")
+            # Redis lives in the server package, which is only imported if someone asks for it
+            cls._cache_provider_factories.setdefault("redis", _create_redis_cache_backend)
             
             cls._initialized = True
 
@@ -94,6 +100,20 @@ class ProjectStorageFactory:
         cls._cache_providers[name] = provider
         logger.info(f"Registered cache provider: {name}")
     
+    @classmethod
+    def register_cache_provider_factory(cls, name: str, factory: Callable[[], CacheBackend]):
+        """
+        Register a cache provider that is built on first use.
+        
+        Args:
+            name: Name to register the provider under
+            factory: Callable returning a CacheBackend instance
+        """
+        cls._cache_provider_factories[name] = factory
+        # Drop the instance built by a previous factory under this name; others are kept
+        _built_cache_providers.pop(name, None)
+        logger.info(f"Registered cache provider factory: {name}")
+    
     @classmethod
     def get_cache_provider(cls, name: Optional[str]) -> Optional[CacheBackend]:
         """
@@ -109,7 +129,13 @@ class ProjectStorageFactory:
         
         if name is None:
             return None
-        return cls._cache_providers.get(name)
+        provider = cls._cache_providers.get(name)
+        if provider is None and name in cls._cache_provider_factories:
+            try:
+                provider = _build_cache_provider(name)
+            except ImportError as e:
+                logger.warning(f"Cache provider '{name}' is not available: {e}")
+        return provider
 
     @classmethod
     def create_file_storage(cls, base_path: Union[str, Path], provider: str = "file") -> FileStorage:
@@ -124,10 +150,12 @@ class ProjectStorageFactory:
             FileStorage implementation
         """
         base_path = Path(base_path)
-        base_path.mkdir(parents=True, exist_ok=True)
 
         # Get the provider factory and create the storage
         provider_factory = cls.get_storage_provider(provider)
+        if provider_factory is not _local_file_storage:
+            # The built-in provider makes its own directory; don't pay for a second mkdir
+            base_path.mkdir(parents=True, exist_ok=True)
         storage = provider_factory(base_path)
         
         logger.info(f"Created {provider} storage provider: {base_path}")
@@ -181,5 +209,27 @@ class ProjectStorageFactory:
         return project_storage
 
 
+def _create_redis_cache_backend() -> CacheBackend:
+    """Build the Redis cache provider from the optional server module."""
+    from ..server.redis_cache import RedisCacheBackend
+    return RedisCacheBackend()
+
+
+# Instances built from registered factories, least recently used first
+_MAX_BUILT_CACHE_PROVIDERS = 128
+_built_cache_providers: "OrderedDict[str, CacheBackend]" = OrderedDict()
+
 
+def _build_cache_provider(name: str) -> CacheBackend:
+    """Build a factory-registered cache provider, keeping the most recently used instances."""
+    provider = _built_cache_providers.get(name)
+    if provider is not None:
+        _built_cache_providers.move_to_end(name)
+        return provider
+    provider = ProjectStorageFactory._cache_provider_factories[name]()
+    _built_cache_providers[name] = provider
+    if len(_built_cache_providers) > _MAX_BUILT_CACHE_PROVIDERS:
+        _built_cache_providers.popitem(last=False)
+    logger.info(f"Created cache provider: {name}")
+    return provider
 
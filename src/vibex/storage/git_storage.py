@@ -6,6 +6,7 @@ where we need proper diffs, branching, and version history.
 """
 
 import json
+import os
 import asyncio
 from pathlib import Path
 from datetime import datetime
@@ -182,17 +183,21 @@ class GitArtifactStorage:
         try:
             artifacts = []
 
-            # Get all artifact files (excluding metadata files)
-            for file_path in self.artifacts_path.iterdir():
-                if file_path.is_file() and not file_path.name.startswith('.') and not file_path.name.endswith('.meta.json'):
-                    name = file_path.name  # Use full filename instead of stem
+            # Get all artifact files (excluding metadata files). scandir takes the
+            # file type from the directory listing, so entries need no stat call
+            with os.scandir(self.artifacts_path) as it:
+                entries = list(it)
+
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith('.') and not entry.name.endswith('.meta.json'):
+                    name = entry.name  # Use full filename instead of stem
 
                     # Get Git history for this file
-                    commits = await self._get_file_history(file_path.name)
+                    commits = await self._get_file_history(name)
 
                     for commit in commits:
                         # Load metadata if available
-                        metadata = await self._get_metadata_at_commit(file_path.stem, commit['hash'])
+                        metadata = await self._get_metadata_at_commit(Path(name).stem, commit['hash'])
 
                         artifact_info = {
                             "name": name,
@@ -298,7 +303,7 @@ class GitArtifactStorage:
                     logger.error(f"Failed to get diff: {e}")
                     return None
 
-            return await asyncio.get_event_loop().run_in_executor(self.executor, _get_diff)
+            return await asyncio.get_running_loop().run_in_executor(self.executor, _get_diff)
 
         except Exception as e:
             logger.error(f"Failed to get diff for artifact {name}: {e}")
@@ -332,15 +337,17 @@ class GitArtifactStorage:
 
     def _find_artifact_extension(self, name: str) -> Optional[str]:
         """Find the extension of an existing artifact."""
-        for file_path in self.artifacts_path.iterdir():
-            if file_path.is_file() and not file_path.name.endswith('.meta.json'):
-                # Check if the full filename matches (for names with extensions)
-                if file_path.name == name:
-                    return ""  # No additional extension needed
-
-                # Check if the stem matches (for names without extensions)
-                if file_path.stem == name:
-                    return file_path.suffix
+        with os.scandir(self.artifacts_path) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith('.meta.json'):
+                    # Check if the full filename matches (for names with extensions)
+                    if entry.name == name:
+                        return ""  # No additional extension needed
+
+                    # Check if the stem matches (for names without extensions)
+                    file_path = Path(entry.name)
+                    if file_path.stem == name:
+                        return file_path.suffix
         return None
 
     async def _commit_changes(
@@ -367,7 +374,7 @@ class GitArtifactStorage:
                 logger.error(f"Failed to commit changes: {e}")
                 raise
 
-        return await asyncio.get_event_loop().run_in_executor(self.executor, _commit)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _commit)
 
     async def _get_file_at_commit(self, file_path: str, commit_hash: str) -> Optional[str]:
         """Get file content at specific commit."""
@@ -384,7 +391,7 @@ class GitArtifactStorage:
                 logger.error(f"Failed to get file at commit: {e}")
                 return None
 
-        return await asyncio.get_event_loop().run_in_executor(self.executor, _get_content)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _get_content)
 
     async def _get_file_history(self, file_path: str) -> List[Dict[str, Any]]:
         """Get Git history for a file."""
@@ -403,7 +410,7 @@ class GitArtifactStorage:
                 logger.error(f"Failed to get file history: {e}")
                 return []
 
-        return await asyncio.get_event_loop().run_in_executor(self.executor, _get_history)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _get_history)
 
     async def _get_metadata_at_commit(self, name: str, commit_hash: str) -> Optional[Dict[str, Any]]:
         """Get metadata at specific commit."""
@@ -8,6 +8,8 @@ from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
 
+import orjson
+
 
 @dataclass
 class StorageResult:
@@ -86,18 +88,21 @@ class FileStorage(StorageBackend):
     async def read_json(self, path: str) -> Optional[Dict[str, Any]]:
         """Read and parse JSON content from a file."""
         try:
-            content = await self.read_text(path)
-            import json
-            return json.loads(content)
+            content = await self.read_bytes(path)
+            return orjson.loads(content)
         except Exception:
             return None
 
     async def write_json(self, path: str, data: Dict[str, Any], indent: int = 2) -> StorageResult:
         """Write data as JSON to a file."""
         try:
-            import json
-            content = json.dumps(data, indent=indent)
-            return await self.write_text(path, content)
+            if indent in (None, 0, 2):
+                # orjson covers compact and two-space output; other indents go through json
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+            else:
+                import json
+                content = json.dumps(data, indent=indent).encode("utf-8")
+            return await self.write_bytes(path, content)
         except Exception as e:
             return StorageResult(success=False, error=str(e))
 
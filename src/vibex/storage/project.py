@@ -11,6 +11,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 
+import orjson
+
 from .interfaces import FileStorage, StorageResult, CacheBackend
 from ..utils.logger import get_logger
 
@@ -473,11 +475,16 @@ class ProjectStorage:
             return []
 
     # Generic file operations
-    async def save_file(self, path: str, content: Union[str, Dict[str, Any]]) -> StorageResult:
-        """Save a file with JSON content."""
+    async def save_file(self, path: str, content: Union[str, bytes, Dict[str, Any]]) -> StorageResult:
+        """Save a file with JSON content (dicts are encoded; str and pre-encoded bytes are written as-is)."""
         try:
+            if isinstance(content, bytes):
+                return await self.file_storage.write_bytes(path, content)
             if isinstance(content, dict):
-                content = json.dumps(content, indent=2)
+                # Encode straight to bytes; orjson also handles datetimes in the payload
+                return await self.file_storage.write_bytes(
+                    path, orjson.dumps(content, option=orjson.OPT_INDENT_2)
+                )
             
             result = await self.file_storage.write_text(path, content)
             return result
@@ -494,6 +501,14 @@ class ProjectStorage:
             logger.error(f"Failed to read file {path}: {e}")
             return None
 
+    async def read_file_bytes(self, path: str) -> Optional[bytes]:
+        """Read a file from storage without decoding it."""
+        try:
+            return await self.file_storage.read_bytes(path)
+        except Exception as e:
+            logger.error(f"Failed to read file {path}: {e}")
+            return None
+
 
 
     # Directory Management
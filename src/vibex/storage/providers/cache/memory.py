@@ -89,6 +89,17 @@ class MemoryCacheProvider(CacheBackend):
             self._cache.pop(key, None)
             self._expiry.pop(key, None)
     
+    async def expire_now(self) -> None:
+        """Expire every entry that has a TTL, as if its time had elapsed.
+        
+        Lets tests and benchmarks observe post-expiry behaviour without
+        sleeping for the TTL. Entries cached without a TTL are kept.
+        """
+        async with self._lock:
+            for key in self._expiry:
+                del self._cache[key]
+            self._expiry.clear()
+    
     async def clear(self) -> None:
         """Clear all cache entries."""
         async with self._lock:
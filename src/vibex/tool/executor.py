@@ -10,37 +10,71 @@ The executor is responsible for:
 
 import time
 import asyncio
+import functools
 import json
-from typing import Dict, Any, List, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from ..utils.logger import get_logger
 from .registry import ToolRegistry, get_tool_registry
-from ..core.tool import ToolResult
+from ..core.tool import ToolFunction, ToolResult
 
 logger = get_logger(__name__)
 
+# Shared result for requests that pass validation. execute_tool only inspects `.success`
+# and never hands it to callers, so it must not be mutated.
+_VALIDATION_OK = ToolResult(success=True)
 
+
+@functools.singledispatch
 def safe_json_serialize(obj):
     """
     Safely serialize objects to JSON, handling dataclasses, Pydantic models, and other complex types.
+
+    Dispatches on the object's type, so common containers and primitives skip the
+    duck-typing checks below; those only run for types with no registered handler.
     """
     if is_dataclass(obj):
         return asdict(obj)
-    elif hasattr(obj, 'model_dump'):  # Pydantic model
+    elif hasattr(obj, 'model_dump'):  # Pydantic-like model
         return obj.model_dump()
     elif hasattr(obj, '__dict__'):  # Regular object with attributes
         return obj.__dict__
-    elif isinstance(obj, (list, tuple)):
-        return [safe_json_serialize(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {key: safe_json_serialize(value) for key, value in obj.items()}
     else:
-        # For primitive types and other serializable objects
+        # For other serializable objects
         return obj
 
 
+@safe_json_serialize.register(str)
+@safe_json_serialize.register(int)
+@safe_json_serialize.register(float)
+@safe_json_serialize.register(type(None))
+def _serialize_primitive(obj):
+    return obj
+
+
+@safe_json_serialize.register(BaseModel)
+def _serialize_model(obj: BaseModel):
+    return obj.model_dump()
+
+
+@safe_json_serialize.register(list)
+@safe_json_serialize.register(tuple)
+def _serialize_sequence(obj):
+    return [safe_json_serialize(item) for item in obj]
+
+
+@safe_json_serialize.register(dict)
+def _serialize_mapping(obj: dict):
+    return {key: safe_json_serialize(value) for key, value in obj.items()}
+
+
 def safe_json_dumps(obj, **kwargs):
     """
     Safely serialize objects to JSON with fallback handling.
@@ -52,6 +86,36 @@ def safe_json_dumps(obj, **kwargs):
         return json.dumps(str(obj), **kwargs)
 
 
+def _fast_dumps(obj, *, indent: bool = False) -> str:
+    """
+    Serialize to JSON with orjson, falling back to safe_json_dumps for anything it rejects.
+
+    orjson handles dataclasses, datetimes and non-string keys natively and only calls
+    back into safe_json_serialize for types it doesn't know, such as Pydantic models.
+    Output is UTF-8 (like ensure_ascii=False).
+    """
+    option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, default=safe_json_serialize, option=option).decode()
+    except orjson.JSONEncodeError:
+        return safe_json_dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _parse_tool_arguments(raw_arguments) -> Dict[str, Any]:
+    """
+    Parse LLM tool-call arguments.
+
+    orjson reads str, bytes, bytearray and memoryview input in place, so raw
+    provider payloads are parsed without an intermediate decode or copy.
+    Arguments some providers hand over already decoded are used as-is.
+    """
+    if isinstance(raw_arguments, dict):
+        return raw_arguments
+    return orjson.loads(raw_arguments)
+
+
 def truncate_for_logging(content: str, max_length: int = 500) -> str:
     """
     Truncate content for logging purposes while preserving readability.
@@ -151,10 +215,47 @@ class SecurityPolicy:
     # Builtin tools are allowed by default since they're designed to be safe
     # Agent configs in presets/config.yaml control what tools are available to each agent
 
-    # Blocked tools (never allowed)
-    BLOCKED_TOOLS = [
+    # Blocked tools (never allowed); a frozenset so the per-call check is a hash lookup
+    BLOCKED_TOOLS = frozenset({
         "system_command", "exec", "eval", "delete_all"
-    ]
+    })
+
+
+# Sync tools run on threads of their own so they never queue behind other offloaded work.
+# One pool serves every executor; threads start on demand and the server shuts it down.
+TOOL_THREAD_POOL_SIZE = 32
+_tool_thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_tool_thread_pool() -> ThreadPoolExecutor:
+    """Get the shared pool for sync tools, creating it on first use."""
+    global _tool_thread_pool
+    if _tool_thread_pool is None:
+        _tool_thread_pool = ThreadPoolExecutor(
+            max_workers=TOOL_THREAD_POOL_SIZE,
+            thread_name_prefix="tool-exec"
+        )
+    return _tool_thread_pool
+
+
+def shutdown_tool_threads() -> None:
+    """Shut down the shared sync tool pool; it is recreated if tools run again."""
+    global _tool_thread_pool
+    pool, _tool_thread_pool = _tool_thread_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass(slots=True)
+class _AuditEntry:
+    """A single tool execution in the audit trail."""
+    timestamp: str
+    tool_name: str
+    agent_name: str
+    arguments: Dict[str, Any]
+    success: bool
+    execution_time: float
+    error: Optional[str] = None
 
 
 class ToolExecutor:
@@ -178,7 +279,11 @@ class ToolExecutor:
         self.registry = registry or get_tool_registry()
         self.security_policy = SecurityPolicy()
         self.active_executions = 0
-        self.execution_history: List[Dict[str, Any]] = []
+        self._execution_slots = asyncio.Semaphore(self.security_policy.MAX_CONCURRENT_EXECUTIONS)
+        # Bounded audit trail; the oldest entry is dropped in O(1) once full
+        self.execution_history: Deque[_AuditEntry] = deque(maxlen=1000)
+        # Successful entries currently in execution_history, kept in step with appends and evictions
+        self._successful_executions = 0
 
         logger.debug("🔧 ToolExecutor initialized with security policies")
 
@@ -199,7 +304,7 @@ class ToolExecutor:
         Returns:
             ToolResult with execution outcome
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Security validation
@@ -207,52 +312,44 @@ class ToolExecutor:
             if not validation_result.success:
                 return validation_result
 
-            # Resource limit check
-            if self.active_executions >= self.security_policy.MAX_CONCURRENT_EXECUTIONS:
-                return ToolResult(
-                    success=False,
-                    error="Maximum concurrent executions exceeded",
-                    execution_time=time.time() - start_time
-                )
-
             # Get tool function
             tool_function = self.registry.get_tool_function(tool_name)
             if not tool_function:
                 return ToolResult(
                     success=False,
                     error=f"Tool '{tool_name}' not found in registry",
-                    execution_time=time.time() - start_time
+                    execution_time=time.perf_counter() - start_time
                 )
 
-            # Execute with monitoring
-            self.active_executions += 1
-            try:
-                result = await self._execute_with_timeout(
-                    tool_function.function,
-                    kwargs,
-                    self.security_policy.MAX_EXECUTION_TIME
-                )
+            # Execute with monitoring; calls beyond the concurrency limit wait for a free slot
+            async with self._execution_slots:
+                self.active_executions += 1
+                try:
+                    result = await self._execute_with_timeout(
+                        tool_function,
+                        kwargs,
+                        self.security_policy.MAX_EXECUTION_TIME
+                    )
+                finally:
+                    self.active_executions -= 1
 
-                execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
-                # Log successful execution
-                self._log_execution(tool_name, agent_name, kwargs, True, execution_time)
+            # Log successful execution
+            self._log_execution(tool_name, agent_name, kwargs, True, execution_time)
 
-                return ToolResult(
-                    success=True,
-                    result=result,
-                    execution_time=execution_time,
-                    metadata={
-                        "tool_name": tool_name,
-                        "agent_name": agent_name
-                    }
-                )
-
-            finally:
-                self.active_executions -= 1
+            return ToolResult(
+                success=True,
+                result=result,
+                execution_time=execution_time,
+                metadata={
+                    "tool_name": tool_name,
+                    "agent_name": agent_name
+                }
+            )
 
         except asyncio.TimeoutError:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_msg = f"Tool execution timed out after {self.security_policy.MAX_EXECUTION_TIME}s"
             self._log_execution(tool_name, agent_name, kwargs, False, execution_time, error_msg)
 
@@ -263,7 +360,7 @@ class ToolExecutor:
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_msg = f"Tool execution failed: {str(e)}"
             self._log_execution(tool_name, agent_name, kwargs, False, execution_time, error_msg)
 
@@ -293,90 +390,130 @@ class ToolExecutor:
             error_msg = f"Too many tool calls: {len(tool_calls)} > {self.security_policy.MAX_TOOLS_PER_BATCH}"
             logger.error(error_msg)
 
-            # Return error for all tool calls
+            # Return the same error for all tool calls, encoded once
+            error_content = _fast_dumps({
+                "success": False,
+                "error": error_msg
+            })
             return [
                 {
                     "role": "tool",
                     "tool_call_id": tc.id,
                     "name": tc.function.name,
-                    "content": safe_json_dumps({
-                        "success": False,
-                        "error": error_msg
-                    })
+                    "content": error_content
                 } for tc in tool_calls
             ]
 
-        tool_messages = []
-
+        # Calls run in the order the model emitted them, since later calls may depend on
+        # earlier ones; only runs of adjacent parallel-safe calls are overlapped
+        results: List[Tuple[Dict[str, Any], bool]] = []
+        parallel_run: List[Any] = []
         for tool_call in tool_calls:
-            tool_name = tool_call.function.name
-            tool_call_id = tool_call.id
-            try:
-                # Parse tool arguments
-                tool_args = json.loads(tool_call.function.arguments)
-
-                # Log tool call (framework logging - respects streaming mode)
-                logger.info(f"🔧 TOOL CALL START | ID: {tool_call_id} | Tool: {tool_name} | Agent: {agent_name}")
-                logger.info(f"📝 TOOL ARGS | {safe_json_dumps(tool_args, indent=2)}")
-
-                # Execute the tool
-                start_time = time.time()
-                result = await self.execute_tool(tool_name, agent_name, **tool_args)
-                execution_time = time.time() - start_time
-
-                # Log tool call result (framework logging - respects streaming mode)
-                if result.success:
-                    logger.info(f"✅ TOOL CALL SUCCESS | ID: {tool_call_id} | Tool: {tool_name} | Time: {execution_time:.2f}s")
-                    # Use truncated logging for large content like web extractions
-                    logger.info(f"📤 TOOL RESULT | {safe_json_dumps_for_logging(result.result, max_content_length=500)}")
-                else:
-                    logger.info(f"❌ TOOL CALL FAILED | ID: {tool_call_id} | Tool: {tool_name} | Error: {result.error}")
-                    logger.info(f"⏱️  TOOL TIME | {execution_time:.2f}s")
-
-                # Format result for LLM using safe serialization (FULL CONTENT - no truncation)
-                if result.success:
-                    content = safe_json_dumps({
-                        "success": True,
-                        "result": result.result,
-                        "execution_time": result.execution_time,
-                        "metadata": result.metadata
-                    }, ensure_ascii=False, indent=2)
-                else:
-                    content = safe_json_dumps({
-                        "success": False,
-                        "error": result.error,
-                        "execution_time": result.execution_time
-                    }, ensure_ascii=False, indent=2)
-
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ TOOL CALL PARSE ERROR | ID: {tool_call_id} | Tool: {tool_name} | Error: Invalid JSON arguments")
-                logger.error(f"🔍 RAW ARGS | {tool_call.function.arguments}")
-                content = safe_json_dumps({
-                    "success": False,
-                    "error": f"Invalid tool arguments: {str(e)}"
-                })
+            if self._is_parallel_safe(tool_call.function.name):
+                parallel_run.append(tool_call)
+                continue
+            if parallel_run:
+                results.extend(await self._execute_parallel(parallel_run, agent_name))
+                parallel_run = []
+            results.append(await self._execute_tool_call(tool_call, agent_name))
+        if parallel_run:
+            results.extend(await self._execute_parallel(parallel_run, agent_name))
+        tool_messages = [message for message, _ in results]
+        successful_calls = sum(1 for _, success in results if success)
+
+        # Log batch summary
+        if logger.isEnabledFor(logging.INFO):
+            failed_calls = len(tool_messages) - successful_calls
+            logger.info(f"📊 TOOL BATCH COMPLETE | Agent: {agent_name} | Total: {len(tool_messages)} | Success: {successful_calls} | Failed: {failed_calls}")
+
+        return tool_messages
+
+    def _is_parallel_safe(self, tool_name: str) -> bool:
+        """Check whether a tool has opted in to running concurrently with its neighbours."""
+        tool_function = self.registry.get_tool_function(tool_name)
+        return tool_function is not None and tool_function.parallel_safe
+
+    async def _execute_parallel(self, tool_calls: List[Any], agent_name: str) -> List[Tuple[Dict[str, Any], bool]]:
+        """Run parallel-safe calls concurrently; execute_tool caps how many run at once."""
+        if len(tool_calls) == 1:
+            return [await self._execute_tool_call(tool_calls[0], agent_name)]
+        return await asyncio.gather(*(
+            self._execute_tool_call(tool_call, agent_name) for tool_call in tool_calls
+        ))
+
+    async def _execute_tool_call(self, tool_call: Any, agent_name: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Execute one LLM tool call and format its result message.
 
-            except Exception as e:
-                logger.error(f"❌ TOOL CALL EXCEPTION | ID: {tool_call_id} | Tool: {tool_name} | Error: {str(e)}")
-                content = safe_json_dumps({
+        Returns:
+            The tool result message for the LLM and whether the call succeeded
+        """
+        tool_name = tool_call.function.name
+        tool_call_id = tool_call.id
+        succeeded = False
+        try:
+            # Parse tool arguments
+            tool_args = _parse_tool_arguments(tool_call.function.arguments)
+
+            # Log tool call (framework logging - respects streaming mode)
+            logger.info(f"🔧 TOOL CALL START | ID: {tool_call_id} | Tool: {tool_name} | Agent: {agent_name}")
+            # Payload previews are only built when INFO is enabled, and large strings are cut
+            # before encoding rather than serializing whole documents just for a log line
+            log_payloads = logger.isEnabledFor(logging.INFO)
+            if log_payloads:
+                logger.info(f"📝 TOOL ARGS | {safe_json_dumps_for_logging(tool_args, max_content_length=500, ensure_ascii=False, indent=2)}")
+
+            # Execute the tool (execute_tool times the call itself)
+            result = await self.execute_tool(tool_name, agent_name, **tool_args)
+            execution_time = result.execution_time
+
+            # Log tool call result (framework logging - respects streaming mode)
+            if result.success:
+                logger.info(f"✅ TOOL CALL SUCCESS | ID: {tool_call_id} | Tool: {tool_name} | Time: {execution_time:.2f}s")
+                # Use truncated logging for large content like web extractions
+                if log_payloads:
+                    logger.info(f"📤 TOOL RESULT | {safe_json_dumps_for_logging(result.result, max_content_length=500)}")
+            else:
+                logger.info(f"❌ TOOL CALL FAILED | ID: {tool_call_id} | Tool: {tool_name} | Error: {result.error}")
+                logger.info(f"⏱️  TOOL TIME | {execution_time:.2f}s")
+
+            # Format result for LLM using safe serialization (FULL CONTENT - no truncation)
+            if result.success:
+                succeeded = True
+                content = _fast_dumps({
+                    "success": True,
+                    "result": result.result,
+                    "execution_time": result.execution_time,
+                    "metadata": result.metadata
+                }, indent=True)
+            else:
+                content = _fast_dumps({
                     "success": False,
-                    "error": f"Tool execution failed: {str(e)}"
-                })
-
-            # Add tool result message
-            tool_messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "name": tool_name,
-                "content": content
+                    "error": result.error,
+                    "execution_time": result.execution_time
+                }, indent=True)
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ TOOL CALL PARSE ERROR | ID: {tool_call_id} | Tool: {tool_name} | Error: Invalid JSON arguments")
+            logger.error(f"🔍 RAW ARGS | {tool_call.function.arguments}")
+            content = _fast_dumps({
+                "success": False,
+                "error": f"Invalid tool arguments: {str(e)}"
             })
 
-        # Log batch summary
-        successful_calls = sum(1 for msg in tool_messages if '"success": true' in msg["content"])
-        failed_calls = len(tool_messages) - successful_calls
-        logger.info(f"📊 TOOL BATCH COMPLETE | Agent: {agent_name} | Total: {len(tool_messages)} | Success: {successful_calls} | Failed: {failed_calls}")
+        except Exception as e:
+            logger.error(f"❌ TOOL CALL EXCEPTION | ID: {tool_call_id} | Tool: {tool_name} | Error: {str(e)}")
+            content = _fast_dumps({
+                "success": False,
+                "error": f"Tool execution failed: {str(e)}"
+            })
 
-        return tool_messages
+        return {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "name": tool_name,
+            "content": content
+        }, succeeded
 
     def _validate_execution(
         self,
@@ -396,7 +533,7 @@ class ToolExecutor:
             ToolResult indicating validation success/failure
         """
         # Check if tool is blocked
-        if tool_name in self.security_policy.BLOCKED_TOOLS:
+        if tool_name in SecurityPolicy.BLOCKED_TOOLS:
             return ToolResult(
                 success=False,
                 error=f"Tool '{tool_name}' is blocked by security policy"
@@ -404,19 +541,19 @@ class ToolExecutor:
 
         # Allow all builtin tools by default - agent configs control what's available
         # This removes the confusing dual-permission system
-        return ToolResult(success=True)
+        return _VALIDATION_OK
 
     async def _execute_with_timeout(
         self,
-        func,
+        tool_function: ToolFunction,
         kwargs: Dict[str, Any],
         timeout: float
     ):
         """
-        Execute function with timeout.
+        Execute a tool function with timeout.
 
         Args:
-            func: Function to execute
+            tool_function: Registered tool function to execute
             kwargs: Function arguments
             timeout: Timeout in seconds
 
@@ -426,14 +563,15 @@ class ToolExecutor:
         Raises:
             asyncio.TimeoutError: If execution exceeds timeout
         """
-        if asyncio.iscoroutinefunction(func):
+        func = tool_function.function
+        if tool_function.is_coroutine:
             # Async function
             return await asyncio.wait_for(func(**kwargs), timeout=timeout)
         else:
             # Sync function - run in thread pool
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await asyncio.wait_for(
-                loop.run_in_executor(None, lambda: func(**kwargs)),
+                loop.run_in_executor(_get_tool_thread_pool(), functools.partial(func, **kwargs)),
                 timeout=timeout
             )
 
@@ -457,23 +595,27 @@ class ToolExecutor:
             execution_time: Time taken for execution
             error: Error message if failed
         """
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "tool_name": tool_name,
-            "agent_name": agent_name,
-            "arguments": kwargs,
-            "success": success,
-            "execution_time": execution_time,
-            "error": error
-        }
-
-        self.execution_history.append(log_entry)
-
-        # Keep only last 1000 entries to prevent memory bloat
-        if len(self.execution_history) > 1000:
-            self.execution_history = self.execution_history[-1000:]
+        log_entry = _AuditEntry(
+            timestamp=datetime.now().isoformat(),
+            tool_name=tool_name,
+            agent_name=agent_name,
+            arguments=kwargs,
+            success=success,
+            execution_time=execution_time,
+            error=error
+        )
+
+        history = self.execution_history
+        if len(history) == history.maxlen and history[0].success:
+            # The oldest entry is about to be evicted
+            self._successful_executions -= 1
+        history.append(log_entry)
+        if success:
+            self._successful_executions += 1
 
         # Log to file/external system if needed
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         if success:
             logger.debug(f"✅ Tool '{tool_name}' executed successfully for '{agent_name}' in {execution_time:.2f}s")
         else:
@@ -482,17 +624,21 @@ class ToolExecutor:
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
         total_executions = len(self.execution_history)
-        successful_executions = sum(1 for entry in self.execution_history if entry["success"])
+        successful_executions = self._successful_executions
 
         return {
             "total_executions": total_executions,
             "successful_executions": successful_executions,
             "failure_rate": (total_executions - successful_executions) / max(total_executions, 1),
             "active_executions": self.active_executions,
-            "recent_executions": self.execution_history[-10:] if self.execution_history else []
+            "recent_executions": [
+                asdict(entry)
+                for entry in islice(self.execution_history, max(total_executions - 10, 0), None)
+            ]
         }
 
     def clear_history(self):
         """Clear execution history."""
         self.execution_history.clear()
+        self._successful_executions = 0
         logger.debug("Tool execution history cleared")
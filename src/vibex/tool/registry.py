@@ -55,7 +55,8 @@ class ToolRegistry:
             description=func._tool_description,
             parameters=parameters,
             return_description=func._return_description,
-            function=func
+            function=func,
+            parallel_safe=getattr(func, "_parallel_safe", False)
         )
         logger.debug(f"Registered tool: '{tool_name}'")
 
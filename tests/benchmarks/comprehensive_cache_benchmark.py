@@ -4,13 +4,21 @@ Comprehensive performance benchmarks for all cached operations
 """
 
 import asyncio
+import os
 import time
-import statistics
 import json
+import orjson
 import tempfile
-import shutil
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Dict
+
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from vibex.storage.cache_backends import MemoryCacheBackend, NoOpCacheBackend
 # ProjectStorage removed - use ProjectStorage directly
@@ -18,36 +26,46 @@ from vibex.storage.project import ProjectStorage
 from vibex.storage.factory import StorageFactory
 
 
-async def benchmark_operation(name: str, func, iterations: int = 50) -> Dict[str, float]:
+def _make_message(i: int) -> Dict[str, str]:
+    """Build one fixture message for the JSONL history"""
+    return {
+        "role": ["user", "assistant"][i % 2],
+        "content": f"Message {i} with some content that makes it realistic",
+        "timestamp": f"2024-01-{(i % 30) + 1:02d}T12:00:00Z"
+    }
+
+
+async def benchmark_operation(name: str, func, iterations: int = 50, warmup: int = 5) -> Dict[str, float]:
     """Benchmark an async operation and return detailed metrics"""
-    times = []
+    samples = np.empty(iterations, dtype=np.int64)
     
-    # Warm up
-    for _ in range(5):
+    # Warm up (uncached runs pass warmup=0, there is nothing to prime)
+    for _ in range(warmup):
         await func()
     
     # Actual benchmark
-    for _ in range(iterations):
-        start = time.perf_counter()
+    for i in range(iterations):
+        start = time.perf_counter_ns()
         await func()
-        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
-        times.append(elapsed)
+        samples[i] = time.perf_counter_ns() - start
     
+    times = samples.astype(np.float64) / 1e6  # Convert to ms
     return {
-        "min": min(times),
-        "avg": statistics.mean(times),
-        "max": max(times),
-        "median": statistics.median(times),
-        "stdev": statistics.stdev(times) if len(times) > 1 else 0
+        "min": float(times.min()),
+        "avg": float(times.mean()),
+        "max": float(times.max()),
+        "median": float(np.median(times)),
+        "p99": float(np.percentile(times, 99)),
+        "stdev": float(times.std(ddof=1)) if iterations > 1 else 0
     }
 
 
-async def create_test_project_storage() -> Tuple[str, str]:
-    """Create a test project storage with comprehensive data"""
-    temp_dir = tempfile.mkdtemp()
+async def create_test_project_storage(temp_dir: str) -> str:
+    """Create a test project storage with comprehensive data under temp_dir"""
     project_id = "benchmark-comprehensive"
     project_path = Path(temp_dir) / project_id
-    project_path.mkdir(parents=True)
+    artifacts_dir = project_path / "artifacts"
+    os.makedirs(artifacts_dir)
     
     # Create comprehensive test data
     
@@ -70,18 +88,13 @@ async def create_test_project_storage() -> Tuple[str, str]:
     
     # 2. Message history (JSONL format)
     messages_path = project_path / "messages.jsonl"
-    with open(messages_path, "w") as f:
-        for i in range(100):
-            message = {
-                "role": ["user", "assistant"][i % 2],
-                "content": f"Message {i} with some content that makes it realistic",
-                "timestamp": f"2024-01-{(i % 30) + 1:02d}T12:00:00Z"
-            }
-            f.write(json.dumps(message) + "\n")
+    with open(messages_path, "wb") as f:
+        f.writelines(
+            orjson.dumps(_make_message(i), option=orjson.OPT_APPEND_NEWLINE)
+            for i in range(100)
+        )
     
     # 3. Artifacts (simple storage format)
-    artifacts_dir = project_path / "artifacts"
-    artifacts_dir.mkdir()
     (project_path / ".vibex_simple_storage").touch()
     
     for i in range(20):
@@ -89,18 +102,17 @@ async def create_test_project_storage() -> Tuple[str, str]:
         version = f"v{i // 5 + 1}"
         
         # Data file
-        data_file = artifacts_dir / f"{artifact_name}_{version}.data"
-        data_file.write_text(f"Artifact content for {artifact_name} version {version}\n" * 10)
+        data_bytes = (f"Artifact content for {artifact_name} version {version}\n" * 10).encode()
+        (artifacts_dir / f"{artifact_name}_{version}.data").write_bytes(data_bytes)
         
-        # Metadata file
+        # Metadata file (size is known up front, no stat needed)
         metadata = {
             "name": artifact_name,
             "version": version,
             "created_at": f"2024-01-01T{i:02d}:00:00Z",
-            "size": data_file.stat().st_size
+            "size": len(data_bytes)
         }
-        metadata_file = artifacts_dir / f"{artifact_name}_{version}.metadata"
-        metadata_file.write_text(json.dumps(metadata))
+        (artifacts_dir / f"{artifact_name}_{version}.metadata").write_bytes(orjson.dumps(metadata))
     
     # 4. Create a summary file
     summary = {
@@ -112,16 +124,16 @@ async def create_test_project_storage() -> Tuple[str, str]:
     with open(project_path / "summary.json", "w") as f:
         json.dump(summary, f)
     
-    return temp_dir, project_id
+    return project_id
 
 
 async def run_comprehensive_benchmarks():
     """Run comprehensive benchmarks on all cached operations"""
     
-    print("Creating test project_storage...")
-    temp_dir, project_id = await create_test_project_storage()
-    
-    try:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print("Creating test project_storage...")
+        project_id = await create_test_project_storage(temp_dir)
+        
         # Create storage instances
         base_storage = StorageFactory.create_project_storage(
             base_path=Path(temp_dir),
@@ -146,12 +158,24 @@ async def run_comprehensive_benchmarks():
         # 1. Plan operations
         print("1. Plan Operations:")
         
-        no_cache = await benchmark_operation("get_plan no cache", lambda: no_cache_storage.get_plan())
-        cached = await benchmark_operation("get_plan cached", lambda: cached_storage.get_plan())
+        no_cache = await benchmark_operation("get_plan no cache", no_cache_storage.get_plan, warmup=0)
+        
+        # Cold misses are measured on their own so they don't blend into the hit numbers
+        cold_times = []
+        for _ in range(50):
+            await memory_cache.clear()
+            start = time.perf_counter_ns()
+            await cached_storage.get_plan()
+            cold_times.append((time.perf_counter_ns() - start) / 1e6)
+        
+        # Warm hits: populate once, then time steady-state reads
+        await cached_storage.get_plan()
+        cached = await benchmark_operation("get_plan cached", cached_storage.get_plan, iterations=1000)
         
         print(f"   get_plan() without cache: avg={no_cache['avg']:.2f}ms (±{no_cache['stdev']:.2f}ms)")
-        print(f"   get_plan() with cache:    avg={cached['avg']:.3f}ms (±{cached['stdev']:.3f}ms)")
-        print(f"   Speedup: {no_cache['avg']/cached['avg']:.1f}x\n")
+        print(f"   get_plan() cold cache:    p50={np.median(cold_times):.2f}ms")
+        print(f"   get_plan() warm cache:    p50={cached['median']:.3f}ms p99={cached['p99']:.3f}ms")
+        print(f"   Speedup (warm): {no_cache['avg']/cached['avg']:.1f}x\n")
         
         results["get_plan"] = {"no_cache": no_cache, "cached": cached}
         
@@ -160,11 +184,12 @@ async def run_comprehensive_benchmarks():
         
         no_cache = await benchmark_operation(
             "get_task_progress no cache", 
-            lambda: no_cache_storage.get_task_progress()
+            no_cache_storage.get_task_progress,
+            warmup=0
         )
         cached = await benchmark_operation(
             "get_task_progress cached", 
-            lambda: cached_storage.get_task_progress()
+            cached_storage.get_task_progress
         )
         
         print(f"   get_task_progress() without cache: avg={no_cache['avg']:.2f}ms")
@@ -174,20 +199,35 @@ async def run_comprehensive_benchmarks():
         # 3. Message operations
         print("3. Message History Operations:")
         
-        # Test different message limits
-        for limit in [10, 20, 50]:
+        # Test different message limits; latency runs stay sequential so samples
+        # don't include the other limits' work
+        limits = [10, 20, 50]
+        for limit in limits:
             no_cache = await benchmark_operation(
                 f"get_messages({limit}) no cache",
-                lambda: no_cache_storage.get_conversation_history(limit=limit)
+                partial(no_cache_storage.get_conversation_history, limit=limit),
+                warmup=0
             )
             cached = await benchmark_operation(
                 f"get_messages({limit}) cached",
-                lambda: cached_storage.get_conversation_history(limit=limit)
+                partial(cached_storage.get_conversation_history, limit=limit)
             )
             
             print(f"   get_conversation_history({limit}) without cache: avg={no_cache['avg']:.2f}ms")
             print(f"   get_conversation_history({limit}) with cache:    avg={cached['avg']:.3f}ms")
             print(f"   Speedup: {no_cache['avg']/cached['avg']:.1f}x")
+        
+        # Concurrent stress: all limits at once, reported as wall-clock throughput
+        for label, storage in (("without cache", no_cache_storage), ("with cache", cached_storage)):
+            calls = 50 * len(limits)
+            start = time.perf_counter_ns()
+            await asyncio.gather(*(
+                storage.get_conversation_history(limit=limit)
+                for limit in limits
+                for _ in range(50)
+            ))
+            elapsed_s = (time.perf_counter_ns() - start) / 1e9
+            print(f"   Concurrent get_conversation_history {label}: {calls / elapsed_s:.0f} calls/s")
         print()
         
         # 4. Artifact operations
@@ -195,11 +235,12 @@ async def run_comprehensive_benchmarks():
         
         no_cache = await benchmark_operation(
             "list_artifacts no cache",
-            lambda: no_cache_storage.list_artifacts()
+            no_cache_storage.list_artifacts,
+            warmup=0
         )
         cached = await benchmark_operation(
             "list_artifacts cached",
-            lambda: cached_storage.list_artifacts()
+            cached_storage.list_artifacts
         )
         
         print(f"   list_artifacts() without cache: avg={no_cache['avg']:.2f}ms")
@@ -225,11 +266,11 @@ async def run_comprehensive_benchmarks():
             if i == 0:
                 print(f"   First read (cold cache): {elapsed:.2f}ms")
             
-            # Wait to test TTL (plan has 5s TTL)
+            # Expire the plan entry (5s TTL) without waiting it out
             if i == 5:
                 print(f"   After repeated reads: {elapsed:.3f}ms")
-                print("   Waiting 6 seconds for cache expiry...")
-                await asyncio.sleep(6)
+                print("   Forcing cache expiry...")
+                await memory_cache.expire_now()
         
         print(f"   After cache expiry: {times[-1]:.2f}ms\n")
         
@@ -243,11 +284,8 @@ async def run_comprehensive_benchmarks():
         print(f"  - Hit latency: <0.01ms for most operations")
         print(f"  - Miss penalty: ~1-3ms (includes file I/O)")
         print(f"  - Memory usage: Minimal (LRU with 1000 item limit)")
-        
-    finally:
-        # Cleanup
-        shutil.rmtree(temp_dir)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_comprehensive_benchmarks())
\ No newline at end of file
+    # uvloop keeps event-loop overhead out of the cache-hit timings when available
+    (uvloop.run if uvloop else asyncio.run)(run_comprehensive_benchmarks())
\ No newline at end of file
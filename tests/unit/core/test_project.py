@@ -0,0 +1,194 @@
+"""
+Tests for Project state persistence.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from vibex.core.config import ProjectConfig
+from vibex.core.message import ConversationHistory, MessageQueue
+from vibex.core.plan import Plan
+from vibex.core import project as project_module
+from vibex.core.project import PERSIST_DELAY, PROJECT_STATE_FILE, Project
+from vibex.core.task import Task
+from vibex.storage.backends import LocalFileStorage
+from vibex.storage.interfaces import StorageResult
+from vibex.storage.project import ProjectStorage
+
+
+def make_project(path, project_id="proj_1"):
+    """Create a project backed by plain local storage."""
+    storage = ProjectStorage(
+        project_path=path,
+        project_id=project_id,
+        file_storage=LocalFileStorage(path),
+        use_git_artifacts=False,
+    )
+    return Project(
+        project_id=project_id,
+        config=ProjectConfig(),
+        history=ConversationHistory(project_id=project_id),
+        message_queue=MessageQueue(),
+        agents={},
+        storage=storage,
+        goal="Write a report",
+        name="Report",
+    )
+
+
+@pytest.fixture
+def plan():
+    """Create a two-task plan."""
+    return Plan(tasks=[
+        Task(id="t1", action="Research"),
+        Task(id="t2", action="Write", dependencies=["t1"]),
+    ])
+
+
+class TestProjectPersistence:
+    """Test saving and restoring project state."""
+
+    @pytest.mark.asyncio
+    async def test_state_round_trip(self, tmp_path, plan):
+        """Test that persisted state, including plan datetimes, loads back."""
+        project = make_project(tmp_path)
+        await project.create_plan(plan)
+        await project.update_status("t1", "completed")
+        await project.flush()
+
+        restored = make_project(tmp_path)
+        assert await restored.load_state()
+        assert restored.name == "Report"
+        assert [t.status for t in restored.plan.tasks] == ["completed", "pending"]
+        assert restored.plan.updated_at == project.plan.updated_at
+
+    @pytest.mark.asyncio
+    async def test_state_file_is_json(self, tmp_path, plan):
+        """Test that the state file stays plain JSON for other readers."""
+        project = make_project(tmp_path)
+        await project.create_plan(plan)
+        await project.flush()
+
+        data = json.loads((tmp_path / PROJECT_STATE_FILE).read_text())
+        assert data["goal"] == "Write a report"
+        assert [t["id"] for t in data["plan"]["tasks"]] == ["t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_large_state_is_compressed(self, tmp_path):
+        """Test that large plans are encoded off the event loop, stored gzipped and still load back."""
+        project = make_project(tmp_path)
+        await project.create_plan(Plan(tasks=[
+            Task(id=f"t{i}", action=f"Step {i} of a long plan") for i in range(2000)
+        ]))
+        with patch.object(project_module.asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread:
+            await project.flush()
+        to_thread.assert_called_once()
+
+        raw = (tmp_path / PROJECT_STATE_FILE).read_bytes()
+        assert raw[:2] == b"\x1f\x8b"
+
+        restored = make_project(tmp_path)
+        assert await restored.load_state()
+        assert len(restored.plan.tasks) == 2000
+
+    @pytest.mark.asyncio
+    async def test_updates_are_coalesced(self, tmp_path, plan):
+        """Test that a burst of updates is written once, after the debounce delay."""
+        project = make_project(tmp_path)
+        with patch.object(project.storage, "save_file", wraps=project.storage.save_file) as save_file:
+            await project.create_plan(plan)
+            await project.update_status("t1", "in_progress")
+            await project.update_status("t1", "completed")
+            assert save_file.call_count == 0
+
+            await asyncio.sleep(PERSIST_DELAY * 4)
+            assert save_file.call_count == 1
+
+        data = json.loads((tmp_path / PROJECT_STATE_FILE).read_text())
+        assert data["plan"]["tasks"][0]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_persist_writes_nothing(self, tmp_path, plan):
+        """Test that pending writes are dropped when cancelled."""
+        project = make_project(tmp_path)
+        await project.create_plan(plan)
+        project.cancel_pending_persist()
+
+        await asyncio.sleep(PERSIST_DELAY * 4)
+        await project.flush()
+        assert not (tmp_path / PROJECT_STATE_FILE).exists()
+
+
+    @pytest.mark.asyncio
+    async def test_failed_write_stays_pending(self, tmp_path, plan):
+        """Test that a failed background write is logged, keeps the state dirty and is retried by flush."""
+        project = make_project(tmp_path)
+        failure = StorageResult(success=False, error="disk full")
+        with patch.object(project.storage, "save_file", AsyncMock(return_value=failure)):
+            await project.create_plan(plan)
+            await asyncio.sleep(PERSIST_DELAY * 4)
+            assert project._persist_task.done() and project._persist_task.exception() is None
+            assert project._dirty
+
+            with pytest.raises(IOError):
+                await project.flush()
+
+        await project.flush()
+        assert not project._dirty
+        assert (tmp_path / PROJECT_STATE_FILE).exists()
+
+
+class TestProjectSummary:
+    """Test project progress reporting."""
+
+    @pytest.mark.asyncio
+    async def test_summary_counts_statuses(self, tmp_path, plan):
+        """Test that task counts and completion flags follow status changes."""
+        project = make_project(tmp_path)
+        await project.create_plan(plan)
+        await project.update_status("t1", "completed")
+        project.cancel_pending_persist()
+
+        assert project.get_summary()["tasks"] == {
+            "total": 2, "completed": 1, "running": 0, "pending": 1, "failed": 0,
+        }
+        assert project.get_summary()["progress_percentage"] == 50
+        assert [t.id for t in await project.get_parallel_tasks()] == ["t2"]
+
+        progress = project.plan.get_progress_summary()
+        assert progress["is_complete"] is False
+        assert progress["has_failures"] is False
+
+
+class TestReadJsonl:
+    """Test streaming replay of JSON Lines history files."""
+
+    @pytest.mark.asyncio
+    async def test_records_split_across_chunks(self, tmp_path, monkeypatch):
+        """Test that lines spanning chunk boundaries, blank lines and a missing final newline are handled."""
+        path = tmp_path / "messages.jsonl"
+        path.write_bytes(b'{"id": "m1", "text": "h\xc3\xa9llo"}\n\n{"id": "m2"}\n{"id": "m3"}')
+        monkeypatch.setattr(project_module, "_HISTORY_READ_CHUNK", 7)
+
+        records = [record async for record in project_module._read_jsonl(path)]
+
+        assert records == [{"id": "m1", "text": "héllo"}, {"id": "m2"}, {"id": "m3"}]
+
+
+class TestRunProject:
+    """Test the autonomous run loop."""
+
+    @pytest.mark.asyncio
+    async def test_stops_without_plan(self, tmp_path):
+        """Test that a project whose plan could not be created ends after one step."""
+        project = make_project(tmp_path)
+        project.x_agent = SimpleNamespace(step=AsyncMock(return_value="No plan available."))
+
+        with patch.object(project_module, "start_project", AsyncMock(return_value=project)):
+            messages = [m async for m in project_module.run_project("", ProjectConfig())]
+
+        assert [m.content for m in messages] == ["No plan available."]
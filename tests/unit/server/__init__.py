@@ -0,0 +1 @@
+# Server test package
@@ -0,0 +1,290 @@
+"""
+Unit tests for the VibeX REST API
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from vibex.server import service as service_module
+from vibex.server.api import create_app, _tail_lines
+from vibex.server.models import XAgentResponse
+from vibex.server.registry import FileRegistry
+from vibex.tool import executor as tool_executor
+from vibex.server.service import XAgentService, active_xagents
+from vibex.utils.paths import get_project_path
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Create a test client backed by a temporary base path"""
+    monkeypatch.setenv("VIBEX_BASE_PATH", str(tmp_path))
+    # Each client gets a service (and registry) rooted at its own base path
+    monkeypatch.setattr(service_module, "_xagent_service_instance", None)
+    # user_2 owns proj_2; user_1 owns every other project in these tests
+    owners = {"proj_2": "user_2"}
+    monkeypatch.setattr(
+        XAgentService, "verify_ownership",
+        AsyncMock(side_effect=lambda user_id, xagent_id: user_id == owners.get(xagent_id, "user_1")),
+    )
+    return TestClient(create_app())
+
+
+def test_logs_conditional_get(client):
+    """Test that unchanged logs are answered with 304"""
+    log_dir = get_project_path("proj_1") / "logs"
+    log_dir.mkdir(parents=True)
+    (log_dir / "project.log").write_text("first line\nsecond line\n")
+    headers = {"X-User-ID": "user_1"}
+
+    response = client.get("/xagents/proj_1/logs", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"logs": ["first line", "second line"]}
+    etag = response.headers["ETag"]
+
+    response = client.get("/xagents/proj_1/logs", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.head("/xagents/proj_1/logs", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
+def test_artifacts_conditional_get(client):
+    """Test that the artifact listing ETag changes when nested files change"""
+    artifacts_dir = get_project_path("proj_1") / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+    (artifacts_dir / "report.md").write_text("# Report")
+    headers = {"X-User-ID": "user_1"}
+
+    response = client.get("/xagents/proj_1/artifacts", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/xagents/proj_1/artifacts", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    (artifacts_dir / "report.md").write_text("# Report, revised")
+    (artifacts_dir / "docs").mkdir()
+    (artifacts_dir / "docs" / "new.md").write_text("new")
+    response = client.get("/xagents/proj_1/artifacts", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert {a["path"] for a in response.json()["artifacts"]} == {"report.md", "docs/new.md"}
+
+
+def test_artifact_path_traversal_rejected(client):
+    """Test that artifact paths cannot escape the artifacts directory"""
+    artifacts_dir = get_project_path("proj_1") / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+    (artifacts_dir / "report.md").write_text("# Report")
+    (artifacts_dir.parent / "secret.txt").write_text("secret")
+    (artifacts_dir / "link.txt").symlink_to(artifacts_dir.parent / "secret.txt")
+    headers = {"X-User-ID": "user_1"}
+
+    response = client.get("/xagents/proj_1/artifacts/report.md", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["content"] == "# Report"
+
+    response = client.get("/xagents/proj_1/artifacts/sub/%2E%2E/%2E%2E/secret.txt", headers=headers)
+    assert response.status_code == 403
+
+    response = client.get("/xagents/proj_1/artifacts/link.txt", headers=headers)
+    assert response.status_code == 403
+
+    # A symlinked parent directory must not let reads escape either
+    (artifacts_dir / "sub").symlink_to(artifacts_dir.parent)
+    response = client.get("/xagents/proj_1/artifacts/sub/secret.txt", headers=headers)
+    assert response.status_code == 403
+
+
+def test_foreign_xagent_is_not_found(client, monkeypatch):
+    """Test that XAgents owned by another user are reported as missing"""
+    monkeypatch.setitem(active_xagents, "proj_2", SimpleNamespace(project_id="proj_2", user_id="user_2"))
+
+    response = client.get("/xagents/proj_2", headers={"X-User-ID": "user_1"})
+    assert response.status_code == 404
+
+    response = client.get("/xagents/proj_2")
+    assert response.status_code == 401
+
+
+def test_project_resources_require_owner(client):
+    """Test that project resources are only served to the owning user"""
+    log_dir = get_project_path("proj_1") / "logs"
+    log_dir.mkdir(parents=True)
+    (log_dir / "project.log").write_text("line\n")
+
+    assert client.get("/xagents/proj_1/logs").status_code == 401
+    assert client.get("/xagents/proj_1/logs", headers={"X-User-ID": "user_2"}).status_code == 404
+    assert client.get("/xagents/proj_1/artifacts", headers={"X-User-ID": "user_2"}).status_code == 404
+    assert client.get("/xagents/proj_1/messages", headers={"X-User-ID": "user_2"}).status_code == 404
+    assert client.delete("/xagents/proj_1", headers={"X-User-ID": "user_2"}).status_code == 404
+    assert client.get("/xagents/proj_1/logs", headers={"X-User-ID": "user_1"}).status_code == 200
+
+
+def test_tail_lines_reads_across_blocks(tmp_path):
+    """Test that the reverse log reader returns the last non-empty lines"""
+    log_file = tmp_path / "project.log"
+    log_file.write_text("".join(f"line {i}\n\n" for i in range(1000)))
+
+    assert _tail_lines(log_file, 3, block_size=16) == ["line 997", "line 998", "line 999"]
+    assert _tail_lines(log_file, 5000) == [f"line {i}" for i in range(1000)]
+
+
+def test_list_artifacts_skips_git(client):
+    """Test that artifact listing walks subdirectories but skips .git"""
+    artifacts_dir = get_project_path("proj_1") / "artifacts"
+    (artifacts_dir / "docs").mkdir(parents=True)
+    (artifacts_dir / ".git" / "objects").mkdir(parents=True)
+    (artifacts_dir / "report.md").write_text("# Report")
+    (artifacts_dir / "docs" / "notes.txt").write_text("notes")
+    (artifacts_dir / ".git" / "objects" / "abc").write_text("blob")
+
+    response = client.get("/xagents/proj_1/artifacts", headers={"X-User-ID": "user_1"})
+    assert response.status_code == 200
+    artifacts = {a["path"]: a["size"] for a in response.json()["artifacts"]}
+    assert artifacts == {"report.md": 8, "docs/notes.txt": 5}
+
+
+def test_list_artifacts_ignores_symlink_loops(client):
+    """Test that a symlink back up the tree neither loops the walk nor fails the listing"""
+    artifacts_dir = get_project_path("proj_1") / "artifacts"
+    (artifacts_dir / "sub").mkdir(parents=True)
+    (artifacts_dir / "sub" / "notes.txt").write_text("notes")
+    (artifacts_dir / "sub" / "loop").symlink_to("..")
+
+    response = client.get("/xagents/proj_1/artifacts", headers={"X-User-ID": "user_1"})
+    assert response.status_code == 200
+    assert [a["path"] for a in response.json()["artifacts"]] == ["sub/notes.txt"]
+
+
+def test_get_xagent_reads_persisted_state(client, monkeypatch, tmp_path):
+    """Test that XAgent details come from project.json without resuming the XAgent"""
+    registry = FileRegistry(tmp_path / "users")
+    asyncio.run(registry.add_project("user_1", "proj_3"))
+    project_path = get_project_path("proj_3")
+    project_path.mkdir(parents=True)
+    (project_path / "project.json").write_text(json.dumps({
+        "project_id": "proj_3",
+        "name": "Docs site",
+        "goal": "Build a docs site",
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T11:00:00",
+        "plan": {"tasks": [{"id": "t1", "status": "completed"}, {"id": "t2", "status": "running"}]},
+    }))
+    resume = AsyncMock()
+    monkeypatch.setattr(XAgentService, "get", resume)
+
+    response = client.get("/xagents/proj_3", headers={"X-User-ID": "user_1"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "running"
+    assert body["goal"] == "Build a docs site"
+    assert body["name"] == "Docs site"
+    resume.assert_not_called()
+
+    response = client.get("/xagents/missing", headers={"X-User-ID": "user_1"})
+    assert response.status_code == 404
+
+    # Registered to someone else, or not registered at all, looks the same as missing
+    response = client.get("/xagents/proj_3", headers={"X-User-ID": "user_2"})
+    assert response.status_code == 404
+    get_project_path("proj_5").mkdir(parents=True)
+    (get_project_path("proj_5") / "project.json").write_text("{}")
+    response = client.get("/xagents/proj_5", headers={"X-User-ID": "user_1"})
+    assert response.status_code == 404
+
+
+def test_create_xagent_serializes_dto(client, monkeypatch):
+    """Test that a created XAgent is returned as the DTO's JSON"""
+    monkeypatch.setattr(XAgentService, "create", AsyncMock(return_value=SimpleNamespace()))
+    monkeypatch.setattr(XAgentService, "to_response", AsyncMock(return_value=XAgentResponse(
+        xagent_id="proj_1", goal="Write docs", created_at="2025-01-01T10:00:00Z",
+    )))
+
+    response = client.post(
+        "/xagents", json={"config_path": "team.yaml", "goal": "Write docs"}, headers={"X-User-ID": "user_1"}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["xagent_id"] == "proj_1"
+    assert body["status"] == "pending"
+    assert body["created_at"] == "2025-01-01T10:00:00Z"
+
+
+def test_health_body_is_cached(client):
+    """Test that health probes within a second share the same body"""
+    first = client.get("/health")
+    second = client.get("/health")
+
+    assert first.status_code == 200
+    assert first.json()["status"] == "healthy"
+    assert first.content == second.content
+
+
+def test_artifact_content_formats(client):
+    """Test raw and JSON-wrapped artifact downloads"""
+    artifacts_dir = get_project_path("proj_1") / "artifacts"
+    artifacts_dir.mkdir(parents=True)
+    content = "naïve \"quoted\" text\n" * 10000
+    (artifacts_dir / "notes.txt").write_text(content, encoding="utf-8")
+    (artifacts_dir / "blob.bin").write_bytes(b"ok\xff")
+    headers = {"X-User-ID": "user_1"}
+
+    response = client.get("/xagents/proj_1/artifacts/notes.txt", headers=headers)
+    assert response.json() == {"artifact_path": "notes.txt", "content": content}
+
+    response = client.get("/xagents/proj_1/artifacts/blob.bin", headers=headers)
+    assert response.json()["content"] == "ok\ufffd"
+
+    response = client.get("/xagents/proj_1/artifacts/notes.txt", headers={**headers, "Accept": "text/plain"})
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == content
+
+
+def test_lifespan_shares_http_client(tmp_path, monkeypatch):
+    """Test that the app installs one pooled HTTP client for LLM calls while running"""
+    import litellm
+
+    monkeypatch.setenv("VIBEX_BASE_PATH", str(tmp_path))
+    app = create_app()
+    with TestClient(app):
+        assert litellm.aclient_session is app.state.http_client
+        assert not app.state.http_client.is_closed
+    assert litellm.aclient_session is None
+    assert app.state.http_client.is_closed
+    assert tool_executor._tool_thread_pool is None
+
+
+def test_lifespan_closes_registry(tmp_path, monkeypatch):
+    """Test that the SQLite registry connection is closed when the app shuts down"""
+    monkeypatch.setenv("VIBEX_BASE_PATH", str(tmp_path))
+    monkeypatch.setenv("VIBEX_REGISTRY_BACKEND", "sqlite")
+    monkeypatch.setattr(service_module, "_xagent_service_instance", None)
+    app = create_app()
+    registry = service_module.get_xagent_service().registry
+    with TestClient(app) as client:
+        client.get("/xagents", headers={"X-User-ID": "user_1"})
+        assert registry._db is not None
+    assert registry._db is None
+
+
+def test_lifespan_flushes_project_state(tmp_path, monkeypatch):
+    """Test that shutdown writes pending project state, even if one project fails to save"""
+    monkeypatch.setenv("VIBEX_BASE_PATH", str(tmp_path))
+    monkeypatch.setattr(service_module, "_xagent_service_instance", None)
+    saved = SimpleNamespace(project_id="proj_1", flush=AsyncMock())
+    broken = SimpleNamespace(project_id="proj_3", flush=AsyncMock(side_effect=IOError("disk full")))
+    monkeypatch.setitem(active_xagents, "proj_1", SimpleNamespace(project=saved))
+    monkeypatch.setitem(active_xagents, "proj_3", SimpleNamespace(project=broken))
+
+    with TestClient(create_app()):
+        saved.flush.assert_not_awaited()
+    saved.flush.assert_awaited_once()
+    broken.flush.assert_awaited_once()
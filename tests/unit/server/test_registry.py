@@ -0,0 +1,163 @@
+"""
+Unit tests for user-project registries
+"""
+
+import json
+
+import pytest
+
+from vibex.server.registry import FileRegistry, SQLiteRegistry
+
+
+@pytest.mark.asyncio
+async def test_sqlite_registry_roundtrip(tmp_path):
+    """Test adding, querying and removing projects in the SQLite registry"""
+    registry = SQLiteRegistry(tmp_path / "registry.db", tmp_path / "users")
+    try:
+        await registry.add_project("user_1", "proj_1", "config/team.yaml")
+        await registry.add_project("user_1", "proj_2")
+        await registry.add_project("user_2", "proj_3")
+
+        assert await registry.get_user_projects("user_1") == ["proj_1", "proj_2"]
+        assert await registry.user_owns_project("user_1", "proj_1")
+        assert not await registry.user_owns_project("user_2", "proj_1")
+        assert await registry.get_project_owner("proj_3") == "user_2"
+
+        info = await registry.get_project_info("proj_1")
+        assert info.user_id == "user_1"
+        assert info.config_path == "config/team.yaml"
+
+        await registry.remove_project("user_1", "proj_1")
+        assert await registry.get_user_projects("user_1") == ["proj_2"]
+        assert await registry.get_project_info("proj_1") is None
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_file_registry_roundtrip(tmp_path):
+    """Test that the file registry persists a JSON snapshot plus a change log and reads both back"""
+    registry = FileRegistry(tmp_path / "users")
+    await registry.add_project("user_1", "proj_1", "config/team.yaml")
+    await registry.add_project("user_1", "proj_2")
+
+    data = json.loads((tmp_path / "users" / "user_1.json").read_text())
+    assert [p["project_id"] for p in data["projects"]] == ["proj_1"]
+    log = (tmp_path / "users" / "user_1.log").read_text().splitlines()
+    assert [json.loads(line)["project"]["project_id"] for line in log] == ["proj_2"]
+
+    assert await registry.get_user_projects("user_1") == ["proj_1", "proj_2"]
+    assert await registry.get_project_owner("proj_2") == "user_1"
+    info = await registry.get_project_info("proj_1")
+    assert info.config_path == "config/team.yaml"
+
+    await registry.remove_project("user_1", "proj_1")
+    assert await registry.get_user_projects("user_1") == ["proj_2"]
+
+
+@pytest.mark.asyncio
+async def test_file_registry_caches_user_files(tmp_path):
+    """Test that lookups reuse parsed user files until another writer changes them"""
+    registry = FileRegistry(tmp_path / "users")
+    await registry.add_project("user_1", "proj_1")
+    assert await registry.get_project_owner("proj_1") == "user_1"
+
+    reads = 0
+    read_json = registry.storage.read_json
+
+    async def counting_read_json(path):
+        nonlocal reads
+        reads += 1
+        return await read_json(path)
+
+    registry.storage.read_json = counting_read_json
+    assert await registry.get_project_owner("proj_1") == "user_1"
+    assert await registry.user_owns_project("user_1", "proj_1")
+    assert reads == 0
+
+    # Another process hands the project to a new user
+    other = FileRegistry(tmp_path / "users")
+    await other.remove_project("user_1", "proj_1")
+    await other.add_project("user_2", "proj_1")
+
+    assert await registry.get_project_owner("proj_1") == "user_2"
+    assert not await registry.user_owns_project("user_1", "proj_1")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_registry_imports_file_registry(tmp_path):
+    """Test that a new SQLite registry takes over projects from existing user files once"""
+    file_registry = FileRegistry(tmp_path / "users")
+    await file_registry.add_project("user_1", "proj_1", "config/team.yaml")
+    await file_registry.add_project("user_1", "proj_3")
+    await file_registry.add_project("user_2", "proj_2")
+
+    registry = SQLiteRegistry(tmp_path / "registry.db", tmp_path / "users")
+    try:
+        assert await registry.get_project_owner("proj_2") == "user_2"
+        assert await registry.get_user_projects("user_1") == ["proj_1", "proj_3"]
+        info = await registry.get_project_info("proj_1")
+        assert info.user_id == "user_1"
+        assert info.config_path == "config/team.yaml"
+        await registry.remove_project("user_2", "proj_2")
+    finally:
+        await registry.close()
+
+    # The import does not run again, so removals made in SQLite stick
+    registry = SQLiteRegistry(tmp_path / "registry.db", tmp_path / "users")
+    try:
+        assert await registry.get_project_owner("proj_2") is None
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_file_registry_compacts_log(tmp_path):
+    """Test that the change log is folded into the snapshot once it outgrows it"""
+    users = tmp_path / "users"
+    registry = FileRegistry(users)
+    await registry.add_project("user_1", "proj_1")
+    await registry.add_project("user_1", "proj_2")
+    await registry.add_project("user_1", "proj_3")
+    assert len((users / "user_1.log").read_text().splitlines()) == 2
+
+    await registry.remove_project("user_1", "proj_2")
+    assert not (users / "user_1.log").exists()
+    data = json.loads((users / "user_1.json").read_text())
+    assert [p["project_id"] for p in data["projects"]] == ["proj_1", "proj_3"]
+
+    await registry.add_project("user_1", "proj_4")
+    await registry.remove_project("user_1", "proj_1")
+    fresh = FileRegistry(users)
+    assert await fresh.get_user_projects("user_1") == ["proj_3", "proj_4"]
+    assert len((users / "user_1.log").read_text().splitlines()) == 2
+    assert await fresh.get_project_owner("proj_1") is None
+
+
+@pytest.mark.asyncio
+async def test_add_projects_in_bulk(tmp_path):
+    """Test that bulk registration writes once and skips projects already registered"""
+    registry = FileRegistry(tmp_path / "users")
+    await registry.add_project("user_1", "proj_1")
+
+    writes = 0
+    append_text = registry.storage.append_text
+
+    async def counting_append_text(path, content):
+        nonlocal writes
+        writes += 1
+        return await append_text(path, content)
+
+    registry.storage.append_text = counting_append_text
+    await registry.add_projects("user_1", [("proj_1", None), ("proj_2", "team.yaml"), ("proj_3", None)])
+
+    assert writes == 1
+    assert await FileRegistry(tmp_path / "users").get_user_projects("user_1") == ["proj_1", "proj_2", "proj_3"]
+    assert (await registry.get_project_info("proj_2")).config_path == "team.yaml"
+
+    sqlite = SQLiteRegistry(tmp_path / "registry.db", tmp_path / "other_users")
+    try:
+        await sqlite.add_projects("user_1", [("proj_1", None), ("proj_2", "team.yaml")])
+        assert await sqlite.get_user_projects("user_1") == ["proj_1", "proj_2"]
+    finally:
+        await sqlite.close()
@@ -0,0 +1,60 @@
+"""
+Unit tests for the XAgent task runner
+"""
+
+import asyncio
+
+import pytest
+
+from vibex.server.runner import TaskRunner
+
+
+@pytest.mark.asyncio
+async def test_runner_bounds_concurrency():
+    """Test that no more than max_parallel runs execute at once"""
+    runner = TaskRunner(max_parallel=2)
+    active = 0
+    peak = 0
+
+    async def work():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "done"
+
+    results = await asyncio.gather(*(runner.run("proj_1", work()) for _ in range(5)))
+    assert results == ["done"] * 5
+    assert peak == 2
+    assert runner.running("proj_1") == 0
+
+
+@pytest.mark.asyncio
+async def test_run_survives_caller_cancellation():
+    """Test that cancelling the waiting caller doesn't cancel the work"""
+    runner = TaskRunner()
+    finished = asyncio.Event()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        finished.set()
+
+    caller = asyncio.create_task(runner.run("proj_1", work()))
+    await asyncio.sleep(0)
+    caller.cancel()
+
+    await asyncio.wait_for(finished.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_runs():
+    """Test that cancel stops in-flight and queued runs for an XAgent"""
+    runner = TaskRunner(max_parallel=1)
+    first = runner.submit("proj_1", asyncio.sleep(10))
+    queued = runner.submit("proj_1", asyncio.sleep(10))
+    await asyncio.sleep(0)
+
+    assert await runner.cancel("proj_1") == 2
+    assert first.cancelled() and queued.cancelled()
+    assert runner.running("proj_1") == 0
@@ -0,0 +1,70 @@
+"""
+Unit tests for the XAgent service layer
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from vibex.server.service import XAgentService
+from vibex.utils.paths import get_project_path
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """Create a service backed by a temporary base path and a mocked registry"""
+    monkeypatch.setenv("VIBEX_BASE_PATH", str(tmp_path))
+    service = XAgentService()
+    service.registry = AsyncMock()
+    service.registry.get_user_projects.return_value = ["proj_1"]
+    service.registry.get_project_info.return_value = None
+    return service
+
+
+@pytest.mark.asyncio
+async def test_list_is_cached_until_invalidated(service):
+    """Test that repeated list calls are served from the cache until a delete"""
+    (get_project_path("proj_1") / "artifacts").mkdir(parents=True)
+
+    first = await service.list("user_1")
+    second = await service.list("user_1")
+    assert [p.project_id for p in first] == [p.project_id for p in second] == ["proj_1"]
+    assert service.registry.get_user_projects.await_count == 1
+
+    await service.delete("proj_1", "user_1")
+    assert await service.list("user_1") == []
+    assert service.registry.get_user_projects.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_derives_status_from_directory(service):
+    """Test that project status comes from error.log and artifacts, and missing projects are dropped"""
+    service.registry.get_user_projects.return_value = ["proj_1", "proj_2", "proj_3", "gone"]
+    (get_project_path("proj_1") / "artifacts").mkdir(parents=True)
+    (get_project_path("proj_2") / "artifacts").mkdir(parents=True)
+    (get_project_path("proj_2") / "artifacts" / "report.md").write_text("# Report")
+    get_project_path("proj_3").mkdir(parents=True)
+    (get_project_path("proj_3") / "error.log").write_text("boom")
+
+    projects = await service.list("user_1")
+
+    assert {p.project_id: p.status for p in projects} == {
+        "proj_1": "active",
+        "proj_2": "completed",
+        "proj_3": "failed",
+    }
+    service.registry.remove_project.assert_awaited_once_with("user_1", "gone")
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_project_in_background(service, tmp_path):
+    """Test that delete renames the project away at once and removes it in the background"""
+    (get_project_path("proj_1") / "artifacts").mkdir(parents=True)
+    (get_project_path("proj_1") / "artifacts" / "report.md").write_text("# Report")
+
+    await service.delete("proj_1", "user_1")
+    assert not get_project_path("proj_1").exists()
+
+    await asyncio.gather(*service._cleanup_tasks)
+    assert list((tmp_path / ".trash").iterdir()) == []
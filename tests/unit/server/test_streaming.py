@@ -0,0 +1,112 @@
+"""
+Unit tests for the SSE event stream manager
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from vibex.server.streaming import KEEPALIVE_FRAME, ProjectEventStream
+
+
+def parse_frame(frame: bytes) -> dict:
+    """Parse a single SSE frame into its fields"""
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+@pytest.mark.asyncio
+async def test_events_are_serialized_once_by_producer():
+    """Test that events reach the consumer already JSON-encoded"""
+    manager = ProjectEventStream()
+    await manager.send_event("proj_1", "task_update", {"status": "running"})
+
+    stream = manager.stream_events("proj_1")
+    frame = await stream.__anext__()
+    await stream.aclose()
+
+    event = parse_frame(frame)
+    assert event["event"] == "task_update"
+    assert event["data"] == {"status": "running"}
+    assert event["id"] == "1"
+    assert frame is manager.get_stream("proj_1").buffer[0][1]
+
+
+@pytest.mark.asyncio
+async def test_events_fan_out_to_all_subscribers():
+    """Test that every subscriber receives every event"""
+    manager = ProjectEventStream()
+    first = manager.stream_events("proj_1")
+    second = manager.stream_events("proj_1")
+    pending = [asyncio.ensure_future(first.__anext__()), asyncio.ensure_future(second.__anext__())]
+    await asyncio.sleep(0)
+
+    await manager.send_event("proj_1", "task_update", {"status": "running"})
+    events = await asyncio.gather(*pending)
+    await first.aclose()
+    await second.aclose()
+
+    assert events[0] is events[1]
+    assert parse_frame(events[0])["event"] == "task_update"
+
+
+@pytest.mark.asyncio
+async def test_replay_after_last_event_id():
+    """Test that reconnecting clients resume after their last seen event"""
+    manager = ProjectEventStream()
+    for i in range(3):
+        await manager.send_event("proj_1", "tick", {"i": i})
+    stream = manager.stream_events("proj_1", last_event_id="1")
+    replayed = [await stream.__anext__(), await stream.__anext__()]
+    await stream.aclose()
+
+    assert [parse_frame(frame)["data"]["i"] for frame in replayed] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_emits_keepalive():
+    """Test that an idle stream yields a keepalive comment"""
+    manager = ProjectEventStream(keepalive_interval=0.01)
+
+    stream = manager.stream_events("proj_1")
+    frame = await stream.__anext__()
+    await stream.aclose()
+
+    assert frame == KEEPALIVE_FRAME
+
+
+@pytest.mark.asyncio
+async def test_replay_is_bounded_by_buffer():
+    """Test that replay only returns events still held in the ring buffer"""
+    manager = ProjectEventStream(buffer_size=2)
+    for i in range(5):
+        await manager.send_event("proj_1", "tick", {"i": i})
+    channel = manager.get_stream("proj_1")
+
+    assert [seq for seq, _ in channel.events_after(1)] == [4, 5]
+    assert [seq for seq, _ in channel.events_after(4)] == [5]
+    assert channel.events_after(5) == []
+    assert channel.seq_for_event_id("9") is None
+
+
+@pytest.mark.asyncio
+async def test_idle_channels_are_evicted():
+    """Test that unsubscribed channels are dropped once idle past the TTL"""
+    manager = ProjectEventStream(idle_ttl=60)
+    await manager.send_event("proj_1", "tick", {1: "non-string key"})
+    stream = manager.stream_events("proj_2")
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    # Age both channels past the TTL; only the one without subscribers goes
+    for channel in manager.streams.values():
+        channel.last_active -= 61
+    manager._next_sweep = 0
+    manager.create_stream("proj_3")
+    assert set(manager.streams) == {"proj_2", "proj_3"}
+
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
@@ -0,0 +1,77 @@
+"""
+Unit tests for chat history storage
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+from vibex.core.message import Message
+from vibex.storage import chat_history
+from vibex.storage.chat_history import ChatHistoryStorage
+
+
+@pytest.mark.asyncio
+async def test_read_records_pages_through_history(tmp_path):
+    """Test that records can be read one page at a time via the offset index"""
+    storage = ChatHistoryStorage(str(tmp_path))
+    for i in range(5):
+        await storage.save_message("proj_1", Message.user_message(f"message {i}"))
+
+    assert [r["content"] for r in storage.read_records()] == [f"message {i}" for i in range(5)]
+    assert [r["content"] for r in storage.read_records(since=1, limit=2)] == ["message 1", "message 2"]
+    assert [r["content"] for r in storage.read_records(since=4, limit=10)] == ["message 4"]
+    assert storage.read_records(since=5) == []
+
+
+@pytest.mark.asyncio
+async def test_read_records_indexes_existing_history(tmp_path):
+    """Test that a history written without an index is indexed on first read"""
+    storage = ChatHistoryStorage(str(tmp_path))
+    for i in range(3):
+        await storage.save_message("proj_1", Message.user_message(f"message {i}"))
+    storage.index_file.unlink()
+
+    await storage.save_message("proj_1", Message.user_message("message 3"))
+
+    assert [r["content"] for r in storage.read_records(since=2)] == ["message 2", "message 3"]
+    assert storage.index_file.stat().st_size == 4 * 8
+
+
+@pytest.mark.asyncio
+async def test_read_records_rebuilds_stale_index(tmp_path):
+    """Test that empty, misaligned or lagging indexes are rebuilt rather than trusted"""
+    storage = ChatHistoryStorage(str(tmp_path))
+    for i in range(3):
+        await storage.save_message("proj_1", Message.user_message(f"message {i}"))
+    expected = [f"message {i}" for i in range(3)]
+
+    storage.index_file.write_bytes(b"")
+    assert [r["content"] for r in storage.read_records()] == expected
+
+    storage.index_file.write_bytes(storage.index_file.read_bytes()[:-8] + (5).to_bytes(8, "little"))
+    assert [r["content"] for r in storage.read_records()] == expected
+
+    storage.index_file.write_bytes(storage.index_file.read_bytes()[:8])
+    assert [r["content"] for r in storage.read_records()] == expected
+    assert storage.index_file.stat().st_size == 3 * 8
+
+
+@pytest.mark.asyncio
+async def test_history_locks_are_shared_then_released(tmp_path):
+    """Test that storages for one file share a lock, which is dropped once they are gone"""
+    first = ChatHistoryStorage(str(tmp_path))
+    second = ChatHistoryStorage(str(tmp_path))
+    assert first._lock is second._lock
+
+    await asyncio.gather(*(
+        storage.save_message("proj_1", Message.user_message(f"message {i}"))
+        for i, storage in enumerate([first, second] * 5)
+    ))
+    assert len(first.read_records()) == 10
+
+    history_file = first.history_file
+    del first, second
+    gc.collect()
+    assert history_file not in chat_history._history_locks
@@ -15,6 +15,7 @@ from unittest.mock import Mock, AsyncMock
 
 import pytest
 
+from vibex.storage import factory as factory_module
 from vibex.storage.factory import ProjectStorageFactory
 from vibex.storage.project import ProjectStorage
 from vibex.storage.providers.cache.memory import MemoryCacheProvider
@@ -46,6 +47,38 @@ class TestProjectStorageFactory:
         assert isinstance(noop_cache, NoOpCacheProvider) 
         assert isinstance(none_cache, NoOpCacheProvider)
     
+    def test_factory_creates_redis_provider_on_first_request(self):
+        """The Redis provider should be built once, when first requested."""
+        ProjectStorageFactory._ensure_initialized()
+        assert "redis" in ProjectStorageFactory._cache_provider_factories
+        
+        redis_cache = ProjectStorageFactory.get_cache_provider("redis")
+        
+        assert isinstance(redis_cache, CacheBackend)
+        assert ProjectStorageFactory.get_cache_provider("redis") is redis_cache
+    
+    def test_factory_cache_provider_factories_are_built_once(self, monkeypatch):
+        """Factory-registered cache providers should be built lazily and reused."""
+        # Keep the registration and built instances local to this test
+        monkeypatch.setattr(factory_module, "_built_cache_providers", factory_module.OrderedDict())
+        redis_cache = ProjectStorageFactory.get_cache_provider("redis")
+        
+        factory = Mock(side_effect=lambda: Mock(spec=CacheBackend))
+        monkeypatch.setitem(ProjectStorageFactory._cache_provider_factories, "tenant_a", factory)
+        ProjectStorageFactory.register_cache_provider_factory("tenant_a", factory)
+        factory.assert_not_called()
+        
+        first = ProjectStorageFactory.get_cache_provider("tenant_a")
+        second = ProjectStorageFactory.get_cache_provider("tenant_a")
+        
+        assert first is second
+        factory.assert_called_once()
+        
+        # Re-registering a name rebuilds only that provider
+        ProjectStorageFactory.register_cache_provider_factory("tenant_a", factory)
+        assert ProjectStorageFactory.get_cache_provider("tenant_a") is not first
+        assert ProjectStorageFactory.get_cache_provider("redis") is redis_cache
+    
     def test_factory_create_project_storage_new_api(self):
         """create_project_storage should use new API properly."""
         project_storage = ProjectStorageFactory.create_project_storage(
@@ -386,4 +419,20 @@ class TestNoOpCache:
         # List artifacts
         artifacts = await self.project_storage.list_artifacts()
         assert len(artifacts) >= 1
-        assert any(a["name"] == "test.txt" for a in artifacts)
\ No newline at end of file
+        assert any(a["name"] == "test.txt" for a in artifacts)
+
+
+class TestMemoryCacheExpiry:
+    """Test forcing TTL expiry on the memory cache."""
+    
+    @pytest.mark.asyncio
+    async def test_expire_now_drops_only_ttl_entries(self):
+        """expire_now should evict TTL entries and keep permanent ones."""
+        cache = MemoryCacheProvider()
+        await cache.set("plan", {"goal": "x"}, ttl=5)
+        await cache.set("config", "kept")
+        
+        await cache.expire_now()
+        
+        assert await cache.get("plan") is None
+        assert await cache.get("config") == "kept"
@@ -0,0 +1,275 @@
+"""
+Test tool executor batch execution and result formatting.
+"""
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from vibex.builtin_tools.search import SearchTool
+from vibex.core.tool import ToolFunction, tool
+from vibex.tool.executor import ToolExecutor, safe_json_serialize, shutdown_tool_threads
+from vibex.tool.registry import ToolRegistry
+
+
+@tool(description="Echo a message back")
+async def echo(message: str) -> dict:
+    return {"message": message, "at": datetime(2025, 1, 1, 12, 0)}
+
+
+def make_call(call_id: str, name: str, arguments: str):
+    """Build a tool call shaped like an LLM response entry."""
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+@pytest.fixture
+def executor():
+    """Create an executor with only the echo tool registered."""
+    registry = ToolRegistry()
+    registry.register_function(echo)
+    return ToolExecutor(registry=registry)
+
+
+class TestExecuteTools:
+    """Test batch tool execution."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_serialized_for_llm(self, executor):
+        """Test that results, including non-JSON types, are serialized and keep call order."""
+        messages = await executor.execute_tools([
+            make_call("call_1", "echo", '{"message": "héllo"}'),
+            make_call("call_2", "echo", "{not json"),
+        ])
+
+        assert [m["tool_call_id"] for m in messages] == ["call_1", "call_2"]
+        first = json.loads(messages[0]["content"])
+        assert first["success"] is True
+        assert first["result"] == {"message": "héllo", "at": "2025-01-01T12:00:00"}
+        assert "héllo" in messages[0]["content"]
+
+        second = json.loads(messages[1]["content"])
+        assert second["success"] is False
+        assert "Invalid tool arguments" in second["error"]
+
+
+    @pytest.mark.asyncio
+    async def test_arguments_accept_bytes_and_dicts(self, executor):
+        """Test that raw byte payloads and pre-parsed arguments are both accepted."""
+        messages = await executor.execute_tools([
+            make_call("call_1", "echo", '{"message": "naïve"}'.encode()),
+            make_call("call_2", "echo", {"message": "parsed"}),
+        ])
+
+        assert [json.loads(m["content"])["result"]["message"] for m in messages] == ["naïve", "parsed"]
+
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_up_to_limit(self):
+        """Test that parallel-safe calls run concurrently, bounded by the concurrency limit."""
+        running = 0
+        peak = 0
+
+        @tool(description="Sleep briefly", parallel_safe=True)
+        async def nap(label: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return label
+
+        registry = ToolRegistry()
+        registry.register_function(nap)
+        executor = ToolExecutor(registry=registry)
+        calls = [make_call(f"call_{i}", "nap", json.dumps({"label": str(i)})) for i in range(8)]
+
+        messages = await executor.execute_tools(calls)
+
+        assert [json.loads(m["content"])["result"] for m in messages] == [str(i) for i in range(8)]
+        assert peak == executor.security_policy.MAX_CONCURRENT_EXECUTIONS
+
+
+    @pytest.mark.asyncio
+    async def test_dependent_calls_run_in_order(self):
+        """Test that calls not marked parallel-safe run one after another in emitted order."""
+        store = {}
+        events = []
+
+        @tool(description="Store a value")
+        async def write(key: str, value: str) -> str:
+            events.append(f"write {key} start")
+            await asyncio.sleep(0.02)
+            store[key] = value
+            events.append(f"write {key} end")
+            return value
+
+        @tool(description="Read a value", parallel_safe=True)
+        async def read(key: str) -> str:
+            events.append(f"read {key}")
+            return store.get(key, "")
+
+        registry = ToolRegistry()
+        registry.register_function(write)
+        registry.register_function(read)
+        executor = ToolExecutor(registry=registry)
+
+        messages = await executor.execute_tools([
+            make_call("call_1", "write", '{"key": "a", "value": "1"}'),
+            make_call("call_2", "read", '{"key": "a"}'),
+            make_call("call_3", "write", '{"key": "a", "value": "2"}'),
+            make_call("call_4", "read", '{"key": "a"}'),
+        ])
+
+        assert [json.loads(m["content"])["result"] for m in messages] == ["1", "1", "2", "2"]
+        assert events == ["write a start", "write a end", "read a", "write a start", "write a end", "read a"]
+
+
+    @pytest.mark.asyncio
+    async def test_search_calls_overlap(self):
+        """Test that adjacent web searches in one batch run concurrently."""
+        running = 0
+        peak = 0
+
+        async def search(query, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return SimpleNamespace(success=True, results=[], total_results=0, error=None)
+
+        search_tool = SearchTool(api_key="test-key")
+        search_tool._backend = SimpleNamespace(search=search)
+        registry = ToolRegistry()
+        registry.register_tool(search_tool)
+        executor = ToolExecutor(registry=registry)
+
+        messages = await executor.execute_tools([
+            make_call("call_1", "search_web", '{"queries": "first"}'),
+            make_call("call_2", "search_web", '{"queries": "second"}'),
+        ])
+
+        assert [json.loads(m["content"])["success"] for m in messages] == [True, True]
+        assert peak == 2
+
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_is_rejected(self, executor):
+        """Test that every call in a batch over the limit gets the same error without running."""
+        limit = executor.security_policy.MAX_TOOLS_PER_BATCH
+        calls = [make_call(f"call_{i}", "echo", '{"message": "hi"}') for i in range(limit + 1)]
+
+        messages = await executor.execute_tools(calls)
+
+        assert [m["tool_call_id"] for m in messages] == [f"call_{i}" for i in range(limit + 1)]
+        assert len({m["content"] for m in messages}) == 1
+        error = json.loads(messages[0]["content"])
+        assert error["success"] is False
+        assert "Too many tool calls" in error["error"]
+        assert not executor.execution_history
+
+
+class TestExecuteTool:
+    """Test single tool execution."""
+
+    @pytest.mark.asyncio
+    async def test_sync_and_async_tools(self, executor):
+        """Test that coroutine detection is resolved at registration and both kinds run."""
+        @tool(description="Add two numbers")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        executor.registry.register_function(add)
+        assert executor.registry.get_tool_function("echo").is_coroutine is True
+        assert executor.registry.get_tool_function("add").is_coroutine is False
+
+        assert (await executor.execute_tool("add", a=2, b=3)).result == 5
+        assert (await executor.execute_tool("echo", message="hi")).result["message"] == "hi"
+
+
+    @pytest.mark.asyncio
+    async def test_coroutine_flag_derived_from_function(self, executor):
+        """Test that a ToolFunction built outside the registry still awaits async tools."""
+        tool_function = ToolFunction(name="echo", description="Echo", parameters={}, function=echo)
+        assert tool_function.is_coroutine is True
+
+        result = await executor._execute_with_timeout(tool_function, {"message": "hi"}, 5)
+        assert result["message"] == "hi"
+
+
+    @pytest.mark.asyncio
+    async def test_sync_tools_run_on_dedicated_threads(self, executor):
+        """Test that sync tools run on the shared tool thread pool."""
+        @tool(description="Report the current thread")
+        def whoami() -> str:
+            return threading.current_thread().name
+
+        executor.registry.register_function(whoami)
+        result = await executor.execute_tool("whoami")
+        shutdown_tool_threads()
+
+        assert result.result.startswith("tool-exec")
+
+
+class TestExecutionStats:
+    """Test execution history and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, executor):
+        """Test that the audit trail keeps only the most recent executions."""
+        for i in range(1005):
+            await executor.execute_tool("echo", message=str(i))
+
+        stats = executor.get_execution_stats()
+        assert len(executor.execution_history) == 1000
+        assert stats["total_executions"] == 1000
+        assert [e["arguments"]["message"] for e in stats["recent_executions"]] == [str(i) for i in range(995, 1005)]
+
+
+    @pytest.mark.asyncio
+    async def test_success_count_tracks_evictions(self, executor):
+        """Test that the success count reflects only the executions still in history."""
+        await executor.execute_tool("echo", message="ok")
+        for i in range(1000):
+            await executor.execute_tool("echo", missing_argument=str(i))
+
+        stats = executor.get_execution_stats()
+        assert stats["successful_executions"] == sum(1 for e in executor.execution_history if e.success)
+        assert stats["successful_executions"] == 0
+
+        executor.clear_history()
+        await executor.execute_tool("echo", message="ok")
+        assert executor.get_execution_stats()["successful_executions"] == 1
+
+
+class TestSafeJsonSerialize:
+    """Test conversion of tool results to JSON-compatible values."""
+
+    def test_nested_values(self):
+        """Test that models, dataclasses and plain objects are converted inside containers."""
+        class Page(BaseModel):
+            url: str
+
+        @dataclass
+        class Hit:
+            score: float
+
+        result = safe_json_serialize({
+            "pages": (Page(url="https://example.com"),),
+            "hits": [Hit(score=0.5)],
+            "other": SimpleNamespace(name="x"),
+            "count": 2,
+        })
+
+        assert result == {
+            "pages": [{"url": "https://example.com"}],
+            "hits": [{"score": 0.5}],
+            "other": {"name": "x"},
+            "count": 2,
+        }
+